@@ -0,0 +1,103 @@
+"""
+Compare plain grid A* (src.maps.pathfinding) with the HPA* cluster graph
+(src.maps.hierarchical) on synthetic 512x512 maps.
+
+    python benchmarks/hpa_benchmark.py [--size 512] [--queries 50] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.maps.hierarchical import ClusterGraph
+from src.maps.pathfinding import PathSearch
+
+def scattered_map(size: int, rng: random.Random, density: float = 0.25) -> bytearray:
+    """Open field with randomly blocked tiles."""
+    return bytearray(0 if rng.random() < density else 1 for _ in range(size * size))
+
+def rooms_map(size: int, rng: random.Random, room: int = 24) -> bytearray:
+    """Grid of rooms separated by walls with a few doorways, plus some clutter."""
+    grid = bytearray(1 if rng.random() > 0.1 else 0 for _ in range(size * size))
+    for wall in range(room, size, room):
+        for i in range(size):
+            grid[wall * size + i] = 0
+            grid[i * size + wall] = 0
+        for start in range(0, size, room):
+            for _ in range(2):
+                door = start + rng.randrange(1, room - 3)
+                for d in range(rng.randrange(1, 4)):
+                    if door + d < size:
+                        grid[wall * size + door + d] = 1
+                        grid[(door + d) * size + wall] = 1
+    return grid
+
+def random_queries(grid: bytearray, size: int, count: int, rng: random.Random) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    free = [i for i, walkable in enumerate(grid) if walkable]
+    queries = []
+    while len(queries) < count:
+        a, b = rng.choice(free), rng.choice(free)
+        start, goal = (a % size, a // size), (b % size, b // size)
+        # Only long-range searches are interesting here
+        if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) >= size // 2:
+            queries.append((start, goal))
+    return queries
+
+def run(name: str, grid: bytearray, size: int, queries: list, cluster_size: int) -> None:
+    t0 = time.perf_counter()
+    clusters = ClusterGraph(grid, size, size, cluster_size)
+    build = time.perf_counter() - t0
+
+    astar_time = hpa_time = 0.0
+    astar_nodes = hpa_nodes = 0
+    astar_len = hpa_len = 0
+    solved = missed = 0
+    for start, goal in queries:
+        t0 = time.perf_counter()
+        search = PathSearch(grid, size, size, start, goal)
+        search.step()
+        astar_time += time.perf_counter() - t0
+        astar_nodes += search.expanded
+
+        t0 = time.perf_counter()
+        path = clusters.find_path(start, goal)
+        hpa_time += time.perf_counter() - t0
+        hpa_nodes += clusters.last_expanded
+
+        if search.path and path:
+            solved += 1
+            astar_len += len(search.path)
+            hpa_len += len(path)
+        elif search.path:
+            missed += 1
+
+    n = len(queries)
+    print(f"{name}: {size}x{size}, {cluster_size}x{cluster_size} clusters, {len(clusters)} abstract nodes, "
+          f"built in {build * 1000:.0f} ms")
+    print(f"  A*   {astar_time / n * 1000:8.2f} ms/query  {astar_nodes / n:9.0f} nodes/query")
+    print(f"  HPA* {hpa_time / n * 1000:8.2f} ms/query  {hpa_nodes / n:9.0f} nodes/query  "
+          f"({astar_time / max(hpa_time, 1e-9):.1f}x faster)")
+    if solved:
+        print(f"  path length +{(hpa_len / astar_len - 1) * 100:.1f}% over optimal on {solved} paths, "
+              f"{missed} paths missed")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--cluster", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for name, make in (("scattered", scattered_map), ("rooms", rooms_map)):
+        rng = random.Random(args.seed)
+        grid = make(args.size, rng)
+        run(name, grid, args.size, random_queries(grid, args.size, args.queries, rng), args.cluster)
+
+if __name__ == "__main__":
+    main()
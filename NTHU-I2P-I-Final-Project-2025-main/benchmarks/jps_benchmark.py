@@ -0,0 +1,80 @@
+"""
+Compare plain A* with jump point search (src.maps.pathfinding) on the
+game's own maps and on synthetic outdoor maps: nodes expanded, time per
+query, and a check that both return paths of the same length.
+
+    python benchmarks/jps_benchmark.py [--queries 200] [--size 256] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.maps.pathfinding import SEARCH_MODES
+
+GAME_MAPS = ["map.tmx", "gym.tmx", "new_map.tmx", "mountain_map.tmx"]
+
+def outdoor_map(size: int, rng: random.Random) -> bytearray:
+    """Open field with rectangular buildings and a few scattered trees."""
+    grid = bytearray(1 if rng.random() > 0.03 else 0 for _ in range(size * size))
+    for _ in range(size * size // 400):
+        bw, bh = rng.randrange(3, 10), rng.randrange(3, 8)
+        bx, by = rng.randrange(size - bw), rng.randrange(size - bh)
+        for y in range(by, by + bh):
+            grid[y * size + bx:y * size + bx + bw] = bytes(bw)
+    return grid
+
+def game_map(name: str) -> tuple[bytearray, int, int]:
+    from src.maps.map import Map
+    from src.utils import Position
+    m = Map(name, [], Position(0, 0))
+    return m.walkable_grid, m.width, m.height
+
+def run(name: str, grid: bytearray, width: int, height: int, count: int, rng: random.Random) -> None:
+    free = [i for i, walkable in enumerate(grid) if walkable]
+    queries = [((a % width, a // width), (b % width, b // width))
+               for a, b in ((rng.choice(free), rng.choice(free)) for _ in range(count))]
+    results = {}
+    for mode, search_class in SEARCH_MODES.items():
+        nodes = 0
+        lengths = []
+        t0 = time.perf_counter()
+        for start, goal in queries:
+            search = search_class(grid, width, height, start, goal)
+            search.step()
+            nodes += search.expanded
+            lengths.append(len(search.path))
+        results[mode] = (time.perf_counter() - t0, nodes, lengths)
+
+    base_time, base_nodes, base_lengths = results["astar"]
+    print(f"{name} ({width}x{height}, {count} queries)")
+    for mode, (elapsed, nodes, lengths) in results.items():
+        same = sum(a == b for a, b in zip(lengths, base_lengths))
+        print(f"  {mode:6} {elapsed / count * 1000:8.3f} ms/query  {nodes / count:9.1f} nodes/query  "
+              f"x{base_nodes / max(nodes, 1):5.1f} fewer nodes  x{base_time / elapsed:4.1f} faster  "
+              f"{same}/{count} equal lengths")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    rng = random.Random(args.seed)
+    for name in GAME_MAPS:
+        run(name, *game_map(name), args.queries, rng)
+    size = args.size
+    run("outdoor", outdoor_map(size, rng), size, size, max(1, args.queries // 10), rng)
+
+if __name__ == "__main__":
+    main()
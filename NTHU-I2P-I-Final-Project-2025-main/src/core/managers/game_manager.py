@@ -2,10 +2,14 @@ from __future__ import annotations
 from src.utils import Logger, GameSettings, Position, Teleport, Direction
 import json, os
 import pygame as pg
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.maps.map import Map
+    from src.maps.lazy_map import LazyMap
+    from src.maps.route_planner import RoutePlanner
+    from src.maps.spatial_hash import SpatialHash
     from src.entities.player import Player
     from src.entities.enemy_trainer import EnemyTrainer
     from src.data.bag import Bag
@@ -19,24 +23,38 @@ class GameManager:
     
     # Map properties
     current_map_key: str
-    maps: dict[str, Map]
+    maps: dict[str, LazyMap]
+    route_planner: RoutePlanner
     
     # Changing Scene properties
     should_change_scene: bool
     next_map: str
     
-    def __init__(self, maps: dict[str, Map], start_map: str, 
+    def __init__(self, maps: dict[str, LazyMap], start_map: str, 
                  player: Player | None,
                  enemy_trainers: dict[str, list[EnemyTrainer]], 
                  bag: Bag | None = None):
                      
         from src.data.bag import Bag
+        from src.maps.route_planner import RoutePlanner
         # Game Properties
         self.maps = maps
         self.current_map_key = start_map
+        # Loaded maps, least recently used first; see _resident_map
+        self._resident_maps: OrderedDict[str, None] = OrderedDict()
+        # Cross-map navigation over the teleporters of these maps
+        self.route_planner = RoutePlanner(maps, self._resident_map)
         self.player = player
         self.enemy_trainers = enemy_trainers
         self.shop_npcs = {}  # Initialize shop NPCs dictionary
+        # Per-map spatial index of trainers, their LOS rects and NPCs; see spatial_index
+        self._spatial: dict[str, SpatialHash] = {}
+        # Map key -> (entity lists the index was built from, their lengths, widest NPC range in tiles)
+        self._spatial_sources: dict[str, tuple[int, int, int, int, int]] = {}
+        # (map key, player rect) -> trainers whose LOS the player stands in
+        self._los_cache: tuple[tuple, set] | None = None
+        # (map key, player position) -> NPCs in range of the player; see npcs_near_player
+        self._npcs_near_cache: tuple[tuple, set] | None = None
         self.bag = bag if bag is not None else Bag([], [])
         # Runtime control flag: when True, player input (WASD/arrows) is ignored
         # Used by scenes to disable movement while chatting or during auto-navigation
@@ -52,7 +70,21 @@ class GameManager:
         
     @property
     def current_map(self) -> Map:
-        return self.maps[self.current_map_key]
+        return self._resident_map(self.current_map_key)
+
+    def _resident_map(self, key: str) -> Map:
+        """Return the loaded map for key, loading it (and evicting idle maps) if needed."""
+        from src.maps.map_prefetcher import map_prefetcher
+        lazy_map = self.maps[key]
+        if key not in self._resident_maps:
+            # An eviction may have cancelled a prefetch of this map that is still running
+            map_prefetcher.claim(key)
+        self._resident_maps[key] = None
+        self._resident_maps.move_to_end(key)
+        if not lazy_map.loaded:
+            lazy_map.load()
+            self._evict_maps(key)
+        return lazy_map.load()
         
     @property
     def current_enemy_trainers(self) -> list[EnemyTrainer]:
@@ -66,6 +98,46 @@ class GameManager:
     def current_teleporter(self) -> list[Teleport]:
         return self.maps[self.current_map_key].teleporters
     
+    def _prefetch_neighbours(self) -> None:
+        """Load the current map's teleporter destinations in the background."""
+        from src.maps.map_prefetcher import map_prefetcher
+        landings: dict[str, Position] = {}
+        teleporters = list(self.maps[self.current_map_key].teleporters)
+        if self.player is not None:
+            # With more destinations than the residency limit allows, the
+            # ones closest to the player are the likeliest next switch
+            px, py = self.player.position.x, self.player.position.y
+            teleporters.sort(key=lambda tp: abs(tp.pos.x - px) + abs(tp.pos.y - py))
+        for tp in teleporters:
+            if tp.destination in landings or tp.destination not in self.maps:
+                continue
+            if tp.target_x is not None and tp.target_y is not None:
+                landings[tp.destination] = Position(tp.target_x * GameSettings.TILE_SIZE,
+                                                    tp.target_y * GameSettings.TILE_SIZE)
+            else:
+                landings[tp.destination] = self.maps[tp.destination].spawn
+        # Only prefetch what fits next to the current map in the residency limit
+        for key in list(landings)[:max(0, GameSettings.MAX_RESIDENT_MAPS - 1)]:
+            self._resident_maps[key] = None
+            self._resident_maps.move_to_end(key)
+            map_prefetcher.request(self.maps[key], landings[key])
+        self._resident_maps[self.current_map_key] = None
+        self._resident_maps.move_to_end(self.current_map_key)
+        self._evict_maps()
+
+    def _evict_maps(self, *keep: str) -> None:
+        # Keep at most MAX_RESIDENT_MAPS maps loaded; never evict the current
+        # map or the one we are about to switch to
+        from src.maps.map_prefetcher import map_prefetcher
+        keep_keys = {*keep, self.current_map_key, self.next_map}
+        for old_key in list(self._resident_maps):
+            if len(self._resident_maps) <= GameSettings.MAX_RESIDENT_MAPS:
+                break
+            if old_key not in keep_keys:
+                del self._resident_maps[old_key]
+                map_prefetcher.cancel(old_key)
+                self.maps[old_key].unload()
+
     def switch_map(self, target: str, target_x: int | None = None, target_y: int | None = None) -> None:
         if target not in self.maps:
             Logger.warning(f"Map '{target}' not loaded; cannot switch.")
@@ -75,6 +147,11 @@ class GameManager:
         self.next_map_target_x = target_x
         self.next_map_target_y = target_y
         self.should_change_scene = True
+        # Load the destination now (normally already done by the prefetcher)
+        # so the switch itself is instant
+        from src.maps.map_prefetcher import map_prefetcher
+        map_prefetcher.record_switch(self.maps[target])
+        self._resident_map(target)
             
     def try_switch_map(self) -> None:
         if self.should_change_scene:
@@ -101,15 +178,116 @@ class GameManager:
                         self.player.animation.switch("up")
                 except Exception:
                     pass
+            self._prefetch_neighbours()
             
+    def spatial_index(self, map_key: str | None = None) -> SpatialHash:
+        """Spatial index of one map's trainers ("trainer"), their LOS rects ("los") and NPCs ("npc")."""
+        from src.maps.spatial_hash import SpatialHash
+        key = map_key if map_key is not None else self.current_map_key
+        trainers = self.enemy_trainers.get(key, [])
+        npcs = self.shop_npcs.get(key, [])
+        sources = self._spatial_sources.get(key)
+        index = self._spatial.get(key)
+        # Rebuild when the entity lists were replaced or changed size (e.g. after loading a save)
+        if index is None or sources is None or sources[:4] != (id(trainers), len(trainers), id(npcs), len(npcs)):
+            index = SpatialHash(GameSettings.SPATIAL_CELL_TILES * GameSettings.TILE_SIZE)
+            for trainer in trainers:
+                index.insert(trainer, trainer.animation.rect, "trainer")
+                los = trainer.los_rect
+                if los is not None:
+                    index.insert((trainer, "los"), los, "los")
+            for npc in npcs:
+                index.insert(npc, npc.animation.rect, "npc")
+            max_range = max((npc.interaction_range for npc in npcs), default=0)
+            self._spatial[key] = index
+            self._spatial_sources[key] = (id(trainers), len(trainers), id(npcs), len(npcs), max_range)
+            self._los_cache = None
+            self._npcs_near_cache = None
+        return index
+
+    def entity_moved(self, entity) -> None:
+        """Bring a trainer's or NPC's spatial index entries up to date after it moved or turned."""
+        for index in self._spatial.values():
+            if entity not in index:
+                continue
+            index.move(entity, entity.animation.rect)
+            self._npcs_near_cache = None
+            los = getattr(entity, "los_rect", None)
+            if los is not None:
+                if index.rect_of((entity, "los")) != los:
+                    index.insert((entity, "los"), los, "los")
+                    self._los_cache = None
+            elif (entity, "los") in index:
+                index.remove((entity, "los"))
+                self._los_cache = None
+            return
+
+    def trainers_seeing_player(self) -> set:
+        """Trainers on the current map whose line of sight the player's hitbox is in."""
+        if self.player is None:
+            return set()
+        rect = self.player.animation.rect
+        key = (self.current_map_key, rect.x, rect.y, rect.w, rect.h)
+        index = self.spatial_index()
+        if self._los_cache is None or self._los_cache[0] != key:
+            self._los_cache = (key, {los_key[0] for los_key in index.query_rect(rect, "los")})
+        return self._los_cache[1]
+
+    def npcs_near_player(self) -> set:
+        """
+        NPCs on the current map within their interaction range of the player.
+        Worked out once per player position, so every NPC updating in the same
+        frame only tests membership.
+        """
+        if self.player is None:
+            return set()
+        index = self.spatial_index()
+        pos = self.player.position
+        key = (self.current_map_key, pos.x, pos.y)
+        if self._npcs_near_cache is None or self._npcs_near_cache[0] != key:
+            max_range = self._spatial_sources[self.current_map_key][4]
+            # Ranges are Manhattan distances between positions, which the Euclidean
+            # radius around the player always covers; in_range makes the exact check
+            candidates = index.query_radius(pos.x, pos.y, (max_range + 1) * GameSettings.TILE_SIZE, "npc")
+            self._npcs_near_cache = (key, {npc for npc in candidates if npc.in_range(pos)})
+        return self._npcs_near_cache[1]
+
     def check_collision(self, rect: pg.Rect) -> bool:
-        if self.maps[self.current_map_key].check_collision(rect):
+        if self.current_map.check_collision(rect):
+            return True
+        if self.spatial_index().query_rect(rect, "trainer"):
             return True
-        for entity in self.enemy_trainers[self.current_map_key]:
-            if rect.colliderect(entity.animation.rect):
-                return True
         
         return False
+
+    def sweep_x(self, rect: pg.Rect, dx: float) -> float:
+        """How far rect can move along x, up to dx, before touching the map or a trainer."""
+        dx = self.current_map.sweep_x(rect, dx)
+        # Only trainers in the strip the rect sweeps through can stop it
+        reach = int(abs(dx)) + 1
+        strip = pg.Rect(rect.right if dx > 0 else rect.left - reach, rect.top, reach, rect.h)
+        for entity in self.spatial_index().query_rect(strip, "trainer"):
+            other = entity.animation.rect
+            if other.top < rect.bottom and rect.top < other.bottom:
+                if dx > 0 and other.left >= rect.right:
+                    dx = min(dx, other.left - rect.right)
+                elif dx < 0 and other.right <= rect.left:
+                    dx = max(dx, other.right - rect.left)
+        return dx
+
+    def sweep_y(self, rect: pg.Rect, dy: float) -> float:
+        """How far rect can move along y, up to dy, before touching the map or a trainer."""
+        dy = self.current_map.sweep_y(rect, dy)
+        reach = int(abs(dy)) + 1
+        strip = pg.Rect(rect.left, rect.bottom if dy > 0 else rect.top - reach, rect.w, reach)
+        for entity in self.spatial_index().query_rect(strip, "trainer"):
+            other = entity.animation.rect
+            if other.left < rect.right and rect.left < other.right:
+                if dy > 0 and other.top >= rect.bottom:
+                    dy = min(dy, other.top - rect.bottom)
+                elif dy < 0 and other.bottom <= rect.top:
+                    dy = max(dy, other.bottom - rect.top)
+        return dy
         
     def save(self, path: str) -> None:
         try:
@@ -158,20 +336,21 @@ class GameManager:
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "GameManager":
-        from src.maps.map import Map
+        from src.maps.lazy_map import LazyMap
         from src.entities.player import Player
         from src.entities.enemy_trainer import EnemyTrainer
         from src.data.bag import Bag
         
+        # Maps are only parsed when first used through current_map or switch_map
         Logger.info("Loading maps")
         maps_data = data["map"]
-        maps: dict[str, Map] = {}
+        maps: dict[str, LazyMap] = {}
         player_spawns: dict[str, Position] = {}
         trainers: dict[str, list[EnemyTrainer]] = {}
 
         for entry in maps_data:
             path = entry["path"]
-            maps[path] = Map.from_dict(entry)
+            maps[path] = LazyMap.from_dict(entry)
             sp = entry.get("player")
             if sp:
                 player_spawns[path] = Position(
@@ -208,4 +387,6 @@ class GameManager:
         from src.data.bag import Bag as _Bag
         gm.bag = Bag.from_dict(data.get("bag", {})) if data.get("bag") else _Bag([], [])
 
+        gm._prefetch_neighbours()
+
         return gm
\ No newline at end of file
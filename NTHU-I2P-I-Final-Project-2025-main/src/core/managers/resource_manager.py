@@ -1,34 +1,231 @@
 import pygame as pg
-from src.utils import load_img, load_font, load_sound
+from collections import OrderedDict
+from src.utils import load_img, load_font, load_sound, GameSettings, Logger, AssetBundle, asset_manifest
+
+# (image path, size in pixels, smoothscale instead of scale)
+ScaledKey = tuple[str, tuple[int, int], bool]
+# ("image", path), ("scaled", path, size, smooth) or ("sound", path)
+CacheKey = tuple
 
 class ResourceManager:
     """
     Make sure you are not loading the resource twice
     If the resource is already loaded, you can use the loaded image instead of loading it again.
+    Scaled variants of images are kept too (least recently used dropped first),
+    so drawing code can ask for the size it needs every frame without rescaling.
+    Images missing from the asset manifest are remembered and raise
+    FileNotFoundError without touching the disk.
+    Images, scaled variants and sounds are accounted by their size in bytes;
+    once they exceed the memory budget the least recently used are evicted,
+    except those whose path is pinned (see pin). Fonts are small and kept.
     """
+    budget_bytes: int
+    resident_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    missing_hits: int
+    scaled_hits: int
+    scaled_misses: int
+    scaled_evictions: int
+
     def __init__(self) -> None:
         self._images: dict[str, pg.Surface] = {}
+        self._scaled: dict[ScaledKey, pg.Surface] = {}
+        # Image paths known not to load
+        self._missing_images: set[str] = set()
         self._sounds: dict[str, pg.mixer.Sound] = {}
         self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        # Every evictable entry, least recently used first, with its size in bytes
+        self._lru: OrderedDict[CacheKey, int] = OrderedDict()
+        # Asset path -> number of holders that need it resident
+        self._pins: dict[str, int] = {}
+        self.budget_bytes = GameSettings.RESOURCE_BUDGET_MB * 1024 * 1024
+        self.max_scaled = GameSettings.SCALED_IMAGE_CACHE_SIZE
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.missing_hits = 0
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+        self.scaled_evictions = 0
 
-    def get_image(self, path: str) -> pg.Surface:
-        if path not in self._images:
-            self._images[path] = load_img(path)
-        return self._images[path]
+    def get_image(self, path: str, size: tuple[int, int] | None = None, smooth: bool = False) -> pg.Surface:
+        """
+        The image at path, or a variant scaled to size (smooth: smoothscale
+        rather than scale). Callers share the returned surface, so they must
+        not draw on it.
+        """
+        if path in self._images:
+            self.hits += 1
+            self._lru.move_to_end(("image", path))
+        else:
+            if not self.has_image(path):
+                self.missing_hits += 1
+                raise FileNotFoundError(f"Image not found: {path}")
+            self.misses += 1
+            try:
+                image = load_img(path)
+            except FileNotFoundError:
+                # Deleted since the manifest was built
+                self._missing_images.add(path)
+                raise
+            self._images[path] = image
+            self._track(("image", path), self._surface_bytes(image))
+        image = self._images[path]
+        if size is None:
+            return image
+        size = (max(0, int(size[0])), max(0, int(size[1])))
+        if size == image.get_size():
+            return image
+        key = (path, size, smooth)
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            self.scaled_hits += 1
+            self._lru.move_to_end(("scaled", *key))
+            return scaled
+        self.scaled_misses += 1
+        scaled = pg.transform.smoothscale(image, size) if smooth else pg.transform.scale(image, size)
+        if self.max_scaled > 0:
+            while len(self._scaled) >= self.max_scaled and self._evict_one(kind="scaled"):
+                self.scaled_evictions += 1
+            self._scaled[key] = scaled
+            self._track(("scaled", *key), self._surface_bytes(scaled))
+        return scaled
+
+    def has_image(self, path: str) -> bool:
+        """Whether get_image(path) can succeed, answered without filesystem access."""
+        if path in self._images:
+            return True
+        if path in self._missing_images:
+            return False
+        if not asset_manifest.exists("images", path):
+            self._missing_images.add(path)
+            return False
+        return True
 
     def get_sound(self, path: str) -> pg.mixer.Sound:
-        if path not in self._sounds:
-            self._sounds[path] = load_sound(path)
+        if path in self._sounds:
+            self.hits += 1
+            self._lru.move_to_end(("sound", path))
+        else:
+            self.misses += 1
+            sound = load_sound(path)
+            self._sounds[path] = sound
+            self._track(("sound", path), self._sound_bytes(sound))
         return self._sounds[path]
 
     def get_font(self, path: str, size: int) -> pg.font.Font:
         key = (path, size)
         if key not in self._fonts:
+            self.misses += 1
             self._fonts[key] = load_font(path, size)
+        else:
+            self.hits += 1
         return self._fonts[key]
 
+    def pin(self, path: str) -> None:
+        """Keep the image (and its scaled variants) or sound at path resident until a matching unpin."""
+        self._pins[path] = self._pins.get(path, 0) + 1
+
+    def unpin(self, path: str) -> None:
+        count = self._pins.get(path, 0) - 1
+        if count > 0:
+            self._pins[path] = count
+        else:
+            self._pins.pop(path, None)
+            # It may have been kept over budget only because it was pinned
+            self._enforce_budget()
+
+    def acquire(self, bundle: AssetBundle) -> None:
+        """Pin every asset of bundle and load it now, so the scene using it starts without loading."""
+        for path in bundle.paths():
+            self.pin(path)
+        for path in bundle.images:
+            self._preload(path)
+        for path, size in bundle.scaled:
+            self._preload(path, size)
+        for path in bundle.sounds:
+            try:
+                self.get_sound(path)
+            except Exception as e:
+                Logger.warning(f"Failed to preload sound {path}: {e}")
+
+    def release(self, bundle: AssetBundle) -> None:
+        """
+        Undo acquire(bundle). Assets no other holder pins stay cached as plain
+        LRU entries: scenes are kept alive and still hold their surfaces, so
+        dropping them would only load them again next time. The budget evicts
+        them once memory is needed.
+        """
+        for path in bundle.paths():
+            self.unpin(path)
+
+    def is_pinned(self, path: str) -> bool:
+        return path in self._pins
+
+    def is_cached(self, path: str) -> bool:
+        """Whether the image or sound at path is currently resident."""
+        return path in self._images or path in self._sounds
+
     def clear(self) -> None:
         """Clear all cached assets (useful when switching levels)."""
         self._images.clear()
+        self._scaled.clear()
+        self._missing_images.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._lru.clear()
+        self.resident_bytes = 0
+
+    def _preload(self, path: str, size: tuple[int, int] | None = None) -> None:
+        try:
+            self.get_image(path, size)
+        except Exception as e:
+            Logger.warning(f"Failed to preload image {path}: {e}")
+
+    def _track(self, key: CacheKey, size: int) -> None:
+        self._lru[key] = size
+        self.resident_bytes += size
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        while self.resident_bytes > self.budget_bytes:
+            if not self._evict_one():
+                # Everything left is pinned (or just loaded); stay over budget until an unpin
+                break
+
+    def _evict_one(self, kind: str | None = None) -> bool:
+        # Drop the least recently used unpinned entry (of one kind, if given);
+        # the most recent entry is the one being handed out, so it is kept
+        last = next(reversed(self._lru), None)
+        for key in self._lru:
+            if key == last:
+                break
+            if key[1] in self._pins or (kind is not None and key[0] != kind):
+                continue
+            self._drop(key)
+            self.evictions += 1
+            return True
+        return False
+
+    def _drop(self, key: CacheKey) -> None:
+        self.resident_bytes -= self._lru.pop(key)
+        kind, path = key[0], key[1]
+        if kind == "image":
+            del self._images[path]
+        elif kind == "scaled":
+            del self._scaled[key[1:]]
+        else:
+            del self._sounds[path]
+
+    @staticmethod
+    def _surface_bytes(surface: pg.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def _sound_bytes(sound: pg.mixer.Sound) -> int:
+        # Sounds are stored decoded in the mixer's format
+        freq, fmt, channels = pg.mixer.get_init() or (44100, -16, 2)
+        return int(sound.get_length() * freq) * channels * (abs(fmt) // 8)
@@ -39,10 +39,16 @@ class SceneManager:
     def _perform_scene_switch(self) -> None:
         if self._next_scene is None:
             return
+        from src.core.services import resource_manager
+
+        previous = self._current_scene
+        # Load the new scene's assets before the old ones are released, so
+        # assets both scenes use stay resident across the switch
+        resource_manager.acquire(self._scenes[self._next_scene].ASSETS)
             
         # Exit current scene
-        if self._current_scene:
-            self._current_scene.exit()
+        if previous:
+            previous.exit()
         
         self._current_scene = self._scenes[self._next_scene]
         
@@ -50,6 +56,9 @@ class SceneManager:
         if self._current_scene:
             Logger.info(f"Entering {self._next_scene} scene")
             self._current_scene.enter()
+
+        if previous:
+            resource_manager.release(previous.ASSETS)
             
         # Clear the transition request
         self._next_scene = None
@@ -1,16 +1,24 @@
 import pygame as pg
-from src.utils import load_sound, GameSettings
+from src.utils import GameSettings
 
 class SoundManager:
     def __init__(self):
         pg.mixer.init()
         pg.mixer.set_num_channels(GameSettings.MAX_CHANNELS)
         self.current_bgm = None
+        self.current_bgm_path: str | None = None
         
     def play_bgm(self, filepath: str):
+        from src.core.services import resource_manager
         if self.current_bgm:
             self.current_bgm.stop()
-        audio = load_sound(filepath)
+        # Decoded tracks are large: cache them under the resource budget and
+        # pin the playing one so it is never evicted mid-play
+        audio = resource_manager.get_sound(filepath)
+        resource_manager.pin(filepath)
+        if self.current_bgm_path is not None:
+            resource_manager.unpin(self.current_bgm_path)
+        self.current_bgm_path = filepath
         audio.set_volume(GameSettings.AUDIO_VOLUME)
         # Only play if not muted
         if GameSettings.MUTED:
@@ -30,10 +38,15 @@ class SoundManager:
         # Only play sound if not muted
         if GameSettings.MUTED:
             return
-        sound = load_sound(filepath)
+        from src.core.services import resource_manager
+        sound = resource_manager.get_sound(filepath)
         sound.set_volume(volume)
         sound.play()
 
     def stop_all_sounds(self):
         pg.mixer.stop()
-        self.current_bgm = None
\ No newline at end of file
+        self.current_bgm = None
+        if self.current_bgm_path is not None:
+            from src.core.services import resource_manager
+            resource_manager.unpin(self.current_bgm_path)
+            self.current_bgm_path = None
\ No newline at end of file
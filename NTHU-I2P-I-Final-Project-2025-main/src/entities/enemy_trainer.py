@@ -52,12 +52,18 @@ class EnemyTrainer(Entity):
         self.warning_sign = Sprite("exclamation.png", (GameSettings.TILE_SIZE // 2, GameSettings.TILE_SIZE // 2))
         self.warning_sign.update_pos(Position(x + GameSettings.TILE_SIZE // 4, y - GameSettings.TILE_SIZE // 2))
         self.detected = False
+        # LOS rect and the (position, direction, range) it was built for
+        self._los_rect: pygame.Rect | None = None
+        self._los_key: tuple | None = None
         # default element for trainer's leading monster
         self.element = "Fire"
 
     @override
     def update(self, dt: float) -> None:
         self._movement.update(self, dt)
+        self.animation.update_pos(self.position)
+        # Keep the map's spatial index (hitbox and LOS) in step before checking LOS against it
+        self.game_manager.entity_moved(self)
         self._has_los_to_player()
         if self.detected and input_manager.key_pressed(pygame.K_SPACE):
             # Start a battle: store the target on the scene_manager and switch to battle scene
@@ -68,7 +74,6 @@ class EnemyTrainer(Entity):
                 scene_manager.change_scene("battle")
             except Exception:
                 pass
-        self.animation.update_pos(self.position)
 
     @override
     def draw(self, screen: pygame.Surface, camera: PositionCamera) -> None:
@@ -76,7 +81,7 @@ class EnemyTrainer(Entity):
         if self.detected:
             self.warning_sign.draw(screen, camera)
         if GameSettings.DRAW_HITBOXES:
-            los_rect = self._get_los_rect()
+            los_rect = self.los_rect
             if los_rect is not None:
                 pygame.draw.rect(screen, (255, 255, 0), camera.transform_rect(los_rect), 1)
 
@@ -92,6 +97,15 @@ class EnemyTrainer(Entity):
             self.animation.switch("up")
         self.los_direction = self.direction
 
+    @property
+    def los_rect(self) -> pygame.Rect | None:
+        """LOS rect in the facing direction, rebuilt only when position, facing or range change."""
+        key = (int(self.position.x), int(self.position.y), self.los_direction, self.max_tiles)
+        if key != self._los_key:
+            self._los_rect = self._get_los_rect()
+            self._los_key = key
+        return self._los_rect
+
     def _get_los_rect(self) -> pygame.Rect | None:
         # Create a simple rectangular LOS in the facing direction with length = max_tiles
         if self.max_tiles is None:
@@ -114,14 +128,13 @@ class EnemyTrainer(Entity):
         if player is None:
             self.detected = False
             return
-        los_rect = self._get_los_rect()
-        if los_rect is None:
+        if self.los_rect is None:
             self.detected = False
             return
-        # Simple LOS: check if player's hitbox intersects LOS rect
+        # Simple LOS: the player's hitbox intersects the LOS rect. The map's
+        # spatial index answers that for every trainer at once
         try:
-            player_rect = player.animation.rect
-            if player_rect.colliderect(los_rect):
+            if self in self.game_manager.trainers_seeing_player():
                 self.detected = True
                 # update warning sign position above head
                 self.warning_sign.update_pos(Position(self.position.x + GameSettings.TILE_SIZE // 4, self.position.y - GameSettings.TILE_SIZE // 2))
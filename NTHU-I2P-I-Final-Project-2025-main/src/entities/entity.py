@@ -52,9 +52,9 @@ class Entity:
 
         # Clamp camera to map bounds if game_manager and map are available
         try:
-            tmx = self.game_manager.current_map.tmxdata
-            map_pixel_w = tmx.width * GameSettings.TILE_SIZE
-            map_pixel_h = tmx.height * GameSettings.TILE_SIZE
+            current_map = self.game_manager.current_map
+            map_pixel_w = current_map.width * GameSettings.TILE_SIZE
+            map_pixel_h = current_map.height * GameSettings.TILE_SIZE
             max_x = max(0, map_pixel_w - GameSettings.SCREEN_WIDTH)
             max_y = max(0, map_pixel_h - GameSettings.SCREEN_HEIGHT)
             if cam_x < 0:
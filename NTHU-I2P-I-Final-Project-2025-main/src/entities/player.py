@@ -90,23 +90,19 @@ class Player(Entity):
                 dx = nx * self.speed * dt
                 dy = ny * self.speed * dt
 
-        # Move X then Y separately and check collisions
+        # Move X then Y separately, each swept against the collision grid so the
+        # player stops flush against a wall however long the frame was
+        self.animation.update_pos(self.position)
         if dx != 0.0:
-            self.position.x += dx
-            # update animation rect for collision check
+            allowed = self.game_manager.sweep_x(self.animation.rect, dx)
+            # Cut short: stand exactly at the contact point
+            self.position.x = self.position.x + dx if allowed == dx else self.animation.rect.x + allowed
             self.animation.update_pos(self.position)
-            if self.game_manager.check_collision(self.animation.rect):
-                # revert X movement on collision
-                self.position.x -= dx
-                self.animation.update_pos(self.position)
 
         if dy != 0.0:
-            self.position.y += dy
+            allowed = self.game_manager.sweep_y(self.animation.rect, dy)
+            self.position.y = self.position.y + dy if allowed == dy else self.animation.rect.y + allowed
             self.animation.update_pos(self.position)
-            if self.game_manager.check_collision(self.animation.rect):
-                # revert Y movement on collision
-                self.position.y -= dy
-                self.animation.update_pos(self.position)
 
         # Update teleport cooldown
         if self._teleport_cooldown > 0:
@@ -51,8 +51,11 @@ class ShopNPC(Entity):
         """Check if player is within interaction range"""
         if self.game_manager.player is None:
             return False
-        
-        player_pos = self.game_manager.player.position
+        # GameManager works the nearby NPCs out once per frame for all of them
+        return self in self.game_manager.npcs_near_player()
+
+    def in_range(self, player_pos: Position) -> bool:
+        """Check if a player at player_pos would be within interaction range"""
         npc_pos = self.position
         
         # Calculate tile distance
@@ -85,7 +85,8 @@ class Button(UIComponent):
             new_h = int(h * 0.95)
             if new_w <= 0: new_w = 1
             if new_h <= 0: new_h = 1
-            pressed_surf = pg.transform.smoothscale(img, (new_w, new_h))
+            from src.core.services import resource_manager
+            pressed_surf = resource_manager.get_image(self.img_button.path, (new_w, new_h), smooth=True)
             dx = (w - new_w) // 2
             dy = (h - new_h) // 2
             screen.blit(pressed_surf, (self.hitbox.x + dx, self.hitbox.y + dy))
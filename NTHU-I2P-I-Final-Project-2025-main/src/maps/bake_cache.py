@@ -0,0 +1,128 @@
+import base64
+import hashlib
+import json
+import zlib
+from array import array
+import xml.etree.ElementTree as ET
+import pygame as pg
+from pathlib import Path
+
+from src.utils import GameSettings, Logger
+from src.utils.loader import ASSETS_DIR
+
+# Bump whenever the layout of the cached files or the baking itself changes
+CACHE_FORMAT = 4
+
+def pack_grid(grid: bytearray | array) -> str:
+    """Encode a per-tile grid (bytearray or array) for meta.json."""
+    return base64.b64encode(zlib.compress(bytes(grid), 1)).decode("ascii")
+
+def unpack_grid(data: str) -> bytearray:
+    return bytearray(zlib.decompress(base64.b64decode(data)))
+
+def unpack_array(data: str, typecode: str = "H") -> array:
+    values = array(typecode)
+    values.frombytes(zlib.decompress(base64.b64decode(data)))
+    return values
+
+class BakeCache:
+    """
+    On-disk cache of everything Map derives from a TMX file: the baked chunk
+    pixels, minimaps and the compact tile model (layers, palette, tile flags).
+    Entries are keyed by the content hash of the TMX file, its tilesets and
+    their images plus the tile and chunk sizes, so editing any of them (or
+    changing TILE_SIZE) simply misses the cache instead of serving stale data.
+    """
+    directory: Path
+
+    def __init__(self, path: str) -> None:
+        key = self.content_key(path)
+        self.directory = Path(GameSettings.MAP_CACHE_DIR) / f"{Path(path).stem}-{key[:16]}"
+
+    @staticmethod
+    def content_key(path: str) -> str:
+        digest = hashlib.sha1()
+        digest.update(f"{CACHE_FORMAT}:{GameSettings.TILE_SIZE}:{GameSettings.MAP_CHUNK_TILES}".encode())
+        tmx_path = ASSETS_DIR / "maps" / path
+        digest.update(tmx_path.read_bytes())
+        for dep in BakeCache._dependencies(tmx_path):
+            try:
+                digest.update(dep.read_bytes())
+            except OSError:
+                digest.update(str(dep).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _dependencies(tmx_path: Path) -> list[Path]:
+        # External tilesets and every image they (or embedded tilesets) reference
+        deps: list[Path] = []
+        try:
+            root = ET.parse(tmx_path).getroot()
+        except ET.ParseError:
+            return deps
+        for tileset in root.iter("tileset"):
+            source = tileset.get("source")
+            base = tmx_path.parent
+            if source:
+                tsx_path = base / source
+                deps.append(tsx_path)
+                try:
+                    tileset = ET.parse(tsx_path).getroot()
+                    base = tsx_path.parent
+                except (OSError, ET.ParseError):
+                    continue
+            for image in tileset.iter("image"):
+                if image.get("source"):
+                    deps.append(base / image.get("source"))
+        return deps
+
+    def load_meta(self) -> dict | None:
+        try:
+            with open(self.directory / "meta.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            Logger.warning(f"Ignoring unreadable map cache {self.directory}: {e}")
+            return None
+        if meta.get("format") != CACHE_FORMAT:
+            return None
+        return meta
+
+    def save_meta(self, meta: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / "meta.json.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({**meta, "format": CACHE_FORMAT}, f)
+            tmp.replace(self.directory / "meta.json")
+        except OSError as e:
+            Logger.warning(f"Failed to write map cache {self.directory}: {e}")
+
+    def load_surface(self, name: str) -> pg.Surface | None:
+        try:
+            with open(self.directory / f"{name}.bin", "rb") as f:
+                w = int.from_bytes(f.read(4), "little")
+                h = int.from_bytes(f.read(4), "little")
+                pixels = zlib.decompress(f.read())
+            return pg.image.frombytes(pixels, (w, h), "RGBA").convert_alpha()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            Logger.warning(f"Ignoring corrupted map cache file {name}: {e}")
+            return None
+
+    def save_surface(self, name: str, surface: pg.Surface) -> None:
+        # Raw RGBA with fast zlib compression: much cheaper to encode than PNG,
+        # so storing a freshly baked chunk does not hitch the frame that baked it
+        w, h = surface.get_size()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / f"{name}.bin.tmp"
+            with open(tmp, "wb") as f:
+                f.write(w.to_bytes(4, "little"))
+                f.write(h.to_bytes(4, "little"))
+                f.write(zlib.compress(pg.image.tobytes(surface, "RGBA"), 1))
+            tmp.replace(self.directory / f"{name}.bin")
+        except OSError as e:
+            Logger.warning(f"Failed to write map cache file {name}: {e}")
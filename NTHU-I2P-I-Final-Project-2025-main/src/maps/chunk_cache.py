@@ -0,0 +1,77 @@
+import threading
+import pygame as pg
+from collections import OrderedDict
+
+from src.utils import GameSettings, Logger
+
+ChunkKey = tuple[str, int, int]
+
+class ChunkCache:
+    """
+    LRU cache of baked map chunks shared by every Map.
+    Chunks are accounted by their pixel size; once the budget is exceeded the
+    least recently drawn chunks (the ones furthest from the camera) are dropped
+    and will be baked again if the camera comes back.
+    All operations are locked so the map prefetcher can fill it from its thread.
+    """
+    budget_bytes: int
+    resident_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, budget_bytes: int) -> None:
+        self._chunks: OrderedDict[ChunkKey, pg.Surface] = OrderedDict()
+        self._lock = threading.Lock()
+        self.budget_bytes = budget_bytes
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: ChunkKey) -> bool:
+        return key in self._chunks
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    @staticmethod
+    def surface_bytes(surface: pg.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key: ChunkKey) -> pg.Surface | None:
+        with self._lock:
+            surface = self._chunks.get(key)
+            if surface is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._chunks.move_to_end(key)
+            return surface
+
+    def put(self, key: ChunkKey, surface: pg.Surface) -> None:
+        with self._lock:
+            old = self._chunks.pop(key, None)
+            if old is not None:
+                self.resident_bytes -= self.surface_bytes(old)
+            self._chunks[key] = surface
+            self.resident_bytes += self.surface_bytes(surface)
+            # Never evict the chunk we just inserted, even if it alone exceeds the budget
+            while self.resident_bytes > self.budget_bytes and len(self._chunks) > 1:
+                old_key, old = self._chunks.popitem(last=False)
+                self.resident_bytes -= self.surface_bytes(old)
+                self.evictions += 1
+                Logger.debug(f"Evicted map chunk {old_key}")
+
+    def drop_map(self, map_key: str) -> None:
+        """Remove every chunk belonging to one map."""
+        with self._lock:
+            for key in [k for k in self._chunks if k[0] == map_key]:
+                self.resident_bytes -= self.surface_bytes(self._chunks.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self.resident_bytes = 0
+
+chunk_cache = ChunkCache(GameSettings.MAP_CHUNK_BUDGET_MB * 1024 * 1024)
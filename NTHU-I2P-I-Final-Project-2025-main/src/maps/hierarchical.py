@@ -0,0 +1,382 @@
+import time
+from heapq import heappush, heappop
+from typing import Generator, Iterable
+
+Tile = tuple[int, int]
+
+# Border openings at least this long get a transition at each end instead of one in the middle
+WIDE_ENTRANCE = 6
+
+class ClusterGraph:
+    """
+    HPA* abstraction of a walkability grid (row-major, 1 = walkable).
+    The grid is cut into square clusters; every opening between two adjacent
+    clusters gets one or two transition tile pairs, and the transition tiles
+    of each cluster are connected by their walking distance inside it.
+    A long search then runs over this small abstract graph, touching the
+    full-resolution grid only in the start and goal clusters and when the
+    abstract path is refined back into tiles one cluster at a time.
+    Paths are near-optimal: they always pass through transition tiles.
+    """
+    cluster_size: int
+    clusters_x: int
+    clusters_y: int
+    last_expanded: int
+    version: int
+
+    def __init__(self, walkable: bytearray, width: int, height: int, cluster_size: int) -> None:
+        self._walkable = walkable
+        self._w = width
+        self._h = height
+        self.cluster_size = cluster_size
+        self.clusters_x = -(-width // cluster_size)
+        self.clusters_y = -(-height // cluster_size)
+        # (cluster a, cluster b) with a < b -> transition tile pairs (tile in a, tile in b)
+        self._borders: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        # Transition tile -> tiles across a border it connects to (cost 1 each)
+        self._inter: dict[int, set[int]] = {}
+        # Cluster -> transition tile -> {transition tile in the same cluster: distance}
+        self._intra: dict[int, dict[int, dict[int, int]]] = {}
+        # Tiles touched (BFS and abstract nodes) by the last find_path, for profiling
+        self.last_expanded = 0
+        # Bumped by refresh() so searches in progress know to start over
+        self.version = 0
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                if cx + 1 < self.clusters_x:
+                    self._build_border(cx, cy, cx + 1, cy)
+                if cy + 1 < self.clusters_y:
+                    self._build_border(cx, cy, cx, cy + 1)
+        for c in range(self.clusters_x * self.clusters_y):
+            self._build_intra(c)
+
+    def __len__(self) -> int:
+        """Number of transition tiles (abstract nodes)."""
+        return sum(len(nodes) for nodes in self._intra.values())
+
+    def cluster_of(self, index: int) -> int:
+        x, y = index % self._w, index // self._w
+        return (y // self.cluster_size) * self.clusters_x + x // self.cluster_size
+
+    def refresh(self, tiles: Iterable[Tile]) -> None:
+        """Rebuild the clusters containing tiles after their walkability changed."""
+        cs = self.cluster_size
+        changed = {(x // cs, y // cs) for x, y in tiles if 0 <= x < self._w and 0 <= y < self._h}
+        dirty: set[int] = set()
+        for cx, cy in changed:
+            for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+                if 0 <= nx < self.clusters_x and 0 <= ny < self.clusters_y:
+                    self._build_border(min(cx, nx), min(cy, ny), max(cx, nx), max(cy, ny))
+                    dirty.add(ny * self.clusters_x + nx)
+            dirty.add(cy * self.clusters_x + cx)
+        for c in dirty:
+            self._build_intra(c)
+        self.version += 1
+
+    def find_path(self, start: Tile, goal: Tile, goal_is_teleporter: bool = False,
+                  avoid: set[Tile] | None = None) -> list[Tile]:
+        """
+        Path from start to goal (start excluded, goal included) or [] if none
+        was found. Avoided tiles are not known to the precomputed cluster
+        costs, so one blocking the only way through a cluster also yields [].
+        """
+        search = ClusterSearch(self, start, goal, goal_is_teleporter, avoid)
+        search.step()
+        return search.path
+
+    def _search(self, start: Tile, goal: Tile, goal_is_teleporter: bool,
+                avoid: set[Tile] | None) -> Generator[int, None, list[Tile]]:
+        # find_path as a generator for ClusterSearch: yields the number of
+        # tiles or abstract nodes each unit of work touched, returns the path
+        w = self._w
+        sx, sy = start
+        gx, gy = goal
+        if not (0 <= sx < w and 0 <= sy < self._h and 0 <= gx < w and 0 <= gy < self._h):
+            return []
+        s, g = sy * w + sx, gy * w + gx
+        if s == g:
+            return []
+        if not self._walkable[g] and not goal_is_teleporter:
+            return []
+        avoid_index = {y * w + x for x, y in avoid} - {g} if avoid else set()
+        self.last_expanded = 0
+        cs_start, cs_goal = self.cluster_of(s), self.cluster_of(g)
+
+        # Hook start and goal into the abstract graph with one BFS each. An
+        # unwalkable start (standing in a bush) or goal (a door) has no
+        # transitions of its own, so on a cluster edge it is also left or
+        # entered through its neighbours across the edge
+        # Node -> (cost from the start, entry tile, BFS parents from that entry)
+        start_edges: dict[int, tuple[int, int, dict[int, int]]] = {}
+        # Goal reached inside a start BFS: (cost, entry tile, BFS parents, the
+        # goal or, for a door, the neighbour it is stepped into from)
+        direct: tuple[int, int, dict[int, int], int] | None = None
+        for entry, extra in self._entries(s, cs_start, avoid_index):
+            cluster = self.cluster_of(entry)
+            dist, parents = self._cluster_bfs(entry, cluster, avoid_index)
+            yield len(dist)
+            for n, d in dist.items():
+                if n in self._intra[cluster] and d + extra < start_edges.get(n, (d + extra + 1,))[0]:
+                    start_edges[n] = (d + extra, entry, parents)
+            ends = [(g, 0)] if self._walkable[g] else [
+                (ny * w + nx, 1) for nx, ny in ((gx + 1, gy), (gx, gy + 1), (gx, gy - 1), (gx - 1, gy))
+                if 0 <= nx < w and 0 <= ny < self._h]
+            for end, step in ends:
+                if end in dist and (direct is None or dist[end] + extra + step < direct[0]):
+                    direct = (dist[end] + extra + step, entry, parents, end)
+        # Node -> (cost to the goal, entry tile, BFS parents from that entry)
+        goal_edges: dict[int, tuple[int, int, dict[int, int]]] = {}
+        for entry, extra in self._entries(g, cs_goal, avoid_index):
+            cluster = self.cluster_of(entry)
+            dist, parents = self._cluster_bfs(entry, cluster, avoid_index)
+            yield len(dist)
+            for n, d in dist.items():
+                if n in self._intra[cluster] and d + extra < goal_edges.get(n, (d + extra + 1,))[0]:
+                    goal_edges[n] = (d + extra, entry, parents)
+
+        # A* over transition tiles; cost = tiles walked, heuristic = Manhattan
+        def h(i: int) -> int:
+            return abs(i % w - gx) + abs(i // w - gy)
+
+        best = {s: 0}
+        came_from: dict[int, int] = {}
+        open_set = [(h(s), s)]
+        closed: set[int] = set()
+        while open_set:
+            _, node = heappop(open_set)
+            if node in closed:
+                continue
+            closed.add(node)
+            yield 1
+            if node == g:
+                break
+            cost = best[node]
+            if node == s:
+                # The start BFS already covers every transition of its cluster
+                edges = [(n, edge[0]) for n, edge in start_edges.items()]
+                if direct is not None:
+                    edges.append((g, direct[0]))
+            else:
+                edges = list(self._intra[self.cluster_of(node)].get(node, {}).items())
+                if node in goal_edges:
+                    edges.append((g, goal_edges[node][0]))
+            edges += [(n, 1) for n in self._inter.get(node, ())]
+            for n, d in edges:
+                if n not in closed and n not in avoid_index and cost + d < best.get(n, cost + d + 1):
+                    best[n] = cost + d
+                    came_from[n] = node
+                    heappush(open_set, (cost + d + h(n), n))
+        self.last_expanded += len(closed)
+        if g not in closed:
+            return []
+
+        abstract = [g]
+        while abstract[-1] != s:
+            abstract.append(came_from[abstract[-1]])
+        abstract.reverse()
+
+        # Refine every abstract edge back into tiles
+        path: list[Tile] = []
+        for a, b in zip(abstract, abstract[1:]):
+            if b in self._inter.get(a, ()):
+                path.append((b % w, b // w))
+                continue
+            if a == s:
+                # Edges out of the start all come from a start BFS
+                if b == g:
+                    _, entry, parents, end = direct
+                else:
+                    _, entry, parents = start_edges[b]
+                    end = b
+                segment = ([entry] if entry != s else []) + self._unwind(parents, end) + ([g] if end != b else [])
+            elif b == g:
+                # The goal BFS ran from the entry, so its parents lead back towards it
+                _, entry, parents = goal_edges[a]
+                segment = (self._unwind(parents, a)[::-1] + [entry])[1:] + ([g] if entry != g else [])
+            else:
+                dist, parents = self._cluster_bfs(a, self.cluster_of(a), avoid_index, b)
+                yield len(dist)
+                if b not in dist:
+                    return []
+                segment = self._unwind(parents, b)
+            if not segment and a != b:
+                return []
+            path.extend((i % w, i // w) for i in segment)
+        return path
+
+    def _entries(self, tile: int, cluster: int, avoid: set[int]) -> list[tuple[int, int]]:
+        # BFS sources for hooking tile into the graph, with the steps to reach
+        # them: the tile itself, and if it is unwalkable its walkable
+        # neighbours in other clusters
+        entries = [(tile, 0)]
+        if not self._walkable[tile]:
+            w = self._w
+            x, y = tile % w, tile // w
+            for nx, ny in ((x + 1, y), (x, y + 1), (x, y - 1), (x - 1, y)):
+                n = ny * w + nx
+                if (0 <= nx < w and 0 <= ny < self._h and self._walkable[n] and n not in avoid
+                        and self.cluster_of(n) != cluster):
+                    entries.append((n, 1))
+        return entries
+
+    def _cluster_bfs(self, source: int, cluster: int, avoid: set[int],
+                     target: int | None = None) -> tuple[dict[int, int], dict[int, int]]:
+        # Walking distances and BFS parents (global tile indices) from source
+        # without leaving cluster
+        walkable, x0, y0, cw = self._cluster_grid(cluster, avoid)
+        w = self._w
+        local_target = (target // w - y0) * cw + target % w - x0 if target is not None else -1
+        dist, parents, order = self._flood(walkable, cw, (source // w - y0) * cw + source % w - x0, local_target)
+
+        def to_global(i: int) -> int:
+            return (y0 + i // cw) * w + x0 + i % cw
+        reached = {to_global(i): dist[i] for i in order}
+        came_from = {to_global(i): to_global(parents[i]) for i in order if parents[i] >= 0}
+        return reached, came_from
+
+    def _cluster_grid(self, cluster: int, avoid: set[int]) -> tuple[bytearray, int, int, int]:
+        # Local copy of the cluster's walkability with avoided tiles blocked,
+        # plus its origin and width
+        w, cs = self._w, self.cluster_size
+        x0 = (cluster % self.clusters_x) * cs
+        y0 = (cluster // self.clusters_x) * cs
+        x1, y1 = min(x0 + cs, w), min(y0 + cs, self._h)
+        cw = x1 - x0
+        walkable = bytearray()
+        for y in range(y0, y1):
+            walkable += self._walkable[y * w + x0:y * w + x1]
+        for i in avoid:
+            x, y = i % w - x0, i // w - y0
+            if 0 <= x < cw and 0 <= y < y1 - y0:
+                walkable[y * cw + x] = 0
+        return walkable, x0, y0, cw
+
+    def _flood(self, walkable: bytearray, cw: int, source: int,
+               target: int = -1) -> tuple[list[int], list[int], list[int]]:
+        # BFS in cluster coordinates; the source itself may be unwalkable (a
+        # door), everything else must not be. Returns distances, parents and
+        # the tiles in the order they were reached
+        size = len(walkable)
+        dist = [-1] * size
+        parents = [-1] * size
+        dist[source] = 0
+        order = [source]
+        for i in order:
+            if i == target:
+                break
+            d = dist[i] + 1
+            x = i % cw
+            # Right, down, up, left, as in PathSearch's default order
+            for n in (i + 1 if x < cw - 1 else -1, i + cw if i + cw < size else -1,
+                      i - cw, i - 1 if x > 0 else -1):
+                if n >= 0 and dist[n] < 0 and walkable[n]:
+                    dist[n] = d
+                    parents[n] = i
+                    order.append(n)
+        self.last_expanded += len(order)
+        return dist, parents, order
+
+    @staticmethod
+    def _unwind(parents: dict[int, int], end: int) -> list[int]:
+        # Tiles from just after the BFS source up to end
+        segment = []
+        while end in parents:
+            segment.append(end)
+            end = parents[end]
+        segment.reverse()
+        return segment
+
+    def _build_border(self, ax: int, ay: int, bx: int, by: int) -> None:
+        w, cs = self._w, self.cluster_size
+        a, b = ay * self.clusters_x + ax, by * self.clusters_x + bx
+        # Drop the old transitions of this border
+        for ta, tb in self._borders.pop((a, b), []):
+            self._inter.get(ta, set()).discard(tb)
+            self._inter.get(tb, set()).discard(ta)
+        if bx > ax:
+            # Vertical border: last column of a against first column of b
+            x = bx * cs
+            pairs = [((y * w + x - 1), (y * w + x)) for y in range(ay * cs, min((ay + 1) * cs, self._h))]
+        else:
+            y = by * cs
+            pairs = [(((y - 1) * w + x), (y * w + x)) for x in range(ax * cs, min((ax + 1) * cs, w))]
+        transitions = []
+        run: list[tuple[int, int]] = []
+        for pair in pairs + [(-1, -1)]:
+            if pair[0] >= 0 and self._walkable[pair[0]] and self._walkable[pair[1]]:
+                run.append(pair)
+                continue
+            if run:
+                if len(run) >= WIDE_ENTRANCE:
+                    transitions += [run[0], run[-1]]
+                else:
+                    transitions.append(run[len(run) // 2])
+                run = []
+        self._borders[(a, b)] = transitions
+        for ta, tb in transitions:
+            self._inter.setdefault(ta, set()).add(tb)
+            self._inter.setdefault(tb, set()).add(ta)
+
+    def _build_intra(self, cluster: int) -> None:
+        cx, cy = cluster % self.clusters_x, cluster // self.clusters_x
+        nodes = set()
+        for key in ((cluster - 1, cluster) if cx > 0 else None, (cluster, cluster + 1),
+                    (cluster - self.clusters_x, cluster) if cy > 0 else None,
+                    (cluster, cluster + self.clusters_x)):
+            for pair in self._borders.get(key, ()):
+                nodes.update(t for t in pair if self.cluster_of(t) == cluster)
+        walkable, x0, y0, cw = self._cluster_grid(cluster, set())
+        w = self._w
+        local = {node: (node // w - y0) * cw + node % w - x0 for node in nodes}
+        edges: dict[int, dict[int, int]] = {}
+        for node in nodes:
+            dist = self._flood(walkable, cw, local[node])[0]
+            edges[node] = {n: dist[local[n]] for n in nodes if n != node and dist[local[n]] >= 0}
+        self._intra[cluster] = edges
+
+class ClusterSearch:
+    """
+    One HPA* search over a ClusterGraph with PathSearch's time-sliced
+    contract: step() does a bounded amount of work and returns, the next
+    call resumes where it stopped, and path is final once done is True
+    ([] if no path was found). A refresh of the graph mid-search restarts it.
+    """
+    done: bool
+    path: list[Tile]
+    expanded: int
+
+    def __init__(self, graph: ClusterGraph, start: Tile, goal: Tile, goal_is_teleporter: bool = False,
+                 avoid: set[Tile] | None = None) -> None:
+        self.start = start
+        self.goal = goal
+        self.done = False
+        self.path = []
+        self.expanded = 0
+        self._graph = graph
+        self._args = (start, goal, goal_is_teleporter, avoid)
+        self._version = graph.version
+        self._steps = graph._search(*self._args)
+
+    def step(self, max_nodes: int | None = None, max_seconds: float | None = None) -> bool:
+        """Touch at most about max_nodes tiles and abstract nodes or work for about max_seconds; return True once finished."""
+        if self.done:
+            return True
+        if self._version != self._graph.version:
+            self._version = self._graph.version
+            self._steps = self._graph._search(*self._args)
+        deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+        work = 0
+        while True:
+            try:
+                work += next(self._steps)
+            except StopIteration as finished:
+                self.path = finished.value
+                self.done = True
+                break
+            if max_nodes is not None and work >= max_nodes:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.expanded += work
+        return self.done
@@ -0,0 +1,72 @@
+import threading
+
+from src.utils import Logger, Position, GameSettings, Teleport
+from .map import Map
+from .chunk_cache import chunk_cache
+
+class LazyMap:
+    """
+    Stand-in for a Map that is only parsed and baked the first time it is used.
+    Save data (path, teleporters, spawn) is available without loading, so
+    serializing and teleporter lookups never force a map into memory.
+    Loading is guarded by a lock because the map prefetcher may load maps
+    from its worker thread.
+    """
+    path_name: str
+    teleporters: list[Teleport]
+    spawn: Position
+    _map: Map | None
+
+    def __init__(self, path: str, tp: list[Teleport], spawn: Position):
+        self.path_name = path
+        self.teleporters = tp
+        self.spawn = spawn
+        self._map = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._map is not None
+
+    def peek(self) -> Map | None:
+        """The map if it is loaded right now, without loading it."""
+        return self._map
+
+    def load(self) -> Map:
+        loaded = self._map
+        if loaded is not None:
+            return loaded
+        with self._lock:
+            if self._map is None:
+                Logger.info(f"Loading map {self.path_name}")
+                self._map = Map(self.path_name, self.teleporters, self.spawn)
+            return self._map
+
+    def unload(self) -> None:
+        """Release the parsed map and its baked chunks; the next load rebuilds them."""
+        with self._lock:
+            if self._map is None:
+                return
+            Logger.info(f"Unloading map {self.path_name}")
+            self._map = None
+        chunk_cache.drop_map(self.path_name)
+
+    def __getattr__(self, name: str):
+        # Anything that is not save data needs the real map
+        return getattr(self.load(), name)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LazyMap":
+        tp = [Teleport.from_dict(t) for t in data["teleport"]]
+        pos = Position(data["player"]["x"] * GameSettings.TILE_SIZE, data["player"]["y"] * GameSettings.TILE_SIZE)
+        return cls(data["path"], tp, pos)
+
+    def to_dict(self):
+        return {
+            "path": self.path_name,
+            "teleport": [t.to_dict() for t in self.teleporters],
+            "player": {
+                "x": self.spawn.x // GameSettings.TILE_SIZE,
+                "y": self.spawn.y // GameSettings.TILE_SIZE,
+            }
+        }
@@ -1,63 +1,335 @@
 import pygame as pg
 import pytmx
+from array import array
+from itertools import count
 
 from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from .chunk_cache import chunk_cache
+from .tile_cache import tile_cache, TileKey
+from .bake_cache import BakeCache, pack_grid, unpack_grid, unpack_array
+from .hierarchical import ClusterGraph
+from .path_cache import path_cache
+
+# Bits of Map._tile_flags
+TILE_COLLISION = 1
+TILE_BUSH = 2
+
+# Collision versions handed out by Map.set_collision; 0 is the map as baked
+# from its TMX, every edit gets a number no other map or reload will reuse
+_collision_versions = count(1)
+
+# Points sampled by is_pokemon_bush_at, relative to the queried position
+BUSH_SAMPLE_OFFSETS = [
+    (0, 0),
+    (GameSettings.TILE_SIZE - 1, 0),
+    (0, GameSettings.TILE_SIZE - 1),
+    (GameSettings.TILE_SIZE - 1, GameSettings.TILE_SIZE - 1),
+    (GameSettings.TILE_SIZE // 2, GameSettings.TILE_SIZE // 2),
+]
 
 class Map:
     # Map Properties
     path_name: str
-    tmxdata: pytmx.TiledMap
+    width: int
+    height: int
     # Position Argument
     spawn: Position
-    teleporters: list[Teleport]
+    _teleporters: list[Teleport]
+    _teleport_index: dict[tuple[int, int], Teleport]
     # Rendering Properties
-    _surface: pg.Surface
-    _collision_map: list[pg.Rect]
+    _chunk_px: int
+    _minimaps: dict[tuple[int, int], pg.Surface]
+    _scaled_tiles: dict[int, dict[int, pg.Surface | None]]
+    _tiles_ready: set[int]
+    # Tile Properties
+    _palette: list[tuple[str, int, tuple]]
+    _layers: list[array]
+    _layer_index: dict[str, int]
+    _tile_flags: bytearray
+    _collision_inset: int
+    _walkable: bytearray | None
+    collision_version: int
+    _nav_clusters: ClusterGraph | None
+    _nav_clusters_building: bool
+    _bake_cache: BakeCache | None
 
     def __init__(self, path: str, tp: list[Teleport], spawn: Position):
         self.path_name = path
-        self.tmxdata = load_tmx(path)
         self.spawn = spawn
         self.teleporters = tp
 
-        pixel_w = self.tmxdata.width * GameSettings.TILE_SIZE
-        pixel_h = self.tmxdata.height * GameSettings.TILE_SIZE
+        # Everything derived from the TMX file comes from the on-disk bake cache
+        # when possible; pytmx is only touched on a cache miss and never kept around
+        self._bake_cache = BakeCache(path) if GameSettings.MAP_CACHE_DIR else None
+        meta = self._bake_cache.load_meta() if self._bake_cache else None
+        if meta is None:
+            meta = self._create_meta()
+            if self._bake_cache:
+                self._bake_cache.save_meta(meta)
+
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.pixel_w = self.width * GameSettings.TILE_SIZE
+        self.pixel_h = self.height * GameSettings.TILE_SIZE
+
+        # The map is split into fixed-size chunks that are baked on demand the
+        # first time the camera nears them and kept in the shared chunk cache
+        self._chunk_px = GameSettings.MAP_CHUNK_TILES * GameSettings.TILE_SIZE
+        self._minimaps = {}
+        self._scaled_tiles = {}
+        self._tiles_ready = set()
+
+        # Compact tile model: every visible tile layer is a row-major array of
+        # palette indices (0 = empty), each palette entry names a tile in the
+        # shared tile cache, and one flags byte per tile holds collision / bush bits
+        self._palette = [("", 0, ())] + [(source, tile_id, tuple(flags)) for source, tile_id, flags in meta["palette"]]
+        self._layers = [unpack_array(layer["data"]) for layer in meta["layers"]]
+        # Layer name -> position in _layers, for tile queries by layer (see has_tile)
+        self._layer_index = {layer["name"]: i for i, layer in enumerate(meta["layers"])}
+        self._tile_flags = unpack_grid(meta["flags"])
+        # Collision tiles are shrunk by 1px on each side so narrow passages and
+        # one-pixel visual gaps are handled more forgivingly (only for reasonably large tiles)
+        self._collision_inset = 1 if GameSettings.TILE_SIZE > 6 else 0
+        self._walkable = None
+        # Changed by set_collision so cached navigation paths can tell they are stale
+        self.collision_version = 0
+        self._nav_clusters = None
+        self._nav_clusters_building = False
+
+    def _create_meta(self) -> dict:
+        # Parse the TMX once, flatten it into the compact model and let pytmx go;
+        # the tile images it decoded live on in the shared tile cache
+        tmxdata = load_tmx(self.path_name)
+        palette, layers = self._compile_layers(tmxdata)
+        self._prime_tiles(tmxdata, palette, GameSettings.TILE_SIZE)
+        return {
+            "width": tmxdata.width,
+            "height": tmxdata.height,
+            "palette": [[source, tile_id, list(flags)] for source, tile_id, flags in palette],
+            "layers": [{"name": name, "data": pack_grid(data)} for name, data in layers],
+            "flags": pack_grid(self._create_tile_flags(layers, tmxdata.width * tmxdata.height)),
+        }
+
+    @property
+    def teleporters(self) -> list[Teleport]:
+        return self._teleporters
 
-        # Prebake the map
-        self._surface = pg.Surface((pixel_w, pixel_h), pg.SRCALPHA)
-        self._render_all_layers(self._surface)
-        # Prebake the collision map
-        self._collision_map = self._create_collision_map()
+    @teleporters.setter
+    def teleporters(self, tp: list[Teleport]) -> None:
+        # Teleporters are looked up by the tile they sit on; when two share a
+        # tile the first one in the list wins, as with the old linear scan
+        self._teleporters = tp
+        self._teleport_index = {}
+        for t in tp:
+            key = (int(t.pos.x) // GameSettings.TILE_SIZE, int(t.pos.y) // GameSettings.TILE_SIZE)
+            self._teleport_index.setdefault(key, t)
 
     def update(self, dt: float):
         return
 
+    @property
+    def chunks_x(self) -> int:
+        return -(-self.pixel_w // self._chunk_px)
+
+    @property
+    def chunks_y(self) -> int:
+        return -(-self.pixel_h // self._chunk_px)
+
+    def visible_chunks(self, camera: PositionCamera, view_w: int, view_h: int) -> list[tuple[int, int]]:
+        """Return the (cx, cy) indices of every chunk that intersects the camera viewport."""
+        cp = self._chunk_px
+        cx0 = max(0, camera.x // cp)
+        cy0 = max(0, camera.y // cp)
+        cx1 = min(self.chunks_x - 1, (camera.x + view_w - 1) // cp)
+        cy1 = min(self.chunks_y - 1, (camera.y + view_h - 1) // cp)
+        return [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+
+    def get_chunk(self, cx: int, cy: int) -> pg.Surface:
+        key = (self.path_name, cx, cy)
+        chunk = chunk_cache.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(cx, cy)
+            chunk_cache.put(key, chunk)
+        return chunk
+
+    def _load_chunk(self, cx: int, cy: int) -> pg.Surface:
+        name = f"chunk_{cx}_{cy}"
+        chunk = self._bake_cache.load_surface(name) if self._bake_cache else None
+        if chunk is None:
+            chunk = self._bake_chunk(cx, cy)
+            if self._bake_cache:
+                self._bake_cache.save_surface(name, chunk)
+        return chunk
+
     def draw(self, screen: pg.Surface, camera: PositionCamera):
-        screen.blit(self._surface, camera.transform_position(Position(0, 0)))
+        # Only blit the chunks overlapping the screen; cost no longer depends on map size
+        cp = self._chunk_px
+        view_w, view_h = screen.get_size()
+        for cx, cy in self.visible_chunks(camera, view_w, view_h):
+            screen.blit(self.get_chunk(cx, cy), (cx * cp - camera.x, cy * cp - camera.y))
+        self._prefetch_chunks(camera, view_w, view_h)
         
-        # Draw the hitboxes collision map
+        # Draw the hitboxes of the collision tiles on screen
         if GameSettings.DRAW_HITBOXES:
             ts = GameSettings.TILE_SIZE
-            for rect in self._collision_map:
-                if rect.w < ts or rect.h < ts:
-                    dw = ts - rect.w
-                    dh = ts - rect.h
-                    display_rect = rect.inflate(dw, dh)
-                else:
-                    display_rect = rect
-                pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(display_rect), 1)
+            grid, w = self._tile_flags, self.width
+            x0, y0 = max(0, camera.x // ts), max(0, camera.y // ts)
+            x1 = min(w, (camera.x + view_w) // ts + 1)
+            y1 = min(self.height, (camera.y + view_h) // ts + 1)
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    if grid[y * w + x] & TILE_COLLISION:
+                        pg.draw.rect(screen, (255, 0, 0), (x * ts - camera.x, y * ts - camera.y, ts, ts), 1)
         
     def check_collision(self, rect: pg.Rect) -> bool:
         '''
         [TODO HACKATHON 4]
-        Return True if collide if rect param collide with self._collision_map
+        Return True if collide if rect param collide with the collision tiles in self._tile_flags
         Hint: use API colliderect and iterate each rectangle to check
         '''
-        for r in self._collision_map:
-            if rect.colliderect(r):
-                return True
+        # Only the handful of tiles the rect overlaps are examined, then each
+        # blocked one is tested against its inset rect exactly like colliderect would
+        if rect.w <= 0 or rect.h <= 0:
+            return False
+        ts = GameSettings.TILE_SIZE
+        inset = self._collision_inset
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        x0 = max(0, left // ts)
+        y0 = max(0, top // ts)
+        x1 = min(self.width - 1, (right - 1) // ts)
+        y1 = min(self.height - 1, (bottom - 1) // ts)
+        grid, w = self._tile_flags, self.width
+        for y in range(y0, y1 + 1):
+            if not (y * ts + inset < bottom and top < (y + 1) * ts - inset):
+                continue
+            row = y * w
+            for x in range(x0, x1 + 1):
+                if grid[row + x] & TILE_COLLISION and x * ts + inset < right and left < (x + 1) * ts - inset:
+                    return True
         return False
-        
+
+    def sweep_x(self, rect: pg.Rect, dx: float) -> float:
+        """How far rect can move along x, up to dx, before touching a collision tile."""
+        return self._sweep(rect, dx, True)
+
+    def sweep_y(self, rect: pg.Rect, dy: float) -> float:
+        """How far rect can move along y, up to dy, before touching a collision tile."""
+        return self._sweep(rect, dy, False)
+
+    def _sweep(self, rect: pg.Rect, delta: float, horizontal: bool) -> float:
+        # Walk the tile lines the moving edge crosses, nearest first, and stop
+        # at the first one with a collision tile beside the rect; the contact
+        # point uses the same inset rects as check_collision. Tiles the rect
+        # already overlaps are behind the moving edge, so it can always back out
+        if delta == 0 or rect.w <= 0 or rect.h <= 0:
+            return delta
+        ts = GameSettings.TILE_SIZE
+        inset = self._collision_inset
+        grid, w = self._tile_flags, self.width
+        if horizontal:
+            lo, hi, cross_lo, cross_hi = rect.left, rect.right, rect.top, rect.bottom
+            lines, cross_lines = self.width, self.height
+        else:
+            lo, hi, cross_lo, cross_hi = rect.top, rect.bottom, rect.left, rect.right
+            lines, cross_lines = self.height, self.width
+        cross = [c for c in range(max(0, cross_lo // ts), min(cross_lines - 1, (cross_hi - 1) // ts) + 1)
+                 if c * ts + inset < cross_hi and cross_lo < (c + 1) * ts - inset]
+        if not cross:
+            return delta
+
+        def blocked(line: int) -> bool:
+            if horizontal:
+                return any(grid[c * w + line] & TILE_COLLISION for c in cross)
+            return any(grid[line * w + c] & TILE_COLLISION for c in cross)
+
+        if delta > 0:
+            line = max(0, -(-(hi - inset) // ts))
+            while line < lines and line * ts + inset < hi + delta:
+                if blocked(line):
+                    return line * ts + inset - hi
+                line += 1
+        else:
+            line = min(lines - 1, (lo + inset) // ts - 1)
+            while line >= 0 and (line + 1) * ts - inset > lo + delta:
+                if blocked(line):
+                    return (line + 1) * ts - inset - lo
+                line -= 1
+        return delta
+
+    @property
+    def walkable_grid(self) -> bytearray:
+        """Row-major grid (width * height) where 1 marks a tile auto-navigation may step on."""
+        if self._walkable is None:
+            self._walkable = self._create_walkable_grid()
+        return self._walkable
+
+    @property
+    def nav_clusters(self) -> ClusterGraph | None:
+        """HPA* cluster graph over walkable_grid for long-range searches, or None until prepare_nav_clusters built it."""
+        return self._nav_clusters
+
+    def prepare_nav_clusters(self) -> None:
+        """Build nav_clusters on the map prefetch worker, unless it is built or being built already."""
+        if self._nav_clusters is not None or self._nav_clusters_building:
+            return
+        from .map_prefetcher import map_prefetcher
+        # The grid is created here so the worker never races the main thread for it
+        walkable = self.walkable_grid
+        version = self.collision_version
+        self._nav_clusters_building = True
+
+        def build() -> None:
+            try:
+                graph = ClusterGraph(walkable, self.width, self.height, GameSettings.NAV_CLUSTER_TILES)
+                # A collision edit during the build may have missed the graph;
+                # drop it and let the next prepare_nav_clusters start over
+                self._nav_clusters = graph
+                if self.collision_version != version:
+                    self._nav_clusters = None
+            finally:
+                self._nav_clusters_building = False
+        map_prefetcher.submit(f"nav-clusters:{self.path_name}", build)
+
+    def set_collision(self, tx: int, ty: int, blocked: bool) -> None:
+        """Mark tile (tx, ty) as blocked or free and update the navigation data derived from it."""
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return
+        i = ty * self.width + tx
+        if bool(self._tile_flags[i] & TILE_COLLISION) == blocked:
+            return
+        if blocked:
+            self._tile_flags[i] |= TILE_COLLISION
+        else:
+            self._tile_flags[i] &= ~TILE_COLLISION
+        self.collision_version = next(_collision_versions)
+        path_cache.drop_map(self.path_name)
+        if self._walkable is None:
+            return
+        ts = GameSettings.TILE_SIZE
+        walkable = not blocked and not self.is_pokemon_bush_at(Position(tx * ts + ts // 2, ty * ts + ts // 2))
+        if self._walkable[i] != walkable:
+            self._walkable[i] = walkable
+            # Only the cluster holding the tile (and its borders) is rebuilt
+            if self._nav_clusters is not None:
+                self._nav_clusters.refresh([(tx, ty)])
+
+    def _create_walkable_grid(self) -> bytearray:
+        # A tile is blocked if its own rect collides or if the player standing
+        # on its centre would count as being in a bush; navigation avoids both
+        w, h = self.width, self.height
+        not_colliding = bytes(0 if b & TILE_COLLISION else 1 for b in range(256))
+        grid = self._tile_flags.translate(not_colliding)
+        ts = GameSettings.TILE_SIZE
+        sampled = {((ts // 2 + ox) // ts, (ts // 2 + oy) // ts) for ox, oy in BUSH_SAMPLE_OFFSETS}
+        for i, flags in enumerate(self._tile_flags):
+            if flags & TILE_BUSH:
+                bx, by = i % w, i // w
+                for dx, dy in sampled:
+                    x, y = bx - dx, by - dy
+                    if 0 <= x < w and 0 <= y < h:
+                        grid[y * w + x] = 0
+        return grid
+
     def check_teleport(self, pos: Position) -> Teleport | None:
         '''[TODO HACKATHON 6] 
         Teleportation: Player can enter a building by walking into certain tiles defined inside saves/*.json, and the map will be changed
@@ -66,94 +338,186 @@ class Map:
         # Convert player position to tile coordinates
         tx = int(pos.x) // GameSettings.TILE_SIZE
         ty = int(pos.y) // GameSettings.TILE_SIZE
+        return self._teleport_index.get((tx, ty))
 
-        for tp in self.teleporters:
-            ttx = int(tp.pos.x) // GameSettings.TILE_SIZE
-            tty = int(tp.pos.y) // GameSettings.TILE_SIZE
-            if tx == ttx and ty == tty:
-                return tp
-        return None
-
-    def _render_all_layers(self, target: pg.Surface) -> None:
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                self._render_tile_layer(target, layer)
-            # elif isinstance(layer, pytmx.TiledImageLayer) and layer.image:
-            #     target.blit(layer.image, (layer.x or 0, layer.y or 0))
- 
-    def _render_tile_layer(self, target: pg.Surface, layer: pytmx.TiledTileLayer) -> None:
-        for x, y, gid in layer:
-            if gid == 0:
-                continue
-            image = self.tmxdata.get_tile_image_by_gid(gid)
-            if image is None:
+    def warm_chunks(self, center: Position) -> None:
+        """Load every chunk a camera centred on center would draw, plus the prefetch ring."""
+        margin = GameSettings.MAP_CHUNK_PREFETCH * self._chunk_px
+        view_w = GameSettings.SCREEN_WIDTH + 2 * margin
+        view_h = GameSettings.SCREEN_HEIGHT + 2 * margin
+        area = PositionCamera(int(center.x) - view_w // 2, int(center.y) - view_h // 2)
+        for cx, cy in self.visible_chunks(area, view_w, view_h):
+            if (self.path_name, cx, cy) not in chunk_cache:
+                chunk_cache.put((self.path_name, cx, cy), self._load_chunk(cx, cy))
+
+    def _prefetch_chunks(self, camera: PositionCamera, view_w: int, view_h: int) -> None:
+        # Bake at most one chunk of the ring around the viewport per frame so
+        # walking towards an unbaked area never has to bake a whole row at once
+        margin = GameSettings.MAP_CHUNK_PREFETCH * self._chunk_px
+        if margin <= 0:
+            return
+        ring = PositionCamera(camera.x - margin, camera.y - margin)
+        for cx, cy in self.visible_chunks(ring, view_w + 2 * margin, view_h + 2 * margin):
+            key = (self.path_name, cx, cy)
+            if key not in chunk_cache:
+                chunk_cache.put(key, self._load_chunk(cx, cy))
+                return
+
+    def get_minimap(self, size: tuple[int, int]) -> pg.Surface:
+        """Return the whole map scaled down to size, built once per size."""
+        minimap = self._minimaps.get(size)
+        if minimap is not None:
+            return minimap
+        name = f"minimap_{size[0]}x{size[1]}"
+        minimap = self._bake_cache.load_surface(name) if self._bake_cache else None
+        if minimap is None:
+            # Render the tiles straight at a few pixels per tile instead of going
+            # through full-size chunks, so huge maps never need a full-size bake
+            w, h = self.width, self.height
+            mts = max(1, -(-size[0] // w), -(-size[1] // h))
+            small = pg.Surface((w * mts, h * mts), pg.SRCALPHA)
+            self._render_all_layers(small, 0, 0, w, h, mts)
+            minimap = pg.transform.smoothscale(small, size)
+            if self._bake_cache:
+                self._bake_cache.save_surface(name, minimap)
+        self._minimaps[size] = minimap
+        return minimap
+
+    def _bake_chunk(self, cx: int, cy: int) -> pg.Surface:
+        ts = GameSettings.TILE_SIZE
+        n = GameSettings.MAP_CHUNK_TILES
+        x0, y0 = cx * n, cy * n
+        x1 = min(x0 + n, self.width)
+        y1 = min(y0 + n, self.height)
+        surface = pg.Surface(((x1 - x0) * ts, (y1 - y0) * ts), pg.SRCALPHA)
+        self._render_all_layers(surface, x0, y0, x1, y1)
+        return surface
+
+    def _render_all_layers(self, target: pg.Surface, x0: int, y0: int, x1: int, y1: int,
+                           ts: int = GameSettings.TILE_SIZE) -> None:
+        self._ensure_tiles(ts)
+        for data in self._layers:
+            self._render_tile_layer(target, data, x0, y0, x1, y1, ts)
+
+    def _render_tile_layer(self, target: pg.Surface, data: array,
+                           x0: int, y0: int, x1: int, y1: int, ts: int) -> None:
+        # Render the tiles in [x0, x1) x [y0, y1) relative to the target's top-left corner
+        scaled = self._scaled_tiles.setdefault(ts, {})
+        w = self.width
+        for y in range(y0, y1):
+            row = y * w
+            for x in range(x0, x1):
+                index = data[row + x]
+                if index == 0:
+                    continue
+                if index in scaled:
+                    image = scaled[index]
+                else:
+                    image = scaled[index] = tile_cache.get((*self._palette[index], ts), lambda: None)
+                if image is None:
+                    continue
+
+                target.blit(image, ((x - x0) * ts, (y - y0) * ts))
+
+    def _ensure_tiles(self, ts: int) -> None:
+        # Every palette tile must be in the tile cache at this size, or have its
+        # decoded image there to scale from, before rendering; the TMX is only
+        # parsed when a tile was never decoded this run (the map came from the bake cache)
+        if ts in self._tiles_ready:
+            return
+        palette = self._palette[1:]
+        if not all((*key, ts) in tile_cache or tile_cache.has_source(key) for key in palette):
+            self._prime_tiles(load_tmx(self.path_name), palette, ts)
+        self._tiles_ready.add(ts)
+
+    def _prime_tiles(self, tmxdata: pytmx.TiledMap, palette: list[tuple[str, int, tuple]], ts: int) -> None:
+        wanted = set(palette)
+        for gid, key in self._create_tile_keys(tmxdata).items():
+            if key in wanted:
+                tile_cache.get((*key, ts), lambda gid=gid: tmxdata.get_tile_image_by_gid(gid))
+
+    def _create_tile_keys(self, tmxdata: pytmx.TiledMap) -> dict[int, tuple[str, int, tuple]]:
+        """Map every pytmx gid of this map to a (tileset, local id, flags) key shared across maps."""
+        tilesets = sorted(tmxdata.tilesets, key=lambda t: t.firstgid, reverse=True)
+        keys: dict[int, tuple[str, int, tuple]] = {}
+        for tiled_gid, registered in tmxdata.gidmap.items():
+            for tileset in tilesets:
+                if tiled_gid >= tileset.firstgid:
+                    source = tileset.source or tileset.name
+                    for gid, flags in registered:
+                        keys[gid] = (source, tiled_gid - tileset.firstgid, tuple(flags))
+                    break
+        return keys
+
+    def _compile_layers(self, tmxdata: pytmx.TiledMap) -> tuple[list[tuple[str, int, tuple]], list[tuple[str, array]]]:
+        # pytmx gids are renumbered per map, so layers store indices into a
+        # palette of tileset-local tile keys instead
+        tile_keys = self._create_tile_keys(tmxdata)
+        palette: list[tuple[str, int, tuple]] = []
+        palette_index: dict[tuple[str, int, tuple], int] = {}
+        w = tmxdata.width
+        layers = []
+        for layer in tmxdata.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer):
                 continue
+            data = array("H", bytes(2 * w * tmxdata.height))
+            for y, row in enumerate(layer.data):
+                base = y * w
+                for x, gid in enumerate(row):
+                    if gid == 0:
+                        continue
+                    key = tile_keys[gid]
+                    index = palette_index.get(key)
+                    if index is None:
+                        palette.append(key)
+                        index = palette_index[key] = len(palette)
+                    data[base + x] = index
+            layers.append((layer.name or "", data))
+        return palette, layers
+
+    @staticmethod
+    def _create_tile_flags(layers: list[tuple[str, array]], size: int) -> bytearray:
+        # Collision comes from layers named like "collision" or "house"; some TMX
+        # files name the bush layer differently (e.g. 'Bush', 'PokemonBush'), so
+        # any layer whose name contains 'bush' (case-insensitive) counts
+        flags = bytearray(size)
+        for name, data in layers:
+            lname = name.lower()
+            bit = 0
+            if "collision" in lname or "house" in lname:
+                bit |= TILE_COLLISION
+            if "bush" in lname:
+                bit |= TILE_BUSH
+            if bit:
+                for i, index in enumerate(data):
+                    if index:
+                        flags[i] |= bit
+        return flags
 
-            image = pg.transform.scale(image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-            target.blit(image, (x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE))
-    
-    def _create_collision_map(self) -> list[pg.Rect]:
-        rects = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and ("collision" in layer.name.lower() or "house" in layer.name.lower()):
-                for x, y, gid in layer:
-                    if gid != 0:
-                        '''
-                        [TODO HACKATHON 4]
-                        rects.append(pg.Rect(...))
-                        Append the collision rectangle to the rects[] array
-                        Remember scale the rectangle with the TILE_SIZE from settings
-                        '''
-                        # shrink collision rect slightly so narrow passages and visual gaps are handled more forgivingly
-                        ts = GameSettings.TILE_SIZE
-                        r = pg.Rect(x * ts, y * ts, ts, ts)
-                        # only apply a small inset when tile is reasonably large
-                        if ts > 6:
-                            # inset by 2 pixels (1px each side) to avoid one-pixel visual gaps causing hard collisions
-                            r.inflate_ip(-2, -2)
-                        rects.append(r)
-        return rects
+    def is_bush_tile(self, tx: int, ty: int) -> bool:
+        """Return True if tile (tx, ty) is on a bush layer; outside the map never is."""
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return bool(self._tile_flags[ty * self.width + tx] & TILE_BUSH)
+        return False
+
+    def has_tile(self, layer_name: str, tx: int, ty: int) -> bool:
+        """Return True if the layer named layer_name has a tile at (tx, ty); unknown layers and outside the map never do."""
+        layer = self._layer_index.get(layer_name)
+        if layer is None or not (0 <= tx < self.width and 0 <= ty < self.height):
+            return False
+        return self._layers[layer][ty * self.width + tx] != 0
 
     def is_pokemon_bush_at(self, pos) -> bool:
         """Return True if the given world Position falls on a tile in the 'PokemonBush' layer."""
-        try:
-            tx = int(pos.x) // GameSettings.TILE_SIZE
-            ty = int(pos.y) // GameSettings.TILE_SIZE
-        except Exception:
-            return False
-        # Some TMX files may name the bush layer differently (e.g. 'Bush', 'PokemonBush').
-        # Consider any layer whose name contains 'bush' (case-insensitive).
-        # Also sample multiple points within the player's tile area to be robust against
+        # Sample multiple points within the player's tile area to be robust against
         # differing player anchor points (top-left vs feet).
         ts = GameSettings.TILE_SIZE
-        sample_offsets = [
-            (0, 0),
-            (ts - 1, 0),
-            (0, ts - 1),
-            (ts - 1, ts - 1),
-            (ts // 2, ts // 2),
-        ]
-        sample_tiles = set()
         try:
-            for ox, oy in sample_offsets:
-                sx = int((pos.x + ox)) // ts
-                sy = int((pos.y + oy)) // ts
-                sample_tiles.add((sx, sy))
+            for ox, oy in BUSH_SAMPLE_OFFSETS:
+                if self.is_bush_tile(int(pos.x + ox) // ts, int(pos.y + oy) // ts):
+                    return True
         except Exception:
             pass
-
-        for layer in self.tmxdata.visible_layers:
-            lname = getattr(layer, "name", "")
-            if not lname:
-                continue
-            if "bush" not in lname.lower():
-                continue
-            # check any of the sampled tiles
-            for x, y, gid in layer:
-                if gid == 0:
-                    continue
-                if (x, y) in sample_tiles:
-                    return True
         return False
 
     @classmethod
@@ -0,0 +1,125 @@
+import threading
+from collections import deque
+from typing import Callable
+
+from src.utils import Logger, Position
+from .lazy_map import LazyMap
+
+class MapPrefetcher:
+    """
+    Background worker that loads the maps the player can teleport to next,
+    and bakes the chunks around where they will land, while they are still
+    walking around the current map.
+    A map cancelled while the worker is already loading it is unloaded again
+    as soon as the load finishes, unless it was claimed back in the meantime.
+    Other background work (e.g. navigation precomputation) can be queued
+    with submit; it runs once no map is waiting to be loaded.
+    Hits and misses count whether a map was already loaded when a switch to
+    it was requested.
+    """
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._jobs: deque[tuple[LazyMap, Position]] = deque()
+        self._pending: set[str] = set()
+        self._tasks: deque[tuple[str, Callable[[], None]]] = deque()
+        self._task_names: set[str] = set()
+        # Path the worker is loading right now, and whether it was cancelled since
+        self._active: str | None = None
+        self._active_cancelled = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def request(self, lazy_map: LazyMap, landing: Position) -> None:
+        """Queue lazy_map to be loaded with its chunks around landing baked."""
+        with self._cond:
+            if lazy_map.path_name in self._pending:
+                return
+            self._pending.add(lazy_map.path_name)
+            self._jobs.append((lazy_map, landing))
+            self._wake()
+
+    def submit(self, name: str, task: Callable[[], None]) -> None:
+        """Run task on the worker thread; a task already queued under name is not queued again."""
+        with self._cond:
+            if name in self._task_names:
+                return
+            self._task_names.add(name)
+            self._tasks.append((name, task))
+            self._wake()
+
+    def _wake(self) -> None:
+        # Called with the condition held
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="map-prefetch", daemon=True)
+            self._thread.start()
+        self._cond.notify()
+
+    def cancel(self, path_name: str) -> None:
+        """Forget a request, e.g. because the map was just evicted; a load in progress is undone."""
+        with self._cond:
+            self._pending.discard(path_name)
+            if self._active == path_name:
+                self._active_cancelled = True
+
+    def claim(self, path_name: str) -> None:
+        """The map is wanted again (e.g. it is being switched to), so keep it even if it was cancelled."""
+        with self._cond:
+            if self._active == path_name:
+                self._active_cancelled = False
+
+    def record_switch(self, lazy_map: LazyMap) -> None:
+        if lazy_map.loaded:
+            self.hits += 1
+        else:
+            self.misses += 1
+        Logger.info(f"Map prefetch {'hit' if lazy_map.loaded else 'miss'} for {lazy_map.path_name} "
+                    f"(hits={self.hits}, misses={self.misses})")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs and not self._tasks:
+                    self._cond.wait()
+                if not self._jobs:
+                    name, task = self._tasks.popleft()
+                    self._task_names.discard(name)
+                else:
+                    task = None
+                    lazy_map, landing = self._jobs.popleft()
+                    if lazy_map.path_name not in self._pending:
+                        continue
+                    self._active = lazy_map.path_name
+                    self._active_cancelled = False
+            if task is not None:
+                try:
+                    task()
+                except Exception as e:
+                    Logger.warning(f"Background task {name} failed: {e}")
+                continue
+            try:
+                loaded = lazy_map.load()
+                if not self._unload_if_cancelled(lazy_map):
+                    loaded.warm_chunks(landing)
+                    # Chunks baked for a map evicted while warming would be untracked
+                    self._unload_if_cancelled(lazy_map)
+            except Exception as e:
+                Logger.warning(f"Failed to prefetch map {lazy_map.path_name}: {e}")
+            finally:
+                with self._cond:
+                    self._pending.discard(lazy_map.path_name)
+                    self._active = None
+
+    def _unload_if_cancelled(self, lazy_map: LazyMap) -> bool:
+        # Checked and unloaded under the condition lock so a concurrent claim
+        # either keeps the map or loads it again afterwards
+        with self._cond:
+            if not self._active_cancelled:
+                return False
+            lazy_map.unload()
+            return True
+
+map_prefetcher = MapPrefetcher()
@@ -0,0 +1,65 @@
+from collections import OrderedDict
+
+from src.utils import GameSettings
+
+Tile = tuple[int, int]
+# (map key, start tile, goal tile, goal_is_teleporter)
+PathKey = tuple[str, Tile, Tile, bool]
+
+class PathCache:
+    """
+    LRU cache of finished auto-navigation paths shared by every map.
+    Each path remembers the collision version of the map it was searched on
+    (see Map.set_collision); a lookup against a newer version is a miss and
+    drops the stale entry, so edited maps never replay an outdated path.
+    """
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, max_entries: int) -> None:
+        self._paths: OrderedDict[PathKey, tuple[int, list[Tile]]] = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: PathKey) -> bool:
+        return key in self._paths
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def get(self, key: PathKey, version: int, avoid: set[Tile] | None = None) -> list[Tile] | None:
+        """Return a copy of the cached path for key, or None if missing, stale or crossing an avoided tile."""
+        entry = self._paths.get(key)
+        if entry is not None and entry[0] != version:
+            del self._paths[key]
+            entry = None
+        # An NPC may have stepped onto the cached path since it was stored
+        if entry is None or (avoid and not avoid.isdisjoint(entry[1][:-1])):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._paths.move_to_end(key)
+        return list(entry[1])
+
+    def put(self, key: PathKey, version: int, path: list[Tile]) -> None:
+        if not path or self.max_entries <= 0:
+            return
+        self._paths[key] = (version, list(path))
+        self._paths.move_to_end(key)
+        while len(self._paths) > self.max_entries:
+            self._paths.popitem(last=False)
+            self.evictions += 1
+
+    def drop_map(self, map_key: str) -> None:
+        """Remove every path on one map."""
+        for key in [k for k in self._paths if k[0] == map_key]:
+            del self._paths[key]
+
+    def clear(self) -> None:
+        self._paths.clear()
+
+path_cache = PathCache(GameSettings.NAV_PATH_CACHE_SIZE)
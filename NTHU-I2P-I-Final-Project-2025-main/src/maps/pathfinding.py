@@ -0,0 +1,342 @@
+import time
+from array import array
+from heapq import heappush, heappop
+
+Tile = tuple[int, int]
+
+# Neighbour order per preferred direction; the first entry wins ties
+DIRECTIONS: dict[str | None, list[Tile]] = {
+    'RIGHT': [(1, 0), (0, 1), (0, -1), (-1, 0)],  # Right, Down, Up, Left
+    'LEFT': [(-1, 0), (0, 1), (0, -1), (1, 0)],   # Left, Down, Up, Right
+    'DOWN': [(0, 1), (1, 0), (-1, 0), (0, -1)],   # Down, Right, Left, Up
+    'UP': [(0, -1), (1, 0), (-1, 0), (0, 1)],     # Up, Right, Left, Down
+    # Default: prefer right then down
+    None: [(1, 0), (0, 1), (0, -1), (-1, 0)],
+}
+
+class PathSearch:
+    """
+    A* over a walkability grid (row-major, 1 = walkable) that can be run a
+    slice at a time: step() expands a bounded number of nodes and returns,
+    and the next call resumes where it stopped. Every step costs 1 and the
+    heuristic is the Manhattan distance, so each expanded tile's cost is
+    final and path_to() can answer for any of them once the search is done.
+    """
+    done: bool
+    path: list[Tile]
+    expanded: int
+
+    def __init__(self, walkable: bytearray, width: int, height: int, start: Tile, goal: Tile,
+                 prefer_direction: str | None = None, goal_is_teleporter: bool = False,
+                 avoid: set[Tile] | None = None) -> None:
+        self._walkable = walkable
+        self._w = width
+        self._h = height
+        self.start = start
+        self.goal = goal
+        self._directions = DIRECTIONS.get(prefer_direction, DIRECTIONS[None])
+        self._goal_is_teleporter = goal_is_teleporter
+        self._avoid = avoid or set()
+        self.done = False
+        self.path = []
+        self.expanded = 0
+
+        sx, sy = start
+        gx, gy = goal
+        # Flat tile indices (y * width + x); -1 marks a goal outside the map
+        self._goal = gy * width + gx if 0 <= gx < width and 0 <= gy < height else -1
+        # Per-tile arrays rather than dicts: no rehashing spikes mid-search
+        self._came_from = array("i", [-1]) * (width * height)
+        self._g_score = array("i", [-1]) * (width * height)
+        self._visited = bytearray(width * height)
+        if 0 <= sx < width and 0 <= sy < height:
+            self._g_score[sy * width + sx] = 0
+            self._open_set = [(0, sx, sy)]
+        else:
+            self._open_set = []
+
+    def step(self, max_nodes: int | None = None, max_seconds: float | None = None) -> bool:
+        """Expand at most max_nodes nodes or for about max_seconds; return True once the search has finished."""
+        if self.done:
+            return True
+        deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+        w, h = self._w, self._h
+        walkable, visited, avoid = self._walkable, self._visited, self._avoid
+        came_from, g_score, open_set = self._came_from, self._g_score, self._open_set
+        goal, goal_x, goal_y = self._goal, *self.goal
+        expanded = 0
+        while open_set:
+            if max_nodes is not None and expanded >= max_nodes:
+                break
+            # Reading the clock is not free, so only do it every few nodes
+            if deadline is not None and expanded & 15 == 15 and time.perf_counter() >= deadline:
+                break
+            _, x, y = heappop(open_set)
+            current = y * w + x
+
+            if visited[current]:
+                continue
+            visited[current] = 1
+            expanded += 1
+
+            if current == goal:
+                self.path = self._reconstruct(current)
+                self.done = True
+                break
+
+            # Simple cost = 1 (bushes already blocked in the walkable grid)
+            tentative_g = g_score[current] + 1
+            for dx, dy in self._directions:
+                nx, ny = x + dx, y + dy
+                if nx < 0 or ny < 0 or nx >= w or ny >= h:
+                    continue
+                neighbour = ny * w + nx
+                if visited[neighbour]:
+                    continue
+                if not walkable[neighbour] and not (self._goal_is_teleporter and neighbour == goal):
+                    continue
+                if avoid and (nx, ny) in avoid and neighbour != goal:
+                    continue
+
+                if g_score[neighbour] < 0 or tentative_g < g_score[neighbour]:
+                    came_from[neighbour] = current
+                    g_score[neighbour] = tentative_g
+                    # Manhattan distance heuristic
+                    f_score = tentative_g + abs(nx - goal_x) + abs(ny - goal_y)
+                    heappush(open_set, (f_score, nx, ny))
+        else:
+            # Open set exhausted: the goal is unreachable, path stays empty
+            self.done = True
+        self.expanded += expanded
+        return self.done
+
+    def path_to(self, tile: Tile) -> list[Tile] | None:
+        """Path from start to an already expanded tile, or None (also for the start itself)."""
+        x, y = tile
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return None
+        index = y * self._w + x
+        if not self._visited[index] or self._came_from[index] < 0:
+            return None
+        return self._reconstruct(index)
+
+    def _reconstruct(self, current: int) -> list[Tile]:
+        # Exclude start, include goal
+        path = []
+        while self._came_from[current] >= 0:
+            path.append((current % self._w, current // self._w))
+            current = self._came_from[current]
+        path.reverse()
+        return path
+
+class JumpPointSearch(PathSearch):
+    """
+    Jump point search for the 4-connected, uniform-cost grid: of all the
+    equally short paths, only those that move vertically first and turn
+    horizontally as late as walls allow are considered. Horizontal runs are
+    skipped until the goal or a tile where a wall beside the run ends (a
+    forced vertical turn); a vertical run stops where a horizontal run from
+    it would find such a tile. Only those jump points enter the open set, so
+    open areas cost a few expansions instead of one per tile.
+    Path lengths equal PathSearch's; the exact tiles may differ between
+    equally short paths, and prefer_direction has no effect.
+    path_to() only knows the jump points, so a nearby-tile fallback needs
+    the tile-by-tile search from as_astar().
+    A single vertical jump can scan most of the map, so step()'s max_nodes
+    counts tiles scanned rather than expansions, and a vertical jump that
+    runs out of budget stops at its current row and resumes there on the
+    next step(). expanded still counts jump points.
+    """
+
+    def __init__(self, walkable: bytearray, width: int, height: int, start: Tile, goal: Tile,
+                 prefer_direction: str | None = None, goal_is_teleporter: bool = False,
+                 avoid: set[Tile] | None = None) -> None:
+        super().__init__(walkable, width, height, start, goal, prefer_direction, goal_is_teleporter, avoid)
+        self._prefer_direction = prefer_direction
+        # Jumps test many tiles, so fold the door goal and avoided tiles into one grid
+        if goal_is_teleporter or avoid:
+            walkable = bytearray(walkable)
+            for x, y in avoid or ():
+                if 0 <= x < width and 0 <= y < height:
+                    walkable[y * width + x] = 0
+            if self._goal >= 0:
+                walkable[self._goal] = 1 if self._walkable[self._goal] or goal_is_teleporter else 0
+        self._passable = walkable
+        # Expansion cut short by the budget: (node, directions left to jump
+        # in, row the first one's vertical jump has reached)
+        self._expanding: tuple[int, list[Tile], int] | None = None
+
+    def as_astar(self) -> PathSearch:
+        """A fresh plain A* search for the same request."""
+        return PathSearch(self._walkable, self._w, self._h, self.start, self.goal,
+                          self._prefer_direction, self._goal_is_teleporter, self._avoid)
+
+    def step(self, max_nodes: int | None = None, max_seconds: float | None = None) -> bool:
+        """Scan at most about max_nodes tiles or work for about max_seconds; return True once the search has finished."""
+        if self.done:
+            return True
+        deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+        w = self._w
+        visited, came_from, g_score, open_set = self._visited, self._came_from, self._g_score, self._open_set
+        goal, goal_x, goal_y = self._goal, *self.goal
+        expanded = 0
+        # Tiles scanned by jumps plus the expansions themselves
+        work = 0
+        while True:
+            if self._expanding is None:
+                if not open_set:
+                    self.done = True
+                    break
+                if max_nodes is not None and work >= max_nodes:
+                    break
+                # Every expansion scans whole runs, so the clock is read each time
+                if deadline is not None and work and time.perf_counter() >= deadline:
+                    break
+                _, x, y = heappop(open_set)
+                current = y * w + x
+
+                if visited[current]:
+                    continue
+                visited[current] = 1
+                expanded += 1
+                work += 1
+
+                if current == goal:
+                    self.path = self._reconstruct(current)
+                    self.done = True
+                    break
+                self._expanding = (current, self._successor_directions(x, y, came_from[current]), y)
+
+            current, directions, row = self._expanding
+            x, y = current % w, current // w
+            g = g_score[current]
+            while directions:
+                dx, dy = directions[0]
+                if dx:
+                    jump, scanned = self._jump_horizontal(x, y, dx)
+                else:
+                    remaining = max_nodes - work if max_nodes is not None else None
+                    jump, row, scanned = self._jump_vertical(x, row, dy, remaining, deadline)
+                work += scanned
+                if jump == -2:
+                    # Out of budget mid-jump; the next step() carries on from row
+                    break
+                directions.pop(0)
+                row = y
+                if jump < 0 or visited[jump]:
+                    continue
+                jx, jy = jump % w, jump // w
+                tentative_g = g + abs(jx - x) + abs(jy - y)
+                if g_score[jump] < 0 or tentative_g < g_score[jump]:
+                    came_from[jump] = current
+                    g_score[jump] = tentative_g
+                    heappush(open_set, (tentative_g + abs(jx - goal_x) + abs(jy - goal_y), jx, jy))
+            if directions:
+                self._expanding = (current, directions, row)
+                break
+            self._expanding = None
+        self.expanded += expanded
+        return self.done
+
+    def _open(self, x: int, y: int) -> bool:
+        return 0 <= x < self._w and 0 <= y < self._h and self._passable[y * self._w + x] == 1
+
+    def _successor_directions(self, x: int, y: int, parent: int) -> list[Tile]:
+        if parent < 0:
+            return [(1, 0), (0, 1), (0, -1), (-1, 0)]
+        px, py = parent % self._w, parent // self._w
+        if py != y:
+            # Arrived vertically: keep going or turn either way
+            return [(0, 1 if y > py else -1), (1, 0), (-1, 0)]
+        dx = 1 if x > px else -1
+        directions = [(dx, 0)]
+        for dy in (1, -1):
+            # A wall beside the run just ended, so turning here cannot be done earlier
+            if self._open(x, y + dy) and not self._open(x - dx, y + dy):
+                directions.append((0, dy))
+        return directions
+
+    def _jump_horizontal(self, x: int, y: int, dx: int) -> tuple[int, int]:
+        # (jump point or -1, tiles scanned)
+        w, passable, goal = self._w, self._passable, self._goal
+        row = y * w
+        above = row - w if y > 0 else -1
+        below = row + w if y < self._h - 1 else -1
+        x0 = x
+        while True:
+            x += dx
+            if not (0 <= x < w) or passable[row + x] != 1:
+                return -1, abs(x - x0)
+            if row + x == goal:
+                return row + x, abs(x - x0)
+            if above >= 0 and passable[above + x] == 1 and passable[above + x - dx] != 1:
+                return row + x, abs(x - x0)
+            if below >= 0 and passable[below + x] == 1 and passable[below + x - dx] != 1:
+                return row + x, abs(x - x0)
+
+    def _jump_vertical(self, x: int, y: int, dy: int, max_tiles: int | None,
+                       deadline: float | None) -> tuple[int, int, int]:
+        # (jump point, -1 for none or -2 when stopped early, row reached, tiles
+        # scanned). Each row scans horizontal runs both ways, so the budget is
+        # checked per row; at least one row is always scanned
+        w, h, passable, goal = self._w, self._h, self._passable, self._goal
+        scanned = 0
+        while True:
+            if scanned and ((max_tiles is not None and scanned >= max_tiles)
+                            or (deadline is not None and time.perf_counter() >= deadline)):
+                return -2, y, scanned
+            y += dy
+            i = y * w + x
+            scanned += 1
+            if not (0 <= y < h) or passable[i] != 1:
+                return -1, y, scanned
+            if i == goal:
+                return i, y, scanned
+            for dx in (1, -1):
+                jump, tiles = self._jump_horizontal(x, y, dx)
+                scanned += tiles
+                if jump >= 0:
+                    return i, y, scanned
+
+    def _reconstruct(self, current: int) -> list[Tile]:
+        # Fill in the straight runs between jump points; exclude start, include goal
+        w = self._w
+        path = []
+        while self._came_from[current] >= 0:
+            parent = self._came_from[current]
+            x, y = current % w, current // w
+            px, py = parent % w, parent // w
+            sx, sy = (x > px) - (x < px), (y > py) - (y < py)
+            while (x, y) != (px, py):
+                path.append((x, y))
+                x, y = x - sx, y - sy
+            current = parent
+        path.reverse()
+        return path
+
+def compress_path(start: Tile, path: list[Tile]) -> list[Tile]:
+    """Keep only the tiles where path (walked from start) turns, plus its last tile: the ends of its straight runs."""
+    corners = []
+    prev = start
+    for i, tile in enumerate(path):
+        if i + 1 == len(path):
+            corners.append(tile)
+            break
+        nxt = path[i + 1]
+        if (tile[0] - prev[0], tile[1] - prev[1]) != (nxt[0] - tile[0], nxt[1] - tile[1]):
+            corners.append(tile)
+        prev = tile
+    return corners
+
+# Search implementations selectable through GameSettings.NAV_SEARCH_MODE
+SEARCH_MODES: dict[str, type[PathSearch]] = {
+    "astar": PathSearch,
+    "jps": JumpPointSearch,
+}
+
+def create_search(mode: str, walkable: bytearray, width: int, height: int, start: Tile, goal: Tile,
+                  prefer_direction: str | None = None, goal_is_teleporter: bool = False,
+                  avoid: set[Tile] | None = None) -> PathSearch:
+    """Create a search of the named mode, falling back to plain A* for unknown names."""
+    search_class = SEARCH_MODES.get(mode, PathSearch)
+    return search_class(walkable, width, height, start, goal, prefer_direction, goal_is_teleporter, avoid)
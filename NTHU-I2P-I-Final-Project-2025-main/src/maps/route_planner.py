@@ -0,0 +1,281 @@
+import heapq
+import threading
+from array import array
+from collections import deque, OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from src.utils import GameSettings, Logger, Teleport
+from .lazy_map import LazyMap
+from .map import Map
+
+Tile = tuple[int, int]
+
+@dataclass
+class RouteLeg:
+    map_key: str
+    goal: Tile
+    # Teleporter to take once goal is reached; None on the last leg
+    teleport: Teleport | None = None
+
+class RoutePlanner:
+    """
+    Plans walks that cross maps. Every map is a node group whose entry points
+    (the player's start and every teleporter landing spot) are connected to
+    its exits (teleporters and the destination) by BFS walking distances;
+    Dijkstra over that graph yields the shortest route in tiles walked.
+    The graph comes straight from the teleporter lists, so new maps or doors
+    need no routing code.
+    The same BFS fields, taken from a destination, are distance fields that
+    auto-navigation descends one neighbour at a time (see next_step).
+    Fields are only built from targets (teleporters and goals) and read at
+    the walker's tile, since BFS distances are symmetric; the least recently
+    used are dropped beyond NAV_FIELD_CACHE_SIZE.
+    Grids and fields remember the map's collision_version and are rebuilt
+    once Map.set_collision (or a reload dropping its edits) changes it.
+    Maps are loaded through resident_map (GameManager's residency tracking);
+    warm_fields runs on the map prefetch worker and only uses maps that are
+    already loaded, so it never loads or unloads one itself.
+    """
+
+    def __init__(self, maps: dict[str, LazyMap], resident_map: Callable[[str], Map] | None = None) -> None:
+        self.maps = maps
+        self._resident_map = resident_map if resident_map is not None else (lambda key: maps[key].load())
+        # Walkability and collision_version per map, kept after the map itself may be unloaded
+        self._grids: dict[str, tuple[bytearray, int, int, int]] = {}
+        # Guards _grids and _fields, which the prefetch worker fills too
+        self._lock = threading.Lock()
+        # BFS distance fields keyed by (map, target tile), least recently used first
+        self._fields: OrderedDict[tuple[str, int, int], array] = OrderedDict()
+        self.max_fields = GameSettings.NAV_FIELD_CACHE_SIZE
+
+    def plan(self, start_map: str, start: Tile, goal_map: str, goal: Tile) -> list[RouteLeg] | None:
+        """Return the legs leading from start on start_map to goal on goal_map, or None if unreachable."""
+        if start_map not in self.maps or goal_map not in self.maps:
+            return None
+        goal = self.walkable_goal(goal_map, goal)
+        start_node = (start_map, start)
+        best: dict[tuple[str, Tile], int] = {start_node: 0}
+        # node -> (previous node, teleporter taken from it)
+        came_from: dict[tuple[str, Tile], tuple[tuple[str, Tile], Teleport]] = {}
+        goal_cost: int | None = None
+        goal_from: tuple[str, Tile] | None = None
+        open_set = [(0, start_map, start)]
+        while open_set:
+            cost, map_key, tile = heapq.heappop(open_set)
+            if cost > best.get((map_key, tile), cost):
+                continue
+            if goal_cost is not None and cost >= goal_cost:
+                break
+            if map_key == goal_map:
+                d = self.distance(map_key, tile, goal, allow_adjacent=True)
+                if d is not None and (goal_cost is None or cost + d < goal_cost):
+                    goal_cost, goal_from = cost + d, (map_key, tile)
+            for tp in self.maps[map_key].teleporters:
+                if tp.destination not in self.maps:
+                    continue
+                door = self.teleport_tile(tp)
+                d = self.distance(map_key, tile, door, allow_adjacent=True)
+                if d is None:
+                    continue
+                node = (tp.destination, self.landing_tile(tp))
+                # Count the teleport itself as one step so door hopping is never free
+                if cost + d + 1 < best.get(node, cost + d + 2):
+                    best[node] = cost + d + 1
+                    came_from[node] = ((map_key, tile), tp)
+                    heapq.heappush(open_set, (cost + d + 1, *node))
+        if goal_from is None:
+            return None
+
+        legs = [RouteLeg(goal_map, goal)]
+        node = goal_from
+        while node in came_from:
+            node, tp = came_from[node]
+            legs.append(RouteLeg(node[0], self.teleport_tile(tp), tp))
+        legs.reverse()
+        Logger.debug(f"Route {start_map}{start} -> {goal_map}{goal}: "
+                     f"{' -> '.join(f'{leg.map_key}{leg.goal}' for leg in legs)} ({goal_cost} tiles)")
+        return legs
+
+    def walkable_goal(self, map_key: str, goal: Tile, load: bool = True) -> Tile:
+        """
+        Return goal, or the nearest walkable tile to it when it is outside the
+        map or blocked. Teleporter tiles are skipped so arriving never warps away.
+        """
+        grid, w, h = self._walkable(map_key, load)
+        gx, gy = goal
+        if 0 <= gx < w and 0 <= gy < h and grid[gy * w + gx]:
+            return goal
+        doors = {self.teleport_tile(tp) for tp in self.maps[map_key].teleporters}
+        best: Tile | None = None
+        best_d = -1
+        for i, walkable in enumerate(grid):
+            if walkable:
+                x, y = i % w, i // w
+                d = abs(x - gx) + abs(y - gy)
+                if (best is None or d < best_d) and (x, y) not in doors:
+                    best, best_d = (x, y), d
+        return best if best is not None else goal
+
+    @staticmethod
+    def teleport_tile(tp: Teleport) -> Tile:
+        return int(tp.pos.x) // GameSettings.TILE_SIZE, int(tp.pos.y) // GameSettings.TILE_SIZE
+
+    def landing_tile(self, tp: Teleport) -> Tile:
+        """Tile the player appears on after taking tp (see GameManager.try_switch_map)."""
+        if tp.target_x is not None and tp.target_y is not None:
+            return int(tp.target_x), int(tp.target_y)
+        spawn = self.maps[tp.destination].spawn
+        return int(spawn.x) // GameSettings.TILE_SIZE, int(spawn.y) // GameSettings.TILE_SIZE
+
+    def distance(self, map_key: str, start: Tile, goal: Tile, allow_adjacent: bool = False) -> int | None:
+        """
+        Walking distance in tiles between two tiles of one map, or None.
+        With allow_adjacent an unwalkable goal (e.g. a teleporter drawn on a
+        collision tile) counts as reached from any walkable neighbour.
+        """
+        grid, w, h = self._walkable(map_key)
+        if start == goal:
+            return 0
+        gx, gy = goal
+        sx, sy = start
+        if not (0 <= gx < w and 0 <= gy < h and 0 <= sx < w and 0 <= sy < h):
+            return None
+        if not grid[gy * w + gx] and not allow_adjacent:
+            return None
+        # Read off the goal's field: the start is usually a one-off tile
+        # (where the player stands), the goal a teleporter or destination
+        field = self._field(map_key, goal)
+        d = field[sy * w + sx]
+        if d >= 0 or grid[sy * w + sx]:
+            return d if d >= 0 else None
+        # An unwalkable start (e.g. landing on a door) is left through a neighbour
+        around = [field[y * w + x] for x, y in ((sx + 1, sy), (sx - 1, sy), (sx, sy + 1), (sx, sy - 1))
+                  if 0 <= x < w and 0 <= y < h and field[y * w + x] >= 0]
+        return min(around) + 1 if around else None
+
+    def warm_fields(self, destinations: list[tuple[str, Tile]]) -> None:
+        """
+        Precompute, on the map prefetch worker, the distance fields to every
+        teleporter and to each (map, tile) destination. Maps that were never
+        loaded are skipped; their fields are built when a plan needs them.
+        """
+        from .map_prefetcher import map_prefetcher
+        map_prefetcher.submit("route-fields", lambda: self._warm(list(destinations)))
+
+    def _warm(self, destinations: list[tuple[str, Tile]]) -> None:
+        for map_key, lazy_map in self.maps.items():
+            if self._walkable(map_key, load=False) is None:
+                continue
+            for tp in lazy_map.teleporters:
+                self._field(map_key, self.teleport_tile(tp), load=False)
+            for dest_key, tile in destinations:
+                if dest_key == map_key:
+                    self._field(map_key, self.walkable_goal(map_key, tile, load=False), load=False)
+
+    def has_field(self, map_key: str, goal: Tile) -> bool:
+        with self._lock:
+            return (map_key, *goal) in self._fields
+
+    def next_step(self, map_key: str, tile: Tile, goal: Tile) -> Tile | None:
+        """
+        Return the neighbour of tile one step closer to goal on goal's distance
+        field, or None at the goal or when goal cannot be reached from tile.
+        Ties prefer right, down, up, left like the path searches' default order.
+        """
+        grid, w, h = self._walkable(map_key)
+        field = self._field(map_key, goal)
+        x, y = tile
+        here = field[y * w + x] if 0 <= x < w and 0 <= y < h else -1
+        if here == 0:
+            return None
+        best: Tile | None = None
+        best_d = here if here > 0 else -1
+        for nx, ny in ((x + 1, y), (x, y + 1), (x, y - 1), (x - 1, y)):
+            if 0 <= nx < w and 0 <= ny < h:
+                d = field[ny * w + nx]
+                # Off the field (e.g. standing on a door) any reachable neighbour will do
+                if d >= 0 and (best_d < 0 or d < best_d):
+                    best, best_d = (nx, ny), d
+        return best
+
+    def next_run(self, map_key: str, tile: Tile, goal: Tile, avoid: set[Tile] | None = None) -> list[Tile]:
+        """
+        Tiles next_step walks from tile towards goal while keeping one
+        direction: the straight run to follow before the next turn. The run
+        ends before any avoided tile.
+        """
+        run: list[Tile] = []
+        direction: Tile | None = None
+        while True:
+            step = self.next_step(map_key, tile, goal)
+            if step is None or (avoid and step in avoid):
+                return run
+            step_direction = (step[0] - tile[0], step[1] - tile[1])
+            if direction is not None and step_direction != direction:
+                return run
+            run.append(step)
+            direction, tile = step_direction, step
+
+    def _walkable(self, map_key: str, load: bool = True) -> tuple[bytearray, int, int] | None:
+        # Without load (on the prefetch worker) only a map that is loaded
+        # right now is read; None means its grid is not known yet
+        cached = self._grid(map_key, load)
+        return cached[:3] if cached is not None else None
+
+    def _grid(self, map_key: str, load: bool) -> tuple[bytearray, int, int, int] | None:
+        loaded = self.maps[map_key].peek()
+        with self._lock:
+            cached = self._grids.get(map_key)
+            if cached is not None and loaded is not None and cached[3] != loaded.collision_version:
+                # Collisions changed since the grid was taken: drop it and
+                # every field built over it
+                del self._grids[map_key]
+                for key in [key for key in self._fields if key[0] == map_key]:
+                    del self._fields[key]
+                cached = None
+        if cached is None:
+            if load:
+                loaded = self._resident_map(map_key)
+            else:
+                loaded = self.maps[map_key].peek()
+                if loaded is None:
+                    return None
+            cached = (loaded.walkable_grid, loaded.width, loaded.height, loaded.collision_version)
+            with self._lock:
+                cached = self._grids.setdefault(map_key, cached)
+        return cached
+
+    def _field(self, map_key: str, start: Tile, load: bool = True) -> array:
+        # BFS distances (-1 = unreachable) from start over walkable tiles; the
+        # start tile itself may be unwalkable, e.g. when landing on a door
+        key = (map_key, *start)
+        entry = self._grid(map_key, load)
+        grid, w, h, _ = entry
+        with self._lock:
+            field = self._fields.get(key)
+            if field is not None:
+                self._fields.move_to_end(key)
+                return field
+        field = array("i", [-1]) * (w * h)
+        sx, sy = start
+        if 0 <= sx < w and 0 <= sy < h:
+            field[sy * w + sx] = 0
+            queue = deque([sy * w + sx])
+            while queue:
+                i = queue.popleft()
+                d = field[i] + 1
+                x = i % w
+                for n in (i - w if i >= w else -1, i + w if i + w < w * h else -1,
+                          i - 1 if x > 0 else -1, i + 1 if x < w - 1 else -1):
+                    if n >= 0 and field[n] < 0 and grid[n]:
+                        field[n] = d
+                        queue.append(n)
+        with self._lock:
+            # Skip storing a field whose grid was invalidated meanwhile
+            if self._grids.get(map_key) is not entry:
+                return field
+            self._fields[key] = field
+            while len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        return field
@@ -0,0 +1,115 @@
+import pygame as pg
+from typing import Hashable, Iterator
+
+Cell = tuple[int, int]
+
+class SpatialHash:
+    """
+    Uniform-grid spatial index of rects on one map. Every entry (any hashable
+    key, e.g. an entity or a remote player id) is listed in each cell its rect
+    overlaps, so a query only looks at the handful of cells around the area
+    asked about instead of at every entry on the map.
+    Entries carry a tag ("trainer", "los", "npc", ...) to tell kinds apart.
+    """
+    cell_size: int
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[Cell, set[Hashable]] = {}
+        # key -> (rect, tag, cells the rect is listed in)
+        self._entries: dict[Hashable, tuple[pg.Rect, str | None, list[Cell]]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cells_for(self, rect: pg.Rect) -> Iterator[Cell]:
+        cs = self.cell_size
+        # Empty rects still occupy the cell of their corner
+        for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1 if rect.h > 0 else rect.top // cs + 1):
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1 if rect.w > 0 else rect.left // cs + 1):
+                yield cx, cy
+
+    def insert(self, key: Hashable, rect: pg.Rect, tag: str | None = None) -> None:
+        """Add key at rect, replacing any earlier entry for it."""
+        if key in self._entries:
+            self.remove(key)
+        cells = list(self._cells_for(rect))
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        self._entries[key] = (pg.Rect(rect), tag, cells)
+
+    def move(self, key: Hashable, rect: pg.Rect) -> None:
+        """Update key's rect; only touches the cell lists if it crossed a cell border."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        old_rect, tag, cells = entry
+        if old_rect == rect:
+            return
+        cs = self.cell_size
+        if (old_rect.left // cs, old_rect.top // cs, (old_rect.right - 1) // cs, (old_rect.bottom - 1) // cs) \
+                == (rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs):
+            old_rect.update(rect)
+            return
+        self.insert(key, rect, tag)
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for cell in entry[2]:
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def rect_of(self, key: Hashable) -> pg.Rect | None:
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def keys(self, tag: str | None = None) -> list[Hashable]:
+        """Every key (with tag, if given)."""
+        return [key for key, entry in self._entries.items() if tag is None or entry[1] == tag]
+
+    def query_rect(self, rect: pg.Rect, tag: str | None = None) -> list[Hashable]:
+        """Keys (with tag, if given) whose rect overlaps rect."""
+        found: list[Hashable] = []
+        seen: set[Hashable] = set()
+        for cell in self._cells_for(rect):
+            for key in self._cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                other, other_tag, _ = self._entries[key]
+                if (tag is None or other_tag == tag) and other.colliderect(rect):
+                    found.append(key)
+        return found
+
+    def query_radius(self, x: float, y: float, radius: float, tag: str | None = None) -> list[Hashable]:
+        """Keys (with tag, if given) whose rect comes within radius of (x, y)."""
+        area = pg.Rect(int(x - radius), int(y - radius), int(2 * radius) + 2, int(2 * radius) + 2)
+        found: list[Hashable] = []
+        seen: set[Hashable] = set()
+        r2 = radius * radius
+        for cell in self._cells_for(area):
+            for key in self._cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                other, other_tag, _ = self._entries[key]
+                if tag is not None and other_tag != tag:
+                    continue
+                # Distance from the point to the nearest point of the rect
+                nx = min(max(x, other.left), other.right)
+                ny = min(max(y, other.top), other.bottom)
+                if (nx - x) ** 2 + (ny - y) ** 2 <= r2:
+                    found.append(key)
+        return found
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entries.clear()
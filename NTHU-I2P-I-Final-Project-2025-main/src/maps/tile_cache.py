@@ -0,0 +1,56 @@
+import pygame as pg
+from typing import Callable
+
+# (tileset source, local tile id, flip flags, size in pixels)
+TileKey = tuple[str, int, tuple, int]
+# (tileset source, local tile id, flip flags)
+SourceKey = tuple[str, int, tuple]
+
+class TileCache:
+    """
+    Scaled tile images shared by every Map that uses the same tileset.
+    Each unique tile is scaled once per run instead of once per map cell.
+    The decoded images are kept too, so a tile wanted at a new size (e.g. a
+    minimap) is scaled from memory instead of decoding its tileset again.
+    """
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._tiles: dict[TileKey, pg.Surface | None] = {}
+        self._sources: dict[SourceKey, pg.Surface | None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._tiles
+
+    def has_source(self, key: SourceKey) -> bool:
+        """Whether the tile's decoded image is known, so any size of it can be served without load()."""
+        return key in self._sources
+
+    def get(self, key: TileKey, load: Callable[[], pg.Surface | None]) -> pg.Surface | None:
+        """Return the scaled tile for key, scaling load() (called once per tile) on the first request."""
+        if key in self._tiles:
+            self.hits += 1
+            return self._tiles[key]
+        self.misses += 1
+        source_key = key[:3]
+        if source_key in self._sources:
+            image = self._sources[source_key]
+        else:
+            image = self._sources[source_key] = load()
+        if image is not None:
+            size = key[3]
+            image = pg.transform.scale(image, (size, size))
+        self._tiles[key] = image
+        return image
+
+    def clear(self) -> None:
+        self._tiles.clear()
+        self._sources.clear()
+
+tile_cache = TileCache()
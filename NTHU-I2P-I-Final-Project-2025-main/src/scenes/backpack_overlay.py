@@ -1,6 +1,6 @@
 import pygame as pg
 from typing import TYPE_CHECKING
-from src.utils import GameSettings
+from src.utils import GameSettings, AssetBundle
 from src.core.services import resource_manager
 from src.scenes.ui_control import Checkbox, Slider
 
@@ -15,6 +15,8 @@ class BackpackOverlay:
   the provided GameManager instance so it's synchronized with saves/loads
   that update the manager.
   """
+  # Acquired by the scene that owns the overlay
+  ASSETS = AssetBundle(images=("UI/raw/UI_Flat_Banner03a.png",))
 
   def __init__(self, game_manager: "GameManager"):
     self.game_manager = game_manager
@@ -29,9 +31,10 @@ class BackpackOverlay:
     # Visuals
     self.padding = 12
     self.line_height = 48  # banner高度
-    # banner asset
+    # banner asset (scaled variants come from resource_manager per row size)
+    self.banner_path = "UI/raw/UI_Flat_Banner03a.png"
     try:
-      self.banner_img = resource_manager.get_image("UI/raw/UI_Flat_Banner03a.png")
+      self.banner_img = resource_manager.get_image(self.banner_path)
     except Exception:
       self.banner_img = None
     # 滾動狀態
@@ -122,7 +125,7 @@ class BackpackOverlay:
       # banner鋪滿整行
       if self.banner_img:
         try:
-          banner = pg.transform.scale(self.banner_img, (info_box_w, info_box_h))
+          banner = resource_manager.get_image(self.banner_path, (info_box_w, info_box_h))
           screen.blit(banner, (content_x, row_y))
         except Exception:
           pg.draw.rect(screen, (245, 235, 200), (content_x, row_y, info_box_w, info_box_h))
@@ -136,8 +139,7 @@ class BackpackOverlay:
       try:
         sprite_path = m.get("sprite_path") if isinstance(m, dict) else None
         if sprite_path:
-          img = resource_manager.get_image(sprite_path)
-          img = pg.transform.scale(img, (thumb_size, thumb_size))
+          img = resource_manager.get_image(sprite_path, (thumb_size, thumb_size))
           screen.blit(img, (thumb_x, thumb_y))
       except Exception:
         pass
@@ -217,8 +219,7 @@ class BackpackOverlay:
       try:
         sprite_path = it.get("sprite_path") if isinstance(it, dict) else None
         if sprite_path:
-          img = resource_manager.get_image(sprite_path)
-          img = pg.transform.scale(img, (thumb_w, thumb_h))
+          img = resource_manager.get_image(sprite_path, (thumb_w, thumb_h))
           screen.blit(img, (content_x + col_w + col_gap, y_offset - 4))
       except Exception:
         pass
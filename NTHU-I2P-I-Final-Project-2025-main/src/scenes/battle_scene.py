@@ -2,13 +2,33 @@ import pygame as pg
 import os
 from src.scenes.scene import Scene
 from src.core.services import scene_manager, sound_manager, resource_manager
-from src.utils import Logger, GameSettings
+from src.utils import Logger, GameSettings, AssetBundle
 from src.utils.definition import effectiveness_multiplier
 from typing import override
 from src.interface.components import Button
 import re
 
 class BattleScene(Scene):
+    # UI assets; drawing asks resource_manager for the scaled size it needs
+    BG_PATH = "backgrounds/background1.png"
+    UI_FRAME_PATH = "UI/raw/UI_Flat_Frame03a.png"
+    BUTTON_PATH = "UI/raw/UI_Flat_Button02a_1.png"
+    BANNER_PATH = "UI/raw/UI_Flat_Banner03a.png"
+    NAME_FRAME_PATH = "UI/raw/UI_Flat_Frame01a.png"
+    # Sizes shared by the bundle below and the drawing code (scaled variants are cached per size)
+    BG_SIZE = (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+    BOTTOM_PANEL_SIZE = (GameSettings.SCREEN_WIDTH, 120)
+    ACTION_BUTTON_SIZE = (160, 44)
+    # Monster sprites depend on the fight and are left to the resource manager's LRU
+    ASSETS = AssetBundle(
+        images=(BANNER_PATH, NAME_FRAME_PATH),
+        scaled=(
+            (BG_PATH, BG_SIZE),
+            (UI_FRAME_PATH, BOTTOM_PANEL_SIZE),
+            ("UI/raw/UI_Flat_Button02a_1.png", ACTION_BUTTON_SIZE), ("UI/raw/UI_Flat_Button02a_2.png", ACTION_BUTTON_SIZE),
+        ),
+    )
+
     def __init__(self):
         super().__init__()
         # Minimal battle state; will be initialized in enter()
@@ -20,31 +40,33 @@ class BattleScene(Scene):
         self.font = pg.font.SysFont(None, 28)
         # UI assets (loaded in init so we can reuse)
         try:
-            self.bg_img = resource_manager.get_image("backgrounds/background1.png")
+            self.bg_img = resource_manager.get_image(self.BG_PATH)
         except Exception:
             self.bg_img = None
         try:
-            self.ui_frame = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
+            self.ui_frame = resource_manager.get_image(self.UI_FRAME_PATH)
         except Exception:
             self.ui_frame = None
         # button image (use a flat button asset)
         try:
-            self.button_img = resource_manager.get_image("UI/raw/UI_Flat_Button02a_1.png")
+            self.button_img = resource_manager.get_image(self.BUTTON_PATH)
         except Exception:
             self.button_img = None
         # banner image to place behind sprites
         try:
-            self.banner_img = resource_manager.get_image("UI/raw/UI_Flat_Banner03a.png")
+            self.banner_img = resource_manager.get_image(self.BANNER_PATH)
         except Exception:
             self.banner_img = None
         # small name frame for labels
         try:
-            self.name_frame = resource_manager.get_image("UI/raw/UI_Flat_Frame01a.png")
+            self.name_frame = resource_manager.get_image(self.NAME_FRAME_PATH)
         except Exception:
             self.name_frame = None
+        # Scaled monster sprites/thumbnails: (id(surface), size) -> (surface, scaled copy)
+        self._scaled_sprites: dict[tuple[int, tuple[int, int]], tuple[pg.Surface, pg.Surface]] = {}
 
         # Buttons area (four actions)
-        btn_w, btn_h = 160, 44
+        btn_w, btn_h = self.ACTION_BUTTON_SIZE
         gap = 20
         total_w = btn_w * 4 + gap * 3
         start_x = (GameSettings.SCREEN_WIDTH - total_w) // 2
@@ -156,6 +178,9 @@ class BattleScene(Scene):
                     name, ext = os.path.splitext(base_path)
                     for s in suffixes:
                         candidate = f"{name}{s}{ext}"
+                        # Most variants do not exist; the manifest says so without a failed load
+                        if not resource_manager.has_image(candidate):
+                            continue
                         try:
                             return resource_manager.get_image(candidate)
                         except Exception:
@@ -174,6 +199,8 @@ class BattleScene(Scene):
                     # try keyword variants first
                     candidates = [f"{name}{keyword}{ext}"] + [f"{name}{keyword}{s}{ext}" for s in suffixes]
                     for c in candidates:
+                        if not resource_manager.has_image(c):
+                            continue
                         try:
                             return resource_manager.get_image(c)
                         except Exception:
@@ -441,6 +468,17 @@ class BattleScene(Scene):
         # cleanup if needed
         if hasattr(scene_manager, "battle_target"):
             delattr(scene_manager, "battle_target")
+        self._scaled_sprites.clear()
+
+    def _scaled(self, surface: pg.Surface, size: tuple[int, int]) -> pg.Surface:
+        """surface scaled to size, rescaled only when the surface (e.g. after a switch) or size changes."""
+        key = (id(surface), size)
+        entry = self._scaled_sprites.get(key)
+        # Holding the surface keeps its id from being reused while the entry exists
+        if entry is None or entry[0] is not surface:
+            entry = (surface, pg.transform.scale(surface, size))
+            self._scaled_sprites[key] = entry
+        return entry[1]
 
     @override
     def update(self, dt: float) -> None:
@@ -496,7 +534,7 @@ class BattleScene(Scene):
         # Draw background image if available
         if self.bg_img:
             try:
-                bg = pg.transform.scale(self.bg_img, (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+                bg = resource_manager.get_image(self.BG_PATH, self.BG_SIZE)
                 screen.blit(bg, (0, 0))
             except Exception:
                 screen.fill((30, 30, 60))
@@ -515,7 +553,7 @@ class BattleScene(Scene):
         if self.enemy_sprite:
             try:
                 # 使用上方的 (sprite_w, sprite_h) 對敵方精靈做縮放，控制顯示大小
-                es = pg.transform.scale(self.enemy_sprite, (sprite_w, sprite_h))
+                es = self._scaled(self.enemy_sprite, (sprite_w, sprite_h))
                 # 將縮放後的敵方精靈繪製到畫面上，位置由 (ex, ey) 決定
                 screen.blit(es, (ex, ey))
             except Exception:
@@ -530,7 +568,7 @@ class BattleScene(Scene):
         if self.player_sprite:
             try:
                 # 使用上方的 (sprite_w, sprite_h) 對我方精靈做縮放，控制顯示大小
-                ps = pg.transform.scale(self.player_sprite, (sprite_w+50, sprite_h+50))
+                ps = self._scaled(self.player_sprite, (sprite_w+50, sprite_h+50))
                 # 將縮放後的我方精靈繪製到畫面上，位置由 (px, py) 決定
                 screen.blit(ps, (px, py))
             except Exception:
@@ -546,13 +584,13 @@ class BattleScene(Scene):
         # use banner image for the name box background
         if self.banner_img:
             try:
-                nb = pg.transform.scale(self.banner_img, (name_box_w, name_box_h))
+                nb = resource_manager.get_image(self.BANNER_PATH, (name_box_w, name_box_h))
                 screen.blit(nb, (enemy_name_x, enemy_name_y))
             except Exception:
                 pg.draw.rect(screen, (245, 235, 200), (enemy_name_x, enemy_name_y, name_box_w, name_box_h))
         elif self.name_frame:
             try:
-                nf = pg.transform.scale(self.name_frame, (name_box_w, name_box_h))
+                nf = resource_manager.get_image(self.NAME_FRAME_PATH, (name_box_w, name_box_h))
                 screen.blit(nf, (enemy_name_x, enemy_name_y))
             except Exception:
                 pg.draw.rect(screen, (245, 235, 200), (enemy_name_x, enemy_name_y, name_box_w, name_box_h))
@@ -564,7 +602,7 @@ class BattleScene(Scene):
         thumb_y = enemy_name_y - 12
         if self.enemy_thumb:
             try:
-                thumb_s = pg.transform.scale(self.enemy_thumb, (thumb_size, thumb_size))
+                thumb_s = self._scaled(self.enemy_thumb, (thumb_size, thumb_size))
                 tx = enemy_name_x + 16
                 screen.blit(thumb_s, (tx, thumb_y))
                 text_x_offset += thumb_size + 14
@@ -614,13 +652,13 @@ class BattleScene(Scene):
         player_name_y = GameSettings.SCREEN_HEIGHT - 220  # 上移40px，避免被底部UI遮住
         if self.banner_img:
             try:
-                nb2 = pg.transform.scale(self.banner_img, (name_box_w, name_box_h))
+                nb2 = resource_manager.get_image(self.BANNER_PATH, (name_box_w, name_box_h))
                 screen.blit(nb2, (player_name_x, player_name_y))
             except Exception:
                 pg.draw.rect(screen, (245, 235, 200), (player_name_x, player_name_y, name_box_w, name_box_h))
         elif self.name_frame:
             try:
-                nf2 = pg.transform.scale(self.name_frame, (name_box_w, name_box_h))
+                nf2 = resource_manager.get_image(self.NAME_FRAME_PATH, (name_box_w, name_box_h))
                 screen.blit(nf2, (player_name_x, player_name_y))
             except Exception:
                 pg.draw.rect(screen, (245, 235, 200), (player_name_x, player_name_y, name_box_w, name_box_h))
@@ -632,7 +670,7 @@ class BattleScene(Scene):
         p_thumb_y = player_name_y - 12
         if self.player_thumb:
             try:
-                p_thumb_s = pg.transform.scale(self.player_thumb, (thumb_size, thumb_size))
+                p_thumb_s = self._scaled(self.player_thumb, (thumb_size, thumb_size))
                 ptx = player_name_x + 16
                 screen.blit(p_thumb_s, (ptx, p_thumb_y))
                 p_text_x_offset += thumb_size + 4
@@ -705,11 +743,11 @@ class BattleScene(Scene):
 
 
         # Draw bottom UI frame
-        panel_h = 120
+        panel_h = self.BOTTOM_PANEL_SIZE[1]
         panel_y = GameSettings.SCREEN_HEIGHT - panel_h
         if self.ui_frame:
             try:
-                frame = pg.transform.scale(self.ui_frame, (GameSettings.SCREEN_WIDTH, panel_h))
+                frame = resource_manager.get_image(self.UI_FRAME_PATH, self.BOTTOM_PANEL_SIZE)
                 screen.blit(frame, (0, panel_y))
             except Exception:
                 pg.draw.rect(screen, (20,20,20), (0, panel_y, GameSettings.SCREEN_WIDTH, panel_h))
@@ -726,7 +764,7 @@ class BattleScene(Scene):
                 r = self.button_rects[i]
                 if self.button_img:
                     try:
-                        bsurf = pg.transform.scale(self.button_img, (r.w, r.h))
+                        bsurf = resource_manager.get_image(self.BUTTON_PATH, (r.w, r.h))
                         screen.blit(bsurf, (r.x, r.y))
                     except Exception:
                         pg.draw.rect(screen, (240,240,240), r)
@@ -765,7 +803,7 @@ class BattleScene(Scene):
         # Draw overlay panel background
         if self.ui_frame:
             try:
-                frame = pg.transform.scale(self.ui_frame, (overlay_rect.w, overlay_rect.h))
+                frame = resource_manager.get_image(self.UI_FRAME_PATH, (overlay_rect.w, overlay_rect.h))
                 screen.blit(frame, (overlay_rect.x, overlay_rect.y))
             except Exception:
                 pg.draw.rect(screen, (240, 235, 220), overlay_rect)
@@ -827,7 +865,7 @@ class BattleScene(Scene):
             banner_w = content_w - 100  # Leave space for button
             if self.banner_img:
                 try:
-                    banner = pg.transform.scale(self.banner_img, (banner_w, row_h - 10))
+                    banner = resource_manager.get_image(self.BANNER_PATH, (banner_w, row_h - 10))
                     screen.blit(banner, (content_x, row_y))
                 except Exception:
                     pg.draw.rect(screen, (245, 235, 200), (content_x, row_y, banner_w, row_h - 10))
@@ -848,8 +886,7 @@ class BattleScene(Scene):
                         idx_num = match.group(1)
                         thumb_path = f"menu_sprites/menusprite{idx_num}.png"
                         try:
-                            img = resource_manager.get_image(thumb_path)
-                            img = pg.transform.scale(img, (thumb_size, thumb_size))
+                            img = resource_manager.get_image(thumb_path, (thumb_size, thumb_size))
                             screen.blit(img, (thumb_x, thumb_y))
                         except Exception:
                             pass
@@ -900,7 +937,7 @@ class BattleScene(Scene):
                 # Draw button
                 if self.button_img:
                     try:
-                        btn_surf = pg.transform.scale(self.button_img, (btn_w, btn_h))
+                        btn_surf = resource_manager.get_image(self.BUTTON_PATH, (btn_w, btn_h))
                         screen.blit(btn_surf, (btn_x, btn_y))
                     except Exception:
                         pg.draw.rect(screen, (200, 200, 200), btn_rect)
@@ -1132,6 +1169,8 @@ class BattleScene(Scene):
                         ]
                         loaded_sprite = None
                         for variant in pokemon_variants:
+                            if not resource_manager.has_image(variant):
+                                continue
                             try:
                                 loaded_sprite = resource_manager.get_image(variant)
                                 if loaded_sprite:
@@ -1253,6 +1292,8 @@ class BattleScene(Scene):
                         ]
                         loaded_sprite = None
                         for variant in pokemon_variants:
+                            if not resource_manager.has_image(variant):
+                                continue
                             try:
                                 loaded_sprite = resource_manager.get_image(variant)
                                 if loaded_sprite:
@@ -1374,7 +1415,7 @@ class BattleScene(Scene):
         # Draw overlay panel background
         if self.ui_frame:
             try:
-                frame = pg.transform.scale(self.ui_frame, (overlay_rect.w, overlay_rect.h))
+                frame = resource_manager.get_image(self.UI_FRAME_PATH, (overlay_rect.w, overlay_rect.h))
                 screen.blit(frame, (overlay_rect.x, overlay_rect.y))
             except Exception:
                 pg.draw.rect(screen, (240, 235, 220), overlay_rect)
@@ -1446,7 +1487,7 @@ class BattleScene(Scene):
             banner_w = content_w - 120  # Leave space for button
             if self.banner_img:
                 try:
-                    banner = pg.transform.scale(self.banner_img, (banner_w, row_h - 10))
+                    banner = resource_manager.get_image(self.BANNER_PATH, (banner_w, row_h - 10))
                     screen.blit(banner, (content_x, row_y))
                 except Exception:
                     pg.draw.rect(screen, (245, 235, 200), (content_x, row_y, banner_w, row_h - 10))
@@ -1486,7 +1527,7 @@ class BattleScene(Scene):
             # Draw button
             if self.button_img:
                 try:
-                    btn_surf = pg.transform.scale(self.button_img, (btn_w, btn_h))
+                    btn_surf = resource_manager.get_image(self.BUTTON_PATH, (btn_w, btn_h))
                     screen.blit(btn_surf, (btn_x, btn_y))
                 except Exception:
                     pg.draw.rect(screen, (200, 200, 200), use_btn_rect)
@@ -1514,7 +1555,7 @@ class BattleScene(Scene):
         
         if self.button_img:
             try:
-                close_surf = pg.transform.scale(self.button_img, (close_w, close_h))
+                close_surf = resource_manager.get_image(self.BUTTON_PATH, (close_w, close_h))
                 screen.blit(close_surf, (close_x, close_y))
             except Exception:
                 pg.draw.rect(screen, (220, 220, 220), close_rect)
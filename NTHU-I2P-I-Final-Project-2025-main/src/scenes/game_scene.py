@@ -4,15 +4,46 @@ import time
 
 from src.scenes.scene import Scene
 from src.core import GameManager, OnlineManager
-from src.utils import Logger, PositionCamera, GameSettings, Position
+from src.utils import Logger, PositionCamera, GameSettings, Position, AssetBundle
 from src.core.services import sound_manager, scene_manager
 from src.sprites import Sprite, Animation
 from src.interface.components import Button
 from src.scenes.backpack_overlay import BackpackOverlay
 from src.scenes.shop_overlay import ShopOverlay
+from src.maps.route_planner import RouteLeg
+from src.maps.pathfinding import PathSearch, JumpPointSearch, compress_path, create_search
+from src.maps.hierarchical import ClusterSearch
+from src.maps.path_cache import path_cache
 from typing import override
 
 class GameScene(Scene):
+    # HUD, overlay panels and the overworld; the shop and backpack overlays ride along
+    # Sizes shared by the bundle below and the buttons and panels drawn with them,
+    # since a scaled variant is cached (and pinned) per size
+    HUD_BUTTON_SIZE = (48, 48)
+    OVERLAY_BUTTON_SIZE = (70, 70)
+    NAVIGATE_BUTTON_SIZE = (80, 80)
+    PANEL_SIZE = (700, 500)
+    NAVIGATE_PANEL_SIZE = (700, 400)
+    ASSETS = AssetBundle(
+        images=("character/ow1.png",),
+        scaled=(
+            ("exclamation.png", (GameSettings.TILE_SIZE // 2, GameSettings.TILE_SIZE // 2)),
+            ("ingame_ui/options1.png", (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)),
+            ("UI/button_backpack.png", HUD_BUTTON_SIZE), ("UI/button_backpack_hover.png", HUD_BUTTON_SIZE),
+            ("UI/button_setting.png", HUD_BUTTON_SIZE), ("UI/button_setting_hover.png", HUD_BUTTON_SIZE),
+            ("UI/button_play.png", HUD_BUTTON_SIZE), ("UI/button_play_hover.png", HUD_BUTTON_SIZE),
+            ("UI/button_x.png", HUD_BUTTON_SIZE), ("UI/button_x_hover.png", HUD_BUTTON_SIZE),
+            ("UI/button_save.png", OVERLAY_BUTTON_SIZE), ("UI/button_save_hover.png", OVERLAY_BUTTON_SIZE),
+            ("UI/button_load.png", OVERLAY_BUTTON_SIZE), ("UI/button_load_hover.png", OVERLAY_BUTTON_SIZE),
+            ("UI/button_back.png", OVERLAY_BUTTON_SIZE), ("UI/button_back_hover.png", OVERLAY_BUTTON_SIZE),
+            ("UI/button_play.png", NAVIGATE_BUTTON_SIZE), ("UI/button_play_hover.png", NAVIGATE_BUTTON_SIZE),
+            ("UI/raw/UI_Flat_Frame03a.png", PANEL_SIZE),
+            ("UI/raw/UI_Flat_Frame03a.png", NAVIGATE_PANEL_SIZE),
+        ),
+        sounds=("RBY 103 Pallet Town.ogg",),
+    ) + ShopOverlay.ASSETS + BackpackOverlay.ASSETS
+
     # Helper to load images for backpack
     def _get_image(self, rel_path, size=(64,64)):
         import os
@@ -21,17 +52,20 @@ class GameScene(Scene):
         asset_dirs = ["sprites/", "menu_sprites/", "ingame_ui/", "character/", "attack/", "backgrounds/", "UI/"]
         for d in asset_dirs:
             full = os.path.join(d, rel_path)
+            # Checked against the asset manifest, so absent folders cost no failed load
+            if not resource_manager.has_image(full):
+                continue
             try:
-                img = resource_manager.get_image(full)
+                img = resource_manager.get_image(full, size)
                 if img:
-                    return pg.transform.scale(img, size)
+                    return img
             except Exception:
                 continue
         # fallback: try rel_path directly
         try:
-            img = resource_manager.get_image(rel_path)
+            img = resource_manager.get_image(rel_path, size)
             if img:
-                return pg.transform.scale(img, size)
+                return img
         except Exception:
             pass
         # fallback: blank
@@ -48,7 +82,9 @@ class GameScene(Scene):
     is_navigating: bool
     navigation_path: list[tuple[int, int]]
     current_nav_target: tuple[int, int] | None
-    nav_teleport_pending: tuple[str, int, int] | None  # (target_map, target_x, target_y)
+    nav_route: list[RouteLeg]  # Remaining legs of the planned route, current one first
+    nav_field_goal: tuple[int, int] | None
+    nav_search: PathSearch | None  # Path search still running; the player is "thinking" meanwhile
     
     def __init__(self):
         super().__init__()
@@ -149,7 +185,7 @@ class GameScene(Scene):
         by = 10
         self.backpack_button = Button(
             "UI/button_backpack.png", "UI/button_backpack_hover.png",
-            bx, by, 48, 48,
+            bx, by, *self.HUD_BUTTON_SIZE,
             lambda: setattr(self, "backpack_active", True)
         )
         # Settings overlay state
@@ -157,7 +193,7 @@ class GameScene(Scene):
         sbx = bx - 56
         self.settings_button = Button(
             "UI/button_setting.png", "UI/button_setting_hover.png",
-            sbx, by, 48, 48,
+            sbx, by, *self.HUD_BUTTON_SIZE,
             lambda: setattr(self, "overlay_active", True)
         )
         # Navigate button (left of settings)
@@ -165,13 +201,14 @@ class GameScene(Scene):
         self.navigate_active = False
         self.navigate_button = Button(
             "UI/button_play.png", "UI/button_play_hover.png",
-            nbx, by, 48, 48,
-            lambda: setattr(self, "navigate_active", True)
+            nbx, by, *self.HUD_BUTTON_SIZE,
+            self._open_navigate_overlay
         )
         # Settings overlay back button
         self.overlay_back_button = Button(
             "UI/button_x.png", "UI/button_x_hover.png",
-            GameSettings.SCREEN_WIDTH // 2 + 250 - 48, GameSettings.SCREEN_HEIGHT // 2 - 200, 48, 48,
+            GameSettings.SCREEN_WIDTH // 2 + 250 - self.HUD_BUTTON_SIZE[0], GameSettings.SCREEN_HEIGHT // 2 - 200,
+            *self.HUD_BUTTON_SIZE,
             self._handle_close_overlay
         )
         # Settings overlay Save / Load / Back buttons (positions set when drawing overlay)
@@ -179,17 +216,17 @@ class GameScene(Scene):
         # Use square buttons: height = width (use current width as side length)
         self.overlay_save_button = Button(
             "UI/button_save.png", "UI/button_save_hover.png",
-            0, 0, 70, 70,
+            0, 0, *self.OVERLAY_BUTTON_SIZE,
             self._overlay_save
         )
         self.overlay_load_button = Button(
             "UI/button_load.png", "UI/button_load_hover.png",
-            0, 0, 70, 70,
+            0, 0, *self.OVERLAY_BUTTON_SIZE,
             self._overlay_load
         )
         self.overlay_close_button = Button(
             "UI/button_back.png", "UI/button_back_hover.png",
-            0, 0, 70, 70,
+            0, 0, *self.OVERLAY_BUTTON_SIZE,
             self._overlay_back
         )
 
@@ -210,7 +247,7 @@ class GameScene(Scene):
         self._setup_navigate_buttons()
         self._navigate_close_button = Button(
             "UI/button_x.png", "UI/button_x_hover.png",
-            0, 0, 48, 48,
+            0, 0, *self.HUD_BUTTON_SIZE,
             lambda: setattr(self, "navigate_active", False)
         )
         
@@ -218,7 +255,13 @@ class GameScene(Scene):
         self.is_navigating = False
         self.navigation_path: list[tuple[int, int]] = []
         self.current_nav_target: tuple[int, int] | None = None
-        self.nav_teleport_pending: tuple[str, int, int] | None = None  # (target_map, target_x, target_y)
+        self.nav_route: list[RouteLeg] = []
+        # Goal whose distance field is being followed one step at a time, if any
+        self.nav_field_goal: tuple[int, int] | None = None
+        self.nav_search: PathSearch | None = None
+        self._nav_search_fallback = False
+        self._nav_cache_key = None
+        self._nav_pressed_on_target = False
         # Track navigation intent across map changes
         self.nav_target_map: str | None = None
         self.nav_target_tile: tuple[int, int] | None = None
@@ -231,136 +274,100 @@ class GameScene(Scene):
         for name, map_key, tx, ty in self._navigate_locations:
             btn = Button(
                 "UI/button_play.png", "UI/button_play_hover.png",
-                0, 0, 80, 80,
+                0, 0, *self.NAVIGATE_BUTTON_SIZE,
                 lambda mk=map_key, x=tx, y=ty: self._switch_to_map(mk, x, y)
             )
             self._navigate_buttons.append(btn)
 
+    def _open_navigate_overlay(self):
+        self.navigate_active = True
+        self._warm_navigation()
+
+    def _warm_navigation(self):
+        """Build (once) the distance fields to every Navigate destination and teleporter."""
+        destinations = [(map_key, (tx, ty)) for _, map_key, tx, ty in self._navigate_locations
+                        if tx is not None and ty is not None]
+        try:
+            self.game_manager.route_planner.warm_fields(destinations)
+            # Big maps also get their HPA* cluster graph built in the background
+            current_map = self.game_manager.current_map
+            if current_map.width * current_map.height >= GameSettings.NAV_HPA_MIN_TILES:
+                current_map.prepare_nav_clusters()
+        except Exception as e:
+            Logger.warning(f"[Navigation] Failed to precompute distance fields: {e}")
+
     def _switch_to_map(self, map_key: str, target_x: int | None = None, target_y: int | None = None):
         """Navigate to target map and position by walking"""
         Logger.info(f"[Navigation] _switch_to_map called: target_map={map_key}, target=({target_x}, {target_y})")
         try:
+            self._warm_navigation()
+            # No target means the map's spawn point
+            if (target_x is None or target_y is None) and map_key in self.game_manager.maps:
+                spawn = self.game_manager.maps[map_key].spawn
+                target_x = int(spawn.x) // GameSettings.TILE_SIZE
+                target_y = int(spawn.y) // GameSettings.TILE_SIZE
             # Remember desired destination so we can replan after map changes
             self.nav_target_map = map_key
             self.nav_target_tile = (target_x, target_y) if target_x is not None and target_y is not None else None
             self._nav_active_map = self.game_manager.current_map_key
+            self._plan_route()
+        finally:
+            self.navigate_active = False
 
-            # Normalize default target for shop
-            if map_key == "new_map.tmx" and (target_x is None or target_y is None):
-                target_x, target_y = 10, 8
-                self.nav_target_tile = (target_x, target_y)
-            
-            # If target map is the same as current map, navigate directly
-            if map_key == self.game_manager.current_map_key:
-                Logger.info(f"[Navigation] Same map navigation")
-                # Same map: directly start auto-navigation to target
-                if target_x is not None and target_y is not None:
-                    # Apply conditional routing based on current position and target
-                    actual_target_x, actual_target_y = target_x, target_y
-                    
-                    if self.game_manager.player:
-                        current_x = int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE
-                        current_y = int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE
-                        
-                        # Gym navigation: if x <= 21, go right first to x > 21
-                        if map_key == "gym.tmx" and current_x <= 21:
-                            # First navigate to a point with x > 21 on current map, prioritizing RIGHT direction
-                            Logger.info(f"[Navigation] Gym special routing: going right first")
-                            self._start_auto_navigation(22, current_y, prefer_direction='RIGHT')
-                            # After reaching that point, will continue to gym via _navigate_to_map
-                            return
-                        
-                        # Start navigation: if x > 21, go down first to y >= 30, then left
-                        if map_key == "map.tmx" and target_x == 16 and target_y == 30 and current_x > 21:
-                            # First navigate down to y >= 30, prioritizing DOWN direction
-                            Logger.info(f"[Navigation] Start special routing: going down first")
-                            self._start_auto_navigation(current_x, 30, prefer_direction='DOWN')
-                            # After reaching that, will continue to start point
-                            return
-                        
-                        # Default: navigate directly to target
-                        Logger.info(f"[Navigation] Direct navigation to ({actual_target_x}, {actual_target_y})")
-                        self._start_auto_navigation(actual_target_x, actual_target_y)
-                    else:
-                        self._start_auto_navigation(actual_target_x, actual_target_y)
-                else:
-                    # No target means nothing to do
-                    self.is_navigating = False
-            else:
-                # Different map: handle shop/gym/mountain chaining explicitly
-                Logger.info(f"[Navigation] Different map navigation")
-                current_map = self.game_manager.current_map_key
-
-                # Gym from new_map or mountain: go back to map first, then proceed to gym
-                if map_key == "gym.tmx" and current_map in {"new_map.tmx", "mountain_map.tmx"}:
-                    Logger.info("[Navigation] Gym: from %s -> map -> gym", current_map)
-                    self._navigate_to_map("map.tmx", None, None)
-                    return
+    def _plan_route(self):
+        """Plan the whole (possibly multi-map) route to the navigation target and walk its first leg."""
+        self.nav_route = []
+        if self.game_manager.player is None or not self.nav_target_map or not self.nav_target_tile:
+            self.is_navigating = False
+            return
+        start = (int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE,
+                 int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE)
+        route = self.game_manager.route_planner.plan(self.game_manager.current_map_key, start,
+                                                     self.nav_target_map, self.nav_target_tile)
+        if not route:
+            Logger.warning(f"[Navigation] No route from {self.game_manager.current_map_key} {start} "
+                           f"to {self.nav_target_map} {self.nav_target_tile}")
+            self.is_navigating = False
+            return
+        Logger.info("[Navigation] Route: " + " -> ".join(f"{leg.map_key} {leg.goal}" for leg in route))
+        self.nav_route = route
+        self._start_route_leg()
 
-                # Mountain navigation: if from gym or new_map, go back to map first
-                if map_key == "mountain_map.tmx":
-                    if current_map == "gym.tmx":
-                        Logger.info("[Navigation] Mountain: from gym -> map -> mountain")
-                        self._navigate_to_map("map.tmx", None, None)
-                        return
-                    elif current_map == "new_map.tmx":
-                        Logger.info("[Navigation] Mountain: from new_map -> map -> mountain")
-                        self._navigate_to_map("map.tmx", None, None)
-                        return
-                    elif current_map == "map.tmx":
-                        Logger.info("[Navigation] Mountain: from map -> teleporter -> mountain")
-                        self._navigate_to_map("mountain_map.tmx", target_x, target_y)
-                        return
+    def _start_route_leg(self):
+        """Start walking towards the goal of the first remaining route leg."""
+        if not self.nav_route:
+            self.is_navigating = False
+            return
+        leg = self.nav_route[0]
+        start = (int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE,
+                 int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE)
+        if start == leg.goal:
+            # Already there (e.g. the destination is where we stand)
+            self._finish_route_leg()
+            return
+        # Teleporter tiles may sit on collision tiles, so allow stepping onto them
+        self._start_auto_navigation(*leg.goal, allow_fallback=True, goal_is_teleporter=leg.teleport is not None)
 
-                if map_key == "new_map.tmx":
-                    if current_map == "map.tmx":
-                        Logger.info("[Navigation] Shop: from map -> teleporter (16,27) -> shop")
-                        self._navigate_to_map("new_map.tmx", target_x, target_y)
-                    elif current_map in {"gym.tmx", "mountain_map.tmx"}:
-                        Logger.info("[Navigation] Shop: from %s -> map -> teleporter (16,27) -> shop", current_map)
-                        # First go back to map; subsequent logic will continue to shop
-                        self._navigate_to_map("map.tmx", 16, 27)
-                    else:
-                        self._navigate_to_map(map_key, target_x, target_y)
-                else:
-                    # Generic different-map navigation
-                    self._navigate_to_map(map_key, target_x, target_y)
-        finally:
-            self.navigate_active = False
-    
-    def _navigate_to_map(self, target_map: str, target_x: int | None = None, target_y: int | None = None):
-        """Navigate to a different map by walking to teleporter then teleporting"""
-        Logger.info(f"[Navigation] _navigate_to_map: current_map={self.game_manager.current_map_key}, target_map={target_map}, target=({target_x}, {target_y})")
-        
-        # Find the teleporter that leads to target_map (use first match only to avoid wrong routes)
-        teleporters = self.game_manager.current_teleporter
-        Logger.info(f"[Navigation] Available teleporters from {self.game_manager.current_map_key}: {len(teleporters)}")
-        
-        matching_teleporter = None
-        for tp in teleporters:
-            tp_x = int(tp.pos.x) // GameSettings.TILE_SIZE
-            tp_y = int(tp.pos.y) // GameSettings.TILE_SIZE
-            Logger.info(f"[Navigation]   Teleporter at ({tp_x}, {tp_y}) -> {tp.destination}")
-            if tp.destination == target_map:
-                matching_teleporter = tp
-                Logger.info(f"[Navigation] ✓ Found matching teleporter to {target_map}!")
-                break  # Use only the first matching teleporter to avoid unintended routes
-        
-        if matching_teleporter is None:
-            Logger.error(f"[Navigation] ✗ No teleporter found from {self.game_manager.current_map_key} to {target_map}")
+    def _finish_route_leg(self):
+        """Called once the path of the current leg has been walked."""
+        if not self.nav_route:
             self.is_navigating = False
             return
-        
-        # Navigate to the teleporter
-        tp_tx = int(matching_teleporter.pos.x) // GameSettings.TILE_SIZE
-        tp_ty = int(matching_teleporter.pos.y) // GameSettings.TILE_SIZE
-        Logger.info(f"[Navigation] Starting navigation to teleporter at ({tp_tx}, {tp_ty})")
-        
-        # Store pending teleport info
-        self.nav_teleport_pending = (target_map, target_x, target_y)
-        
-        # Start navigation to teleporter with fallback enabled; teleporter tile must be walkable
-        self._start_auto_navigation(tp_tx, tp_ty, allow_fallback=True, goal_is_teleporter=True)
+        leg = self.nav_route.pop(0)
+        if leg.teleport is None:
+            self.nav_route = []
+            self.is_navigating = False
+            return
+        # Normally walking onto the teleporter already switched maps; if only a
+        # tile next to it was reachable, take the teleporter explicitly
+        tp = leg.teleport
+        self.game_manager.switch_map(tp.destination, tp.target_x, tp.target_y)
+        self.game_manager.try_switch_map()
+        # Same cooldown the player gets after teleporting, so landing on a door does not bounce back
+        setattr(self.game_manager.player, "_teleport_cooldown", 1.0)
+        self._nav_active_map = self.game_manager.current_map_key
+        self.is_navigating = True
+        self._start_route_leg()
 
     def _start_auto_navigation(self, target_tile_x: int, target_tile_y: int, prefer_direction: str | None = None, allow_fallback: bool = False, goal_is_teleporter: bool = False):
         """Start auto-navigation to target tile coordinates
@@ -376,11 +383,97 @@ class GameScene(Scene):
         start_tx = int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE
         start_ty = int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE
         
-        # Simple pathfinding: use A* to find path
-        path = self._find_path(start_tx, start_ty, target_tile_x, target_tile_y, prefer_direction, goal_is_teleporter)
+        # Destinations with a precomputed distance field need no search at all:
+        # the next step is simply the neighbour closest to the goal
+        self.nav_field_goal = None
+        self.nav_search = None
+        planner = self.game_manager.route_planner
+        map_key = self.game_manager.current_map_key
+        # Fields only know the map, so NPCs in the way fall back to A* around them
+        occupied = self._occupied_tiles()
+        if planner.has_field(map_key, (target_tile_x, target_tile_y)):
+            run = planner.next_run(map_key, (start_tx, start_ty), (target_tile_x, target_tile_y), occupied)
+            if run:
+                self.nav_field_goal = (target_tile_x, target_tile_y)
+                self._walk_path((start_tx, start_ty), run)
+                self._nav_active_map = map_key
+                return
+        
+        # The same trip searched before is replayed from the path cache
+        # (paths searched with a preferred direction differ, so they are not cached)
+        current_map = self.game_manager.current_map
+        cache_key = None
+        if prefer_direction is None:
+            cache_key = (current_map.path_name, (start_tx, start_ty), (target_tile_x, target_tile_y), goal_is_teleporter)
+            path = path_cache.get(cache_key, current_map.collision_version, occupied)
+            if path:
+                self._walk_path((start_tx, start_ty), path)
+                self._nav_active_map = map_key
+                Logger.info(f"[Navigation] Navigation started, path length: {len(path)} (cached)")
+                return
+        
+        # Searches run a slice per frame (see _advance_path_search) so a far
+        # away or unreachable target never stalls the game
+        def grid_search() -> PathSearch:
+            return create_search(GameSettings.NAV_SEARCH_MODE, current_map.walkable_grid,
+                                 current_map.width, current_map.height,
+                                 (start_tx, start_ty), (target_tile_x, target_tile_y),
+                                 prefer_direction, goal_is_teleporter, occupied)
+        
+        # On big maps a far target is searched over the HPA* cluster graph,
+        # which only expands the start and goal clusters at full resolution.
+        # Until the worker has built the graph, the grid search is used
+        self.nav_search = None
+        far = abs(target_tile_x - start_tx) + abs(target_tile_y - start_ty) > 2 * GameSettings.NAV_CLUSTER_TILES
+        if far and current_map.width * current_map.height >= GameSettings.NAV_HPA_MIN_TILES:
+            clusters = current_map.nav_clusters
+            if clusters is None:
+                current_map.prepare_nav_clusters()
+            else:
+                self.nav_search = ClusterSearch(clusters, (start_tx, start_ty), (target_tile_x, target_tile_y),
+                                                goal_is_teleporter, occupied)
+        if self.nav_search is None:
+            self.nav_search = grid_search()
+        self._nav_grid_search = grid_search
+        self._nav_search_fallback = allow_fallback
+        self._nav_cache_key = cache_key
+        self.navigation_path = []
+        self.current_nav_target = None
+        self.is_navigating = True
+        self._nav_active_map = map_key
+        self._advance_path_search()
+
+    def _advance_path_search(self):
+        """Run the pending path search within this frame's budget and start walking once it is done."""
+        search = self.nav_search
+        if search is None:
+            return
+        if not search.step(GameSettings.NAV_SEARCH_NODES_PER_FRAME, GameSettings.NAV_SEARCH_BUDGET_US / 1_000_000):
+            return
+        self.nav_search = None
+        target_tile_x, target_tile_y = search.goal
+        path = search.path
+        # Only paths to the requested goal are cached, not the fallbacks below
+        if path and self._nav_cache_key is not None:
+            current_map = self.game_manager.current_map
+            path_cache.put(self._nav_cache_key, current_map.collision_version, path)
+        
+        # HPA* misses paths that squeeze past avoided tiles inside a cluster
+        # (and cannot look for nearby tiles), so a failed one is retried on the grid
+        if not path and isinstance(search, ClusterSearch):
+            self.nav_search = self._nav_grid_search()
+            return
+        
+        # Jump point search only records jump points, so the nearby-tile
+        # fallback below needs the tile-by-tile A* search (run in slices as well)
+        if not path and self._nav_search_fallback and isinstance(search, JumpPointSearch):
+            self.nav_search = search.as_astar()
+            return
         
-        # If direct path fails and fallback is allowed, try finding a path to nearby accessible tiles
-        if not path and allow_fallback:
+        # If direct path fails and fallback is allowed, try nearby tiles. The
+        # finished search has visited every tile reachable from the start, so
+        # this needs no further searching
+        if not path and self._nav_search_fallback:
             Logger.warning(f"[Navigation] Direct path to ({target_tile_x}, {target_tile_y}) failed, trying nearby tiles")
             # Try tiles around the target
             for dx in [-1, 0, 1]:
@@ -388,7 +481,7 @@ class GameScene(Scene):
                     if dx == 0 and dy == 0:
                         continue
                     alt_x, alt_y = target_tile_x + dx, target_tile_y + dy
-                    alt_path = self._find_path(start_tx, start_ty, alt_x, alt_y, prefer_direction)
+                    alt_path = search.path_to((alt_x, alt_y))
                     if alt_path:
                         Logger.info(f"[Navigation] Found alternative path to ({alt_x}, {alt_y})")
                         path = alt_path
@@ -397,136 +490,50 @@ class GameScene(Scene):
                     break
         
         if path:
-            self.navigation_path = path
-            self.is_navigating = True
-            self.current_nav_target = path[0] if path else None
-            self._nav_active_map = self.game_manager.current_map_key
-            Logger.info(f"[Navigation] Navigation started, path length: {len(path)}")
+            self._walk_path(search.start, path)
+            method = ", HPA*" if isinstance(search, ClusterSearch) else ""
+            Logger.info(f"[Navigation] Navigation started, path length: {len(path)} ({search.expanded} nodes searched{method})")
         else:
             Logger.warning(f"[Navigation] No path found to ({target_tile_x}, {target_tile_y}), navigation failed")
             self.is_navigating = False
     
-    def _find_path(self, start_x: int, start_y: int, goal_x: int, goal_y: int, prefer_direction: str | None = None, goal_is_teleporter: bool = False) -> list[tuple[int, int]]:
-        """A* pathfinding with preference for right-then-up movement and bush avoidance
-        
-        prefer_direction: prioritize movement in this direction first when costs are equal
-        goal_is_teleporter: if True, allow the goal tile even if collidable/bush
-        """
-        from heapq import heappush, heappop
-        
-        def heuristic(x: int, y: int) -> int:
-            # Manhattan distance
-            return abs(x - goal_x) + abs(y - goal_y)
-        
-        def is_walkable(x: int, y: int) -> bool:
-            if x < 0 or y < 0 or x >= self.game_manager.current_map.tmxdata.width or y >= self.game_manager.current_map.tmxdata.height:
-                return False
-            # If goal is a teleporter, allow stepping onto that tile even if collidable
-            if not (goal_is_teleporter and x == goal_x and y == goal_y):
-                # Check if tile is not colliding
-                tile_rect = pg.Rect(x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
-                if self.game_manager.current_map.check_collision(tile_rect):
-                    return False
-                # COMPLETELY block bushes - treat them as unwalkable for navigation
-                try:
-                    pos = Position(x * GameSettings.TILE_SIZE + GameSettings.TILE_SIZE // 2, 
-                                 y * GameSettings.TILE_SIZE + GameSettings.TILE_SIZE // 2)
-                    if self.game_manager.current_map.is_pokemon_bush_at(pos):
-                        return False  # Block bushes entirely during navigation
-                except Exception:
-                    pass
-            return True
-        
-        open_set = []
-        heappush(open_set, (0, start_x, start_y))
-        came_from: dict[tuple[int, int], tuple[int, int]] = {}
-        g_score: dict[tuple[int, int], int] = {(start_x, start_y): 0}
-        
-        visited = set()
-        
-        while open_set:
-            _, x, y = heappop(open_set)
-            
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-            
-            if x == goal_x and y == goal_y:
-                # Reconstruct path
-                path = []
-                current = (goal_x, goal_y)
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                path.append((start_x, start_y))
-                return list(reversed(path))[1:]  # Exclude start, include goal
-            
-            # Check all 4 directions
-            # Prefer direction determines priority: prefer_direction first, then other directions
-            if prefer_direction == 'RIGHT':
-                directions = [(1, 0), (0, 1), (0, -1), (-1, 0)]  # Right, Down, Up, Left
-            elif prefer_direction == 'LEFT':
-                directions = [(-1, 0), (0, 1), (0, -1), (1, 0)]  # Left, Down, Up, Right
-            elif prefer_direction == 'DOWN':
-                directions = [(0, 1), (1, 0), (-1, 0), (0, -1)]  # Down, Right, Left, Up
-            elif prefer_direction == 'UP':
-                directions = [(0, -1), (1, 0), (-1, 0), (0, 1)]  # Up, Right, Left, Down
-            else:
-                # Default: prefer right then down
-                directions = [(1, 0), (0, 1), (0, -1), (-1, 0)]  # Right, Down, Up, Left
-            
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if not is_walkable(nx, ny) or (nx, ny) in visited:
-                    continue
-                
-                # Simple cost = 1 (bushes already blocked in is_walkable)
-                tentative_g = g_score[(x, y)] + 1
-                
-                if (nx, ny) not in g_score or tentative_g < g_score[(nx, ny)]:
-                    came_from[(nx, ny)] = (x, y)
-                    g_score[(nx, ny)] = tentative_g
-                    f_score = tentative_g + heuristic(nx, ny)
-                    heappush(open_set, (f_score, nx, ny))
-        
-        return []  # No path found
+    def _walk_path(self, start: tuple[int, int], path: list[tuple[int, int]]):
+        """Follow path from start as straight runs: only the tiles where it turns become waypoints."""
+        # The first step is always a waypoint so an off-centre player lines up
+        # on it instead of drifting diagonally along the whole first run
+        self.navigation_path = compress_path(start, path)
+        if self.navigation_path[0] != path[0]:
+            self.navigation_path.insert(0, path[0])
+        self.is_navigating = True
+        self.current_nav_target = self.navigation_path[0]
+
+    def _occupied_tiles(self) -> set[tuple[int, int]]:
+        """Tiles the navigator cannot stand on because the player would overlap an NPC there."""
+        # The navigator walks the player's top-left to tile centres, so standing
+        # on a tile covers half of the tiles to its right and below as well
+        ts = GameSettings.TILE_SIZE
+        tiles = set()
+        for entity in self.game_manager.current_enemy_trainers:
+            r = entity.animation.rect
+            for y in range((r.top - ts - ts // 2) // ts, (r.bottom - ts // 2) // ts + 1):
+                for x in range((r.left - ts - ts // 2) // ts, (r.right - ts // 2) // ts + 1):
+                    if r.colliderect(pg.Rect(x * ts + ts // 2, y * ts + ts // 2, ts, ts)):
+                        tiles.add((x, y))
+        return tiles
 
     def _replan_navigation_for_current_map(self):
-        """Recalculate path when the current map changes while navigating."""
+        """Continue the route when the current map changes while navigating."""
         self._nav_active_map = self.game_manager.current_map_key
         if not self.is_navigating:
             return
-        if not self.nav_target_map:
-            self.is_navigating = False
-            return
-        # If we are already on the destination map, go straight to the target tile.
-        if self.game_manager.current_map_key == self.nav_target_map:
-            if self.nav_target_tile:
-                tx, ty = self.nav_target_tile
-                self._start_auto_navigation(tx, ty)
-            else:
-                self.is_navigating = False
-            return
-        # Otherwise find a teleporter on this map that reaches the destination map.
-        teleporters = self.game_manager.current_teleporter
-        target_tp = None
-        for tp in teleporters:
-            if tp.destination == self.nav_target_map:
-                target_tp = tp
-                break
-        if target_tp is None:
-            Logger.warning(f"No teleporter found from {self.game_manager.current_map_key} to {self.nav_target_map}")
-            self.is_navigating = False
+        # Walking onto the leg's teleporter brings us to the next leg's map
+        if len(self.nav_route) > 1 and self.nav_route[0].teleport is not None \
+                and self.nav_route[1].map_key == self.game_manager.current_map_key:
+            self.nav_route.pop(0)
+            self._start_route_leg()
             return
-        self.nav_teleport_pending = (
-            self.nav_target_map,
-            self.nav_target_tile[0] if self.nav_target_tile else None,
-            self.nav_target_tile[1] if self.nav_target_tile else None,
-        )
-        tp_tx = int(target_tp.pos.x) // GameSettings.TILE_SIZE
-        tp_ty = int(target_tp.pos.y) // GameSettings.TILE_SIZE
-        # Teleporter tile must be walkable; do not allow collidable goal tiles
-        self._start_auto_navigation(tp_tx, tp_ty, goal_is_teleporter=True)
+        # Somewhere unexpected (e.g. an unplanned door): plan again from here
+        self._plan_route()
 
     def _update_auto_navigation(self, dt: float):
         """Update auto-navigation movement"""
@@ -534,75 +541,53 @@ class GameScene(Scene):
             self.is_navigating = False
             return
         
-        # Check if we have a pending teleport to process (map switch completed)
-        if self.nav_teleport_pending and not self.navigation_path:
-            target_map, target_x, target_y = self.nav_teleport_pending
-            self.nav_teleport_pending = None
-            
-            # Teleport to new map
-            self.game_manager.switch_map(target_map, target_x, target_y)
-            # Process the map switch
-            self.game_manager.try_switch_map()
-            self._nav_active_map = self.game_manager.current_map_key
-            
-            # Recalculate path on new map from current position to target
-            if target_x is not None and target_y is not None:
-                self._start_auto_navigation(target_x, target_y)
-            else:
-                self.is_navigating = False
+        # Still searching for a path: stand still and think
+        if self.nav_search is not None:
+            self.game_manager.player.is_moving = False
+            self._advance_path_search()
             return
         
-        # Check if no path left - navigation complete or need to continue with next stage
+        # No path left - this leg of the route is done
         if not self.navigation_path:
-            # Check if we need to continue with conditional routing
-            if self.nav_target_map and self.nav_target_tile:
-                current_x = int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE
-                current_y = int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE
-                target_x, target_y = self.nav_target_tile
-
-                # Shop routing chain
-                if self.nav_target_map == "new_map.tmx":
-                    # From gym: return to map first
-                    if self.game_manager.current_map_key == "gym.tmx":
-                        self._navigate_to_map("map.tmx", 16, 27)
-                        return
-                    # From map: go to teleporter that leads to shop
-                    if self.game_manager.current_map_key == "map.tmx":
-                        self._navigate_to_map("new_map.tmx", target_x, target_y)
-                        return
-                
-                # Gym routing: after reaching x > 21, continue to gym
-                if self.nav_target_map == "gym.tmx" and current_x > 21 and (current_x != target_x or current_y != target_y):
-                    if self.game_manager.current_map_key == "map.tmx":
-                        self._navigate_to_map("gym.tmx", target_x, target_y)
-                        return
-                
-                # Start routing: after reaching y >= 30, continue to final position
-                if self.nav_target_map == "map.tmx" and target_x == 16 and target_y == 30:
-                    if current_y >= 30 and current_x > 21 and (current_x != target_x or current_y != target_y):
-                        # Now navigate left to the final position
-                        self._start_auto_navigation(target_x, target_y, prefer_direction='LEFT')
-                        return
-            
-            self.is_navigating = False
-
-            self.is_navigating = False
+            self._finish_route_leg()
             return
         
         # Get current tile position
         current_tx = int(self.game_manager.player.position.x) // GameSettings.TILE_SIZE
         current_ty = int(self.game_manager.player.position.y) // GameSettings.TILE_SIZE
         
-        # Check if reached current target
-        if self.current_nav_target and (current_tx, current_ty) == self.current_nav_target:
+        # Check if reached current target. Waypoints are the ends of straight
+        # runs, so one counts as reached at its centre rather than on entering
+        # the tile, and every turn happens on a tile centre
+        ts = GameSettings.TILE_SIZE
+        reached = False
+        if self.current_nav_target:
+            target_tx, target_ty = self.current_nav_target
+            reached = abs(target_tx * ts + ts // 2 - self.game_manager.player.position.x) <= 2 \
+                and abs(target_ty * ts + ts // 2 - self.game_manager.player.position.y) <= 2
+            # In a narrow passage walls may keep the player off the exact centre
+            reached = reached or (self._nav_pressed_on_target and (current_tx, current_ty) == self.current_nav_target)
+        self._nav_pressed_on_target = False
+        if reached:
             # Move to next waypoint in path
             if self.navigation_path:
                 self.navigation_path.pop(0)
+                if not self.navigation_path and self.nav_field_goal is not None:
+                    # Follow the field to the end of its next straight run
+                    planner = self.game_manager.route_planner
+                    map_key = self.game_manager.current_map_key
+                    run = planner.next_run(map_key, (current_tx, current_ty), self.nav_field_goal, self._occupied_tiles())
+                    if not run and planner.next_step(map_key, (current_tx, current_ty), self.nav_field_goal) is not None:
+                        # Someone stands on the way: plan around them instead
+                        self._start_route_leg()
+                        return
+                    if run:
+                        self.navigation_path.append(run[-1])
                 if self.navigation_path:
                     self.current_nav_target = self.navigation_path[0]
                 else:
                     # Path completed
-                    self.is_navigating = False
+                    self._finish_route_leg()
                     return
         
         # Move towards current target
@@ -648,28 +633,30 @@ class GameScene(Scene):
                 step_y = (dy / distance) * move_distance
                 p = self.game_manager.player
                 moved = False
+                blocked = False
 
-                # Move X
+                # Move X, swept against the collision grid like manual control
+                p.animation.update_pos(p.position)
                 if step_x != 0:
-                    old_x = p.position.x
-                    p.position.x = old_x + step_x
-                    p.animation.update_pos(p.position)
-                    if self.game_manager.check_collision(p.animation.rect):
-                        p.position.x = old_x  # revert on collision
-                        p.animation.update_pos(p.position)
+                    allowed = self.game_manager.sweep_x(p.animation.rect, step_x)
+                    if allowed == step_x:
+                        p.position.x += step_x
                     else:
-                        moved = True
+                        p.position.x = p.animation.rect.x + allowed
+                        blocked = True
+                    moved = moved or allowed != 0
+                    p.animation.update_pos(p.position)
 
                 # Move Y
                 if step_y != 0:
-                    old_y = p.position.y
-                    p.position.y = old_y + step_y
-                    p.animation.update_pos(p.position)
-                    if self.game_manager.check_collision(p.animation.rect):
-                        p.position.y = old_y  # revert on collision
-                        p.animation.update_pos(p.position)
+                    allowed = self.game_manager.sweep_y(p.animation.rect, step_y)
+                    if allowed == step_y:
+                        p.position.y += step_y
                     else:
-                        moved = True
+                        p.position.y = p.animation.rect.y + allowed
+                        blocked = True
+                    moved = moved or allowed != 0
+                    p.animation.update_pos(p.position)
 
                 # If we can reach the target in this frame without overshooting, snap to it (still respecting collision)
                 if distance <= move_distance:
@@ -687,16 +674,19 @@ class GameScene(Scene):
 
                 # If blocked and not moved, replan a fresh path from current tile to the goal
                 p.is_moving = moved
-                if not moved:
+                if blocked and (current_tx, current_ty) == self.current_nav_target:
+                    # Already on the waypoint and pressed against a wall beside
+                    # its centre: that is as close as it gets, carry on from here
+                    self._nav_pressed_on_target = True
+                elif not moved:
                     try:
-                        # Determine the current target we are pursuing
-                        goal_x, goal_y = target_tx, target_ty
-                        goal_is_tp = bool(self.nav_teleport_pending)
-                        # If we had an overall nav target recorded, prefer that
-                        if self.nav_target_tile:
-                            goal_x, goal_y = self.nav_target_tile
-                            goal_is_tp = False
-                        self._start_auto_navigation(goal_x, goal_y, allow_fallback=True, goal_is_teleporter=goal_is_tp)
+                        leg = self.nav_route[0] if self.nav_route else None
+                        if leg is not None and leg.teleport is not None \
+                                and abs(current_tx - leg.goal[0]) + abs(current_ty - leg.goal[1]) <= 1:
+                            # Doors sit on collision tiles; pressed against one, take it
+                            self._finish_route_leg()
+                        else:
+                            self._start_route_leg()
                     except Exception:
                         pass
             else:
@@ -970,6 +960,8 @@ class GameScene(Scene):
             camera = self.game_manager.player.camera
             self.game_manager.current_map.draw(screen, camera)
             self.game_manager.player.draw(screen, camera)
+            if self.nav_search is not None:
+                self._draw_thinking(screen, camera)
         else:
             camera = PositionCamera(0, 0)
             self.game_manager.current_map.draw(screen, camera)
@@ -985,12 +977,18 @@ class GameScene(Scene):
         if self.online_manager and self.game_manager.player:
             list_online = self.online_manager.get_list_players()
             seen_ids: set[int] = set()
+            ts = GameSettings.TILE_SIZE
+            cam = self.game_manager.player.camera
+            # Only remote players inside the camera view are animated and drawn;
+            # a few players do not pay for a spatial index, one rect test each will do
+            view = pg.Rect(cam.x - ts, cam.y - ts, GameSettings.SCREEN_WIDTH + 2 * ts, GameSettings.SCREEN_HEIGHT + 2 * ts)
             for player in list_online:
+                pid = player.get("id")
                 if player["map"] == self.game_manager.current_map.path_name:
-                    cam = self.game_manager.player.camera
-                    pos = cam.transform_position_as_position(Position(player["x"], player["y"]))
-                    pid = player.get("id")
                     seen_ids.add(pid)
+                    if not view.colliderect((int(player["x"]), int(player["y"]), ts, ts)):
+                        continue
+                    pos = cam.transform_position_as_position(Position(player["x"], player["y"]))
                     anim = self.online_sprites.get(pid)
                     if anim is None:
                         anim = Animation(
@@ -1032,14 +1030,13 @@ class GameScene(Scene):
             screen.blit(dark, (0,0))
             # overlay 視窗與背包一致
             from src.core.services import resource_manager
-            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-            bg_img = pg.transform.scale(bg_img, (700, 500))
-            panel_w, panel_h = 700, 500
+            panel_w, panel_h = self.PANEL_SIZE
+            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png", self.PANEL_SIZE)
             panel_x = GameSettings.SCREEN_WIDTH // 2 - panel_w // 2
             panel_y = GameSettings.SCREEN_HEIGHT // 2 - panel_h // 2
             screen.blit(bg_img, (panel_x, panel_y))
             # Back button
-            self.overlay_back_button.hitbox.topleft = (panel_x + panel_w - 48 - 10, panel_y + 10)
+            self.overlay_back_button.hitbox.topleft = (panel_x + panel_w - self.HUD_BUTTON_SIZE[0] - 10, panel_y + 10)
             self.overlay_back_button.draw(screen)
             # Checkbox 與 Slider，M與V左側對齊
             align_x = panel_x + 60
@@ -1073,15 +1070,14 @@ class GameScene(Scene):
         if self.backpack_active:
             # Draw custom background for backpack overlay
             from src.core.services import resource_manager
-            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-            bg_img = pg.transform.scale(bg_img, (700, 500))
-            panel_w, panel_h = 700, 500
+            panel_w, panel_h = self.PANEL_SIZE
+            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png", self.PANEL_SIZE)
             panel_x = GameSettings.SCREEN_WIDTH // 2 - panel_w // 2
             panel_y = GameSettings.SCREEN_HEIGHT // 2 - panel_h // 2
             screen.blit(bg_img, (panel_x, panel_y))
 
             # Position overlay back button at top-right of panel
-            self.overlay_back_button.hitbox.topleft = (panel_x + panel_w - 48 - 10, panel_y + 10)
+            self.overlay_back_button.hitbox.topleft = (panel_x + panel_w - self.HUD_BUTTON_SIZE[0] - 10, panel_y + 10)
             self.overlay_back_button.draw(screen)
 
             # Use BackpackOverlay to draw content (handles scrolling internally)
@@ -1137,9 +1133,8 @@ class GameScene(Scene):
             screen.blit(dark, (0,0))
             # panel background image consistent with other overlays
             from src.core.services import resource_manager
-            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-            panel_w, panel_h = 700, 400
-            bg_img = pg.transform.scale(bg_img, (panel_w, panel_h))
+            panel_w, panel_h = self.NAVIGATE_PANEL_SIZE
+            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png", self.NAVIGATE_PANEL_SIZE)
             panel_x = GameSettings.SCREEN_WIDTH // 2 - panel_w // 2
             panel_y = GameSettings.SCREEN_HEIGHT // 2 - panel_h // 2
             screen.blit(bg_img, (panel_x, panel_y))
@@ -1149,9 +1144,10 @@ class GameScene(Scene):
             screen.blit(title, (panel_x + panel_w//2 - title.get_width()//2, panel_y + 20))
             # position buttons in panel center
             button_spacing = 160
-            total_w = len(self._navigate_buttons) * 80 + (len(self._navigate_buttons) - 1) * (button_spacing - 80)
+            btn_w, btn_h = self.NAVIGATE_BUTTON_SIZE
+            total_w = len(self._navigate_buttons) * btn_w + (len(self._navigate_buttons) - 1) * (button_spacing - btn_w)
             start_x = panel_x + panel_w // 2 - total_w // 2
-            btn_y = panel_y + panel_h // 2 - 40
+            btn_y = panel_y + panel_h // 2 - btn_h // 2
             for i, btn in enumerate(self._navigate_buttons):
                 btn.hitbox.topleft = (start_x + i * button_spacing, btn_y)
                 btn.draw(screen)
@@ -1162,17 +1158,28 @@ class GameScene(Scene):
                 lr = label.get_rect(center=(btn.hitbox.centerx, btn.hitbox.bottom + 18))
                 screen.blit(label, lr)
             # close button at top-right of panel
-            self._navigate_close_button.hitbox.topleft = (panel_x + panel_w - 48 - 10, panel_y + 10)
+            self._navigate_close_button.hitbox.topleft = (panel_x + panel_w - self.HUD_BUTTON_SIZE[0] - 10, panel_y + 10)
             self._navigate_close_button.draw(screen)
     
+    def _draw_thinking(self, screen: pg.Surface, camera: PositionCamera):
+        """Thought bubble over the player while a path search is still running."""
+        rect = camera.transform_rect(self.game_manager.player.animation.rect)
+        dots = "." * (1 + int(time.time() * 3) % 3)
+        text = self.chat_font.render(dots, True, (20, 20, 20))
+        bubble = pg.Rect(0, 0, 36, 22)
+        bubble.midbottom = (rect.centerx, rect.top - 4)
+        pg.draw.ellipse(screen, (255, 255, 255), bubble)
+        pg.draw.ellipse(screen, (20, 20, 20), bubble, 1)
+        screen.blit(text, text.get_rect(center=(bubble.centerx, bubble.centery - 3)))
+
     def _draw_minimap(self, screen: pg.Surface):
         """Draw a minimap in the top-left corner showing the current map and player position"""
         if not self.game_manager or not self.game_manager.current_map:
             return
         
         # Get map dimensions
-        map_width = self.game_manager.current_map.tmxdata.width
-        map_height = self.game_manager.current_map.tmxdata.height
+        map_width = self.game_manager.current_map.width
+        map_height = self.game_manager.current_map.height
         
         # Calculate aspect ratio and size to fit in available space
         max_size = 150
@@ -1191,13 +1198,9 @@ class GameScene(Scene):
         scale_x = minimap_width / (map_width * GameSettings.TILE_SIZE)
         scale_y = minimap_height / (map_height * GameSettings.TILE_SIZE)
         
-        # Create minimap surface by scaling the original map
+        # Minimap surface is scaled once per size and cached by the map
         try:
-            # Create a scaled version of the map surface
-            minimap_surface = pg.transform.scale(
-                self.game_manager.current_map._surface,
-                (minimap_width, minimap_height)
-            )
+            minimap_surface = self.game_manager.current_map.get_minimap((minimap_width, minimap_height))
         except Exception:
             # Fallback if scaling fails
             minimap_surface = pg.Surface((minimap_width, minimap_height))
@@ -1,6 +1,6 @@
 import pygame as pg
 
-from src.utils import GameSettings
+from src.utils import GameSettings, AssetBundle
 from src.sprites import BackgroundSprite
 from src.scenes.scene import Scene
 from src.interface.components import Button
@@ -8,6 +8,16 @@ from src.core.services import scene_manager, sound_manager, input_manager
 from typing import override
 
 class MenuScene(Scene):
+    # Shared by the bundle below and the buttons (scaled variants are cached per size)
+    BUTTON_SIZE = (100, 100)
+    ASSETS = AssetBundle(
+        scaled=(
+            ("backgrounds/background1.png", (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)),
+            ("UI/button_play.png", BUTTON_SIZE), ("UI/button_play_hover.png", BUTTON_SIZE),
+            ("UI/button_setting.png", BUTTON_SIZE), ("UI/button_setting_hover.png", BUTTON_SIZE),
+        ),
+        sounds=("RBY 101 Opening (Part 1).ogg",),
+    )
     # Background Image
     background: BackgroundSprite
     # Buttons
@@ -21,13 +31,13 @@ class MenuScene(Scene):
         px, py = GameSettings.SCREEN_WIDTH // 2, GameSettings.SCREEN_HEIGHT * 3 // 4
         self.play_button = Button(
             "UI/button_play.png", "UI/button_play_hover.png",
-            px + 50, py, 100, 100,
+            px + 50, py, *self.BUTTON_SIZE,
             self._start_game
         )
         # Settings button to navigate to setting scene
         self.setting_button = Button(
             "UI/button_setting.png", "UI/button_setting_hover.png",
-            px - 150, py, 100, 100,
+            px - 150, py, *self.BUTTON_SIZE,
             lambda: scene_manager.change_scene("setting")
         )
         
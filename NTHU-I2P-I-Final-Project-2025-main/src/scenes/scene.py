@@ -1,7 +1,11 @@
 from __future__ import annotations
 import pygame as pg
+from src.utils import AssetBundle
 
 class Scene:
+    # Assets SceneManager loads before enter() and releases after exit()
+    ASSETS: AssetBundle = AssetBundle()
+
     def __init__(self) -> None:
         ...
 
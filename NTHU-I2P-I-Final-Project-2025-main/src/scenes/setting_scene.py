@@ -1,10 +1,10 @@
 import pygame as pg
 
-from src.utils import GameSettings
+from src.utils import GameSettings, AssetBundle
 from src.sprites import BackgroundSprite
 from src.scenes.scene import Scene
 from src.interface.components import Button
-from src.core.services import scene_manager, sound_manager, input_manager
+from src.core.services import scene_manager, sound_manager, input_manager, resource_manager
 from typing import override
 
 # Simple Checkbox UI
@@ -128,6 +128,15 @@ class Slider:
 		screen.blit(val_surf, (self.rect.right+20, self.rect.y-8))
 
 class SettingScene(Scene):
+	# Sizes shared by the bundle below and the drawing code (scaled variants are cached per size)
+	PANEL_SIZE = (500, 400)
+	BACK_BUTTON_SIZE = (100, 100)
+	ASSETS = AssetBundle(
+		scaled=(
+			("UI/raw/UI_Flat_Frame03a.png", PANEL_SIZE),
+			("UI/button_back.png", BACK_BUTTON_SIZE), ("UI/button_back_hover.png", BACK_BUTTON_SIZE),
+		),
+	)
 	background: BackgroundSprite
 	back_button: Button
 
@@ -142,7 +151,7 @@ class SettingScene(Scene):
 		# Back button to return to main menu
 		self.back_button = Button(
 			"UI/button_back.png", "UI/button_back_hover.png",
-			px - 50, py, 100, 100,
+			px - self.BACK_BUTTON_SIZE[0] // 2, py, *self.BACK_BUTTON_SIZE,
 			lambda: scene_manager.change_scene("menu")
 		)
 
@@ -172,14 +181,14 @@ class SettingScene(Scene):
 	@override
 	def draw(self, screen: pg.Surface) -> None:
 		# 縮小 overlay 視窗
-		panel_w, panel_h = 500, 400
+		panel_w, panel_h = self.PANEL_SIZE
 		panel_x = GameSettings.SCREEN_WIDTH // 2 - panel_w // 2
 		panel_y = GameSettings.SCREEN_HEIGHT // 2 - panel_h // 2
-		bg_img = self.background.image
-		bg_img = pg.transform.scale(bg_img, (panel_w, panel_h))
+		bg_img = resource_manager.get_image(self.background.path, self.PANEL_SIZE)
 		screen.blit(bg_img, (panel_x, panel_y))
 		# 置中 back button, checkbox, slider
-		self.back_button.hitbox.topleft = (panel_x + panel_w - 110, panel_y + panel_h - 110)
+		bw, bh = self.BACK_BUTTON_SIZE
+		self.back_button.hitbox.topleft = (panel_x + panel_w - bw - 10, panel_y + panel_h - bh - 10)
 		self.back_button.draw(screen)
 		cb_x = panel_x + 60
 		cb_y = panel_y + 80
@@ -1,10 +1,27 @@
 import pygame as pg
-from src.utils import GameSettings, Logger
+from src.utils import GameSettings, Logger, AssetBundle
 from src.interface.components import Button
 
 
 class ShopOverlay:
     """Shop overlay for buying and selling items"""
+    # Sizes shared by the bundle below and the drawing code (scaled variants are cached per size)
+    PANEL_SIZE = (600, 500)
+    MODE_BUTTON_SIZE = (100, 40)
+    CLOSE_BUTTON_SIZE = (50, 50)
+    SHOP_BUTTON_SIZE = (50, 40)
+    ITEM_ICON_SIZE = (40, 40)
+    # Acquired by the scene that owns the overlay
+    ASSETS = AssetBundle(
+        images=("UI/raw/UI_Flat_Banner03a.png",),
+        scaled=(
+            ("UI/raw/UI_Flat_Frame03a.png", PANEL_SIZE),
+            ("UI/raw/UI_Flat_Bar01a.png", MODE_BUTTON_SIZE),
+            ("UI/button_x.png", CLOSE_BUTTON_SIZE), ("UI/button_x_hover.png", CLOSE_BUTTON_SIZE),
+            ("UI/button_shop.png", SHOP_BUTTON_SIZE), ("UI/button_shop_hover.png", SHOP_BUTTON_SIZE),
+            ("ingame_ui/potion.png", ITEM_ICON_SIZE), ("ingame_ui/ball.png", ITEM_ICON_SIZE),
+        ),
+    )
     
     def __init__(self, game_manager):
         self.game_manager = game_manager
@@ -26,8 +43,7 @@ class ShopOverlay:
         self.max_scroll = 0
         
         # UI dimensions
-        self.panel_width = 600
-        self.panel_height = 500
+        self.panel_width, self.panel_height = self.PANEL_SIZE
         self.panel_x = (GameSettings.SCREEN_WIDTH - self.panel_width) // 2
         self.panel_y = (GameSettings.SCREEN_HEIGHT - self.panel_height) // 2
         
@@ -50,17 +66,17 @@ class ShopOverlay:
         btn_y = self.panel_y + 60
         self.buy_button = Button(
             "UI/raw/UI_Flat_Bar01a.png", "UI/raw/UI_Flat_Bar01a.png",
-            self.panel_x + 50, btn_y, 100, 40,
+            self.panel_x + 50, btn_y, *self.MODE_BUTTON_SIZE,
             self._switch_to_buy
         )
         self.sell_button = Button(
             "UI/raw/UI_Flat_Bar01a.png", "UI/raw/UI_Flat_Bar01a.png",
-            self.panel_x + 170, btn_y, 100, 40,
+            self.panel_x + 170, btn_y, *self.MODE_BUTTON_SIZE,
             self._switch_to_sell
         )
         self.close_button = Button(
             "UI/button_x.png", "UI/button_x_hover.png",
-            self.panel_x + self.panel_width - 60, self.panel_y + 10, 50, 50,
+            self.panel_x + self.panel_width - 60, self.panel_y + 10, *self.CLOSE_BUTTON_SIZE,
             self.close
         )
 
@@ -116,7 +132,7 @@ class ShopOverlay:
             buy_func = lambda idx=i: self._buy_item(idx)
             btn = Button(
                 "UI/button_shop.png", "UI/button_shop_hover.png",
-                btn_x, btn_y, 50, 40,
+                btn_x, btn_y, *self.SHOP_BUTTON_SIZE,
                 buy_func
             )
             self.buy_buttons.append(btn)
@@ -140,7 +156,7 @@ class ShopOverlay:
             
             btn = Button(
                 "UI/button_shop.png", "UI/button_shop_hover.png",
-                btn_x, btn_y, 50, 40,
+                btn_x, btn_y, *self.SHOP_BUTTON_SIZE,
                 sell_func
             )
             self.sell_buttons.append(btn)
@@ -387,8 +403,7 @@ class ShopOverlay:
         # Draw main panel using UI_Flat_Frame03a
         from src.core.services import resource_manager
         try:
-            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-            bg_img = pg.transform.scale(bg_img, (self.panel_width, self.panel_height))
+            bg_img = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png", self.PANEL_SIZE)
             screen.blit(bg_img, (self.panel_x, self.panel_y))
         except Exception:
             # Fallback to solid color if image fails to load
@@ -410,15 +425,14 @@ class ShopOverlay:
         
         # Draw mode buttons with background
         try:
-            bar_img = resource_manager.get_image("UI/raw/UI_Flat_Bar01a.png")
+            # Both buttons share the same scaled bar
+            bar_img = resource_manager.get_image("UI/raw/UI_Flat_Bar01a.png", self.MODE_BUTTON_SIZE)
             
             # Draw BUY button background
-            buy_bar = pg.transform.scale(bar_img, (100, 40))
-            screen.blit(buy_bar, (self.panel_x + 50, self.panel_y + 60))
+            screen.blit(bar_img, (self.panel_x + 50, self.panel_y + 60))
             
             # Draw SELL button background
-            sell_bar = pg.transform.scale(bar_img, (100, 40))
-            screen.blit(sell_bar, (self.panel_x + 170, self.panel_y + 60))
+            screen.blit(bar_img, (self.panel_x + 170, self.panel_y + 60))
         except Exception:
             pass
         
@@ -512,7 +526,7 @@ class ShopOverlay:
             item_rect = pg.Rect(list_x + 5, item_y + 2, list_width - 10, item_height - 5)
             if banner_img:
                 try:
-                    scaled_banner = pg.transform.scale(banner_img, (item_rect.width, item_rect.height))
+                    scaled_banner = resource_manager.get_image("UI/raw/UI_Flat_Banner03a.png", (item_rect.width, item_rect.height))
                     screen.blit(scaled_banner, (item_rect.x, item_rect.y))
                 except Exception:
                     # Fallback to solid color
@@ -528,8 +542,7 @@ class ShopOverlay:
                 # Thumbnail
                 if item.get("sprite_path"):
                     try:
-                        sprite_img = resource_manager.get_image(item["sprite_path"])
-                        sprite_img = pg.transform.scale(sprite_img, (40, 40))
+                        sprite_img = resource_manager.get_image(item["sprite_path"], self.ITEM_ICON_SIZE)
                         screen.blit(sprite_img, (list_x + 35, item_y + 7))
                     except Exception:
                         pass
@@ -574,8 +587,7 @@ class ShopOverlay:
                 # Draw Pokemon thumbnail if available
                 if item.get("sprite_path"):
                     try:
-                        sprite_img = resource_manager.get_image(item["sprite_path"])
-                        sprite_img = pg.transform.scale(sprite_img, (50, 50))
+                        sprite_img = resource_manager.get_image(item["sprite_path"], (50, 50))
                         screen.blit(sprite_img, (list_x + 15, item_y + 15))
                     except Exception:
                         pass
@@ -3,9 +3,22 @@ import random
 from src.scenes.scene import Scene
 from src.core.services import scene_manager, resource_manager
 from src.interface.components import Button
-from src.utils import Logger, GameSettings
+from src.utils import Logger, GameSettings, AssetBundle
 
 class WildEncounterScene(Scene):
+    # Sizes shared by the bundle below and the drawing code (scaled variants are cached per size)
+    PANEL_SIZE = (500, 300)
+    BUTTON_SIZE = (160, 44)
+    SPRITE_SIZE = (120, 120)
+    ASSETS = AssetBundle(
+        scaled=(
+            ("UI/raw/UI_Flat_Frame03a.png", PANEL_SIZE),
+            ("UI/raw/UI_Flat_Button02a_1.png", BUTTON_SIZE), ("UI/raw/UI_Flat_Button02a_2.png", BUTTON_SIZE),
+            ("menu_sprites/menusprite7.png", SPRITE_SIZE), ("menu_sprites/menusprite8.png", SPRITE_SIZE),
+            ("menu_sprites/menusprite9.png", SPRITE_SIZE), ("menu_sprites/menusprite10.png", SPRITE_SIZE),
+        ),
+    )
+
     def __init__(self):
         super().__init__()
         self.wild = None
@@ -25,9 +38,9 @@ class WildEncounterScene(Scene):
         ]
         self.wild = random.choice(candidates)
         # Create catch button
-        bx = GameSettings.SCREEN_WIDTH // 2 - 80
+        bx = GameSettings.SCREEN_WIDTH // 2 - self.BUTTON_SIZE[0] // 2
         by = GameSettings.SCREEN_HEIGHT - 140
-        self.catch_button = Button("UI/raw/UI_Flat_Button02a_1.png", "UI/raw/UI_Flat_Button02a_2.png", bx, by, 160, 44, on_click=self._catch)
+        self.catch_button = Button("UI/raw/UI_Flat_Button02a_1.png", "UI/raw/UI_Flat_Button02a_2.png", bx, by, *self.BUTTON_SIZE, on_click=self._catch)
 
     def _catch(self):
         gm = getattr(scene_manager, "wild_source_gm", None)
@@ -62,16 +75,14 @@ class WildEncounterScene(Scene):
         dark.fill((0,0,0,180))
         screen.blit(dark, (0,0))
         # Draw a simple centered panel
+        panel_w, panel_h = self.PANEL_SIZE
+        px = GameSettings.SCREEN_WIDTH // 2 - panel_w // 2
+        py = GameSettings.SCREEN_HEIGHT // 2 - panel_h // 2
         try:
-            panel = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-            panel = pg.transform.scale(panel, (500, 300))
-            px = GameSettings.SCREEN_WIDTH // 2 - 250
-            py = GameSettings.SCREEN_HEIGHT // 2 - 150
+            panel = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png", self.PANEL_SIZE)
             screen.blit(panel, (px, py))
         except Exception:
-            px = GameSettings.SCREEN_WIDTH // 2 - 250
-            py = GameSettings.SCREEN_HEIGHT // 2 - 150
-            pg.draw.rect(screen, (240,240,240), (px, py, 500, 300))
+            pg.draw.rect(screen, (240,240,240), (px, py, panel_w, panel_h))
 
         # Show wild pokemon name and level
         if self.wild:
@@ -82,12 +93,11 @@ class WildEncounterScene(Scene):
             # Show sprite if available
             sp = None
             try:
-                sp = resource_manager.get_image(self.wild.get("sprite_path", ""))
+                sp = resource_manager.get_image(self.wild.get("sprite_path", ""), self.SPRITE_SIZE)
             except Exception:
                 sp = None
             if sp:
-                ss = pg.transform.scale(sp, (120, 120))
-                screen.blit(ss, (px + 20, py + 60))
+                screen.blit(sp, (px + 20, py + 60))
             # HP bar
             hp = self.wild.get("hp", 0)
             maxhp = self.wild.get("max_hp", hp)
@@ -0,0 +1,66 @@
+import pygame as pg
+from types import MappingProxyType
+from typing import Mapping
+
+from src.core.services import resource_manager
+from src.utils import Logger
+
+# (sheet path, row names, keyframes per row, frame size in pixels)
+FrameKey = tuple[str, tuple[str, ...], int, tuple[int, int]]
+Frames = Mapping[str, tuple[pg.Surface, ...]]
+
+class FrameCache:
+    """
+    Sliced and scaled animation frames shared by every Animation that uses
+    the same sprite sheet, row layout and size. A sheet is cut and scaled
+    once per run; later Animations get the same read-only row -> frames
+    mapping and only keep their own playback state.
+    """
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._frames: dict[FrameKey, Frames] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key: FrameKey) -> bool:
+        return key in self._frames
+
+    def get(self, image_path: str, rows: list[str], n_keyframes: int, size: tuple[int, int]) -> Frames:
+        """Return the frames of every row of the sheet, slicing and scaling it on the first request."""
+        key = (image_path, tuple(rows), n_keyframes, (int(size[0]), int(size[1])))
+        frames = self._frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+        self.misses += 1
+
+        if (len(rows) <= 0 or n_keyframes <= 0):
+            Logger.error("Invalid number of rows")
+
+        sheet = resource_manager.get_image(image_path)
+        sheet_w, sheet_h = sheet.get_size()
+        frame_w = sheet_w // n_keyframes
+        frame_h = sheet_h // len(rows)
+
+        animations: dict[str, tuple[pg.Surface, ...]] = {}
+        for r, name in enumerate(rows):
+            animations[name] = tuple(
+                pg.transform.smoothscale(sheet.subsurface(pg.Rect(
+                    c * frame_w, r * frame_h,
+                    frame_w, frame_h
+                )), key[3])
+                for c in range(n_keyframes)
+            )
+        frames = MappingProxyType(animations)
+        self._frames[key] = frames
+        return frames
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+frame_cache = FrameCache()
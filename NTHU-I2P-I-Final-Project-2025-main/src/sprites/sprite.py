@@ -6,11 +6,12 @@ from typing import Optional
 class Sprite:
     image: pg.Surface
     rect: pg.Rect
+    path: str
     
     def __init__(self, img_path: str, size: tuple[int, int] | None = None):
-        self.image = resource_manager.get_image(img_path)
-        if size is not None:
-            self.image = pg.transform.scale(self.image, size)
+        # Scaled images are shared through resource_manager, so never draw onto self.image
+        self.path = img_path
+        self.image = resource_manager.get_image(img_path, size)
         self.rect = self.image.get_rect()
         
     def update(self, dt: float):
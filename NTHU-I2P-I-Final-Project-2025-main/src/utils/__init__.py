@@ -3,7 +3,8 @@
 from .logger import Logger
 from .settings import GameSettings
 from .loader import load_tmx, load_img, load_font, load_sound
-from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport
+from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport, AssetBundle
+from .asset_manifest import AssetManifest, asset_manifest
 
 __all__ = [
     "Logger",
@@ -18,4 +19,7 @@ __all__ = [
     "MouseBtn",
     "Key",
     "Teleport",
+    "AssetBundle",
+    "AssetManifest",
+    "asset_manifest",
 ]
\ No newline at end of file
@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+
+from .loader import ASSETS_DIR
+from .logger import Logger
+
+class AssetManifest:
+    """
+    Every file under the assets directory, listed by one scan on first use.
+    Asking whether an asset exists is then a set lookup instead of a
+    filesystem hit (or a failed load raising an exception).
+    Paths are relative to the assets directory with '/' separators, e.g.
+    "images/sprites/sprite1.png". They are compared with the platform's
+    case rules (case-insensitive on Windows), like opening the file would.
+    If the assets directory cannot be found, every path is reported as
+    existing so loading behaves (and fails) as it would without a manifest.
+    """
+    root: Path
+
+    def __init__(self, root: Path = ASSETS_DIR) -> None:
+        self.root = root
+        self._files: set[str] | None = None
+        self._disabled = False
+
+    def __len__(self) -> int:
+        return len(self._scan() or ())
+
+    def __contains__(self, path: str) -> bool:
+        files = self._scan()
+        return files is None or self._key(path) in files
+
+    def exists(self, folder: str, path: str) -> bool:
+        """Whether assets/<folder>/<path> exists, e.g. exists("images", "sprites/sprite1.png")."""
+        return f"{folder}/{path}" in self
+
+    def refresh(self) -> None:
+        """Forget the listing; the next lookup rescans (e.g. after assets were added at runtime)."""
+        self._files = None
+        self._disabled = False
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path)).replace(os.sep, "/")
+
+    def _scan(self) -> set[str] | None:
+        if self._files is None and not self._disabled:
+            if not self.root.is_dir():
+                Logger.warning(f"Asset manifest: {self.root} not found, existence checks disabled")
+                self._disabled = True
+                return None
+            files = set()
+            for dirpath, _, filenames in os.walk(self.root):
+                rel = os.path.relpath(dirpath, self.root)
+                for name in filenames:
+                    files.add(self._key(os.path.join(rel, name)))
+            self._files = files
+            Logger.info(f"Asset manifest: {len(files)} files under {self.root}")
+        return self._files
+
+asset_manifest = AssetManifest()
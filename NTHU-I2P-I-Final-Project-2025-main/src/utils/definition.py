@@ -40,6 +40,26 @@ class PositionCamera:
     def transform_rect(self, rect: Rect) -> Rect:
         return Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
 
+@dataclass(frozen=True)
+class AssetBundle:
+    """
+    Assets a scene (or overlay) needs while it is shown. SceneManager has the
+    resource manager acquire the bundle before the scene enters (loading and
+    pinning everything) and release it after the scene exits, leaving what
+    no other bundle still holds to the memory budget's LRU eviction.
+    """
+    images: tuple[str, ...] = ()
+    # Scaled variants drawn every frame: (image path, size)
+    scaled: tuple[tuple[str, tuple[int, int]], ...] = ()
+    sounds: tuple[str, ...] = ()
+
+    def __add__(self, other: "AssetBundle") -> "AssetBundle":
+        return AssetBundle(self.images + other.images, self.scaled + other.scaled, self.sounds + other.sounds)
+
+    def paths(self) -> list[str]:
+        """Every asset path, once per entry (so pins and unpins pair up)."""
+        return list(self.images) + [path for path, _ in self.scaled] + list(self.sounds)
+
 @dataclass
 class Teleport:
     pos: Position
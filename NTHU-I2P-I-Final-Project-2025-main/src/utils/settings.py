@@ -10,6 +10,23 @@ class Settings:
     DEBUG: bool = True          # Debug mode
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = True  # Draw hitboxes for debugging
+    # Map rendering
+    MAP_CHUNK_TILES: int = 8    # Width/height of one baked map chunk in tiles
+    MAP_CHUNK_BUDGET_MB: int = 64   # Memory budget for baked map chunks (all maps)
+    MAP_CHUNK_PREFETCH: int = 1     # Ring of chunks around the viewport baked ahead of time
+    MAP_CACHE_DIR: str = "cache/maps"   # On-disk cache of baked maps ("" disables it)
+    MAX_RESIDENT_MAPS: int = 3  # Maps kept loaded at once, current map included (the hub map plus its 2 nearest exits)
+    SPATIAL_CELL_TILES: int = 4  # Cell size of the per-map entity spatial index in tiles
+    SCALED_IMAGE_CACHE_SIZE: int = 256  # Scaled image variants kept by the resource manager
+    RESOURCE_BUDGET_MB: int = 96    # Memory budget for cached images, scaled variants and sounds
+    # Navigation
+    NAV_SEARCH_NODES_PER_FRAME: int = 2000  # Max path search nodes expanded per frame
+    NAV_SEARCH_BUDGET_US: int = 1000        # Max path search time per frame in microseconds
+    NAV_SEARCH_MODE: str = "astar"          # Path search: "astar" or "jps" (jump point search, same path lengths)
+    NAV_CLUSTER_TILES: int = 16             # HPA* cluster size in tiles
+    NAV_HPA_MIN_TILES: int = 128 * 128      # Maps at least this large use HPA* for long searches
+    NAV_PATH_CACHE_SIZE: int = 64           # Finished navigation paths kept for reuse
+    NAV_FIELD_CACHE_SIZE: int = 32          # Distance fields to teleporters and destinations kept for navigation
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5   # Volume of audio
@@ -0,0 +1,81 @@
+import unittest
+
+from src.maps.hierarchical import ClusterGraph, ClusterSearch
+from src.maps.pathfinding import create_search
+
+SIZE = 32
+CLUSTER = 16
+
+def open_grid(*blocked: tuple[int, int]) -> bytearray:
+    grid = bytearray([1]) * (SIZE * SIZE)
+    for x, y in blocked:
+        grid[y * SIZE + x] = 0
+    return grid
+
+def astar_length(grid: bytearray, start: tuple[int, int], goal: tuple[int, int]) -> int:
+    search = create_search("astar", grid, SIZE, SIZE, start, goal)
+    search.step()
+    return len(search.path)
+
+class ClusterGraphUnwalkableStartTest(unittest.TestCase):
+    def assert_walks(self, grid: bytearray, start: tuple[int, int], path: list[tuple[int, int]],
+                     goal: tuple[int, int]) -> None:
+        self.assertTrue(path)
+        self.assertEqual(path[-1], goal)
+        x, y = start
+        for nx, ny in path:
+            self.assertEqual(abs(nx - x) + abs(ny - y), 1)
+            self.assertTrue(grid[ny * SIZE + nx])
+            x, y = nx, ny
+
+    def test_goal_is_transition_in_start_cluster(self):
+        # Standing in a bush; the goal is a transition tile of the same cluster
+        start, goal = (3, 3), (15, 15)
+        grid = open_grid(start)
+        graph = ClusterGraph(grid, SIZE, SIZE, CLUSTER)
+        self.assertIn(goal[1] * SIZE + goal[0], graph._intra[0])
+        path = graph.find_path(start, goal)
+        self.assert_walks(grid, start, path, goal)
+        self.assertEqual(len(path), astar_length(grid, start, goal))
+
+    def test_goal_in_start_cluster(self):
+        start, goal = (3, 3), (8, 10)
+        grid = open_grid(start)
+        path = ClusterGraph(grid, SIZE, SIZE, CLUSTER).find_path(start, goal)
+        self.assert_walks(grid, start, path, goal)
+        self.assertEqual(len(path), astar_length(grid, start, goal))
+
+    def test_only_way_out_crosses_cluster_edge(self):
+        # The start sits on the top row of its cluster, walled in on every
+        # side but the one facing the cluster above
+        start, goal = (5, 16), (20, 25)
+        grid = open_grid(start, (4, 16), (6, 16), (5, 17))
+        path = ClusterGraph(grid, SIZE, SIZE, CLUSTER).find_path(start, goal)
+        self.assert_walks(grid, start, path, goal)
+        self.assertEqual(path[0], (5, 15))
+
+class ClusterSearchTest(unittest.TestCase):
+    def test_sliced_search_matches_find_path(self):
+        grid = open_grid(*((16, y) for y in range(SIZE - 2)))
+        graph = ClusterGraph(grid, SIZE, SIZE, CLUSTER)
+        search = ClusterSearch(graph, (2, 2), (29, 3))
+        steps = 0
+        while not search.step(1):
+            steps += 1
+        self.assertGreater(steps, 1)
+        self.assertEqual(search.path, graph.find_path((2, 2), (29, 3)))
+
+    def test_refresh_mid_search_restarts(self):
+        grid = open_grid(*((16, y) for y in range(SIZE - 2)))
+        graph = ClusterGraph(grid, SIZE, SIZE, CLUSTER)
+        search = ClusterSearch(graph, (2, 2), (29, 3))
+        search.step(1)
+        # Open a gap in the wall near the top so the route no longer goes round its end
+        grid[2 * SIZE + 16] = 1
+        graph.refresh([(16, 2)])
+        search.step()
+        self.assertEqual(search.path, graph.find_path((2, 2), (29, 3)))
+        self.assertIn((16, 2), search.path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.maps.map import Map
+from src.utils import Position
+
+class MapLayerIndexTest(unittest.TestCase):
+    def test_has_tile_by_layer_name(self):
+        m = Map("map.tmx", [], Position(0, 0))
+        bushes = [(x, y) for y in range(m.height) for x in range(m.width) if m.has_tile("PokemonBush", x, y)]
+        self.assertTrue(bushes)
+        self.assertTrue(all(m.is_bush_tile(x, y) for x, y in bushes))
+        self.assertTrue(m.has_tile("Floor", 0, 0))
+        self.assertFalse(m.has_tile("NoSuchLayer", 0, 0))
+        self.assertFalse(m.has_tile("Floor", -1, 0))
+
+if __name__ == "__main__":
+    unittest.main()
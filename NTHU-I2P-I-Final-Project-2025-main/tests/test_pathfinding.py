@@ -0,0 +1,42 @@
+import unittest
+
+from src.maps.pathfinding import JumpPointSearch, PathSearch
+
+SIZE = 64
+
+class JumpPointSearchSliceTest(unittest.TestCase):
+    def test_vertical_jump_resumes_across_steps(self):
+        # On an open map the first vertical jump scans every row to the goal's
+        grid = bytearray([1]) * (SIZE * SIZE)
+        search = JumpPointSearch(grid, SIZE, SIZE, (0, 0), (SIZE - 1, SIZE - 1))
+        search.step(SIZE)
+        self.assertFalse(search.done)
+        # Rows scanned so far are not scanned again
+        self.assertEqual(search._expanding[0], 0)
+        self.assertLess(search._expanding[2], SIZE // 2)
+        steps = 1
+        while not search.step(SIZE):
+            steps += 1
+        self.assertGreater(steps, SIZE // 4)
+
+        whole = JumpPointSearch(grid, SIZE, SIZE, (0, 0), (SIZE - 1, SIZE - 1))
+        whole.step()
+        self.assertEqual(search.path, whole.path)
+
+    def test_sliced_lengths_match_astar(self):
+        grid = bytearray([1]) * (SIZE * SIZE)
+        for y in range(2, SIZE, 4):
+            gap = (y * 7) % SIZE
+            for x in range(SIZE):
+                if x != gap:
+                    grid[y * SIZE + x] = 0
+        astar = PathSearch(grid, SIZE, SIZE, (0, 0), (5, SIZE - 1))
+        astar.step()
+        search = JumpPointSearch(grid, SIZE, SIZE, (0, 0), (5, SIZE - 1))
+        while not search.step(3):
+            pass
+        self.assertTrue(search.path)
+        self.assertEqual(len(search.path), len(astar.path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import unittest
+from collections import deque
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.maps.lazy_map import LazyMap
+from src.maps.route_planner import RoutePlanner
+from src.utils import Position
+
+MAP = "gym.tmx"
+
+def bfs_distance(grid: bytearray, w: int, h: int, start: tuple[int, int], goal: tuple[int, int]) -> int | None:
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return dist[goal]
+        for n in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= n[0] < w and 0 <= n[1] < h and grid[n[1] * w + n[0]] and n not in dist:
+                dist[n] = dist[(x, y)] + 1
+                queue.append(n)
+    return None
+
+class RoutePlannerCollisionTest(unittest.TestCase):
+    def setUp(self):
+        self.map = LazyMap(MAP, [], Position(0, 0))
+        self.planner = RoutePlanner({MAP: self.map})
+        grid, w, _ = self.planner._walkable(MAP)
+        walkable = [(i % w, i // w) for i, open_tile in enumerate(grid) if open_tile]
+        # The walkable tile furthest from the first one, so the route has several steps
+        self.start = walkable[0]
+        self.goal = max(walkable, key=lambda t: self.planner.distance(MAP, self.start, t) or -1)
+
+    def expected_distance(self) -> int | None:
+        loaded = self.map.load()
+        return bfs_distance(loaded.walkable_grid, loaded.width, loaded.height, self.start, self.goal)
+
+    def test_blocked_tile_on_route_changes_plan(self):
+        before = self.planner.distance(MAP, self.start, self.goal)
+        self.assertEqual(self.planner.plan(MAP, self.start, MAP, self.goal)[-1].goal, self.goal)
+        step = self.planner.next_step(MAP, self.start, self.goal)
+        self.assertIsNotNone(step)
+
+        self.map.load().set_collision(*step, True)
+        self.assertNotEqual(self.planner.next_step(MAP, self.start, self.goal), step)
+        self.assertNotIn(step, self.planner.next_run(MAP, self.start, self.goal))
+        self.assertEqual(self.planner.distance(MAP, self.start, self.goal), self.expected_distance())
+
+        self.map.load().set_collision(*step, False)
+        self.assertEqual(self.planner.next_step(MAP, self.start, self.goal), step)
+        self.assertEqual(self.planner.distance(MAP, self.start, self.goal), before)
+
+    def test_reload_drops_collision_edits(self):
+        step = self.planner.next_step(MAP, self.start, self.goal)
+        self.map.load().set_collision(*step, True)
+        self.assertNotEqual(self.planner.next_step(MAP, self.start, self.goal), step)
+        # A reloaded map is the map as baked again
+        self.map.unload()
+        self.map.load()
+        self.assertEqual(self.planner.next_step(MAP, self.start, self.goal), step)
+
+if __name__ == "__main__":
+    unittest.main()